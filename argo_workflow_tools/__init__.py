@@ -1,9 +1,83 @@
-from .argo_client import ArgoClient
-from .argo_options import ArgoOptions
-from .dsl import CronWorkflow, Workflow, WorkflowTemplate
-import argo_workflow_tools.dsl.dsl_decorators as dsl
-from .dsl.condition import Condition
-from .exceptions.workflow_not_found_exception import WorkflowNotFoundException
-from .workflow_result import WorkflowResult
-from .workflow_status import WorkflowStatus
-from .merge_result import merge_conditional_results
\ No newline at end of file
+"""
+names are imported lazily on first access (PEP 562), so submitting workflows does not pay for
+importing the DSL and the generated argo and kubernetes models
+"""
+import importlib
+from typing import TYPE_CHECKING
+
+# the DSL package is light once imported. importing it here, once, binds it as the `dsl` attribute
+# of this module; dropping that binding lets `dsl` resolve lazily to the decorators module below,
+# and later imports of the package don't rebind it
+importlib.import_module("argo_workflow_tools.dsl")
+globals().pop("dsl", None)
+
+_LAZY_ATTRIBUTES = {
+    "ArgoClient": (".argo_client", "ArgoClient"),
+    "SubmitRequest": (".argo_client", "SubmitRequest"),
+    "ArgoOptions": (".argo_options", "ArgoOptions"),
+    "AsyncArgoClient": (".async_argo_client", "AsyncArgoClient"),
+    "CronWorkflow": (".dsl.workflow", "CronWorkflow"),
+    "Workflow": (".dsl.workflow", "Workflow"),
+    "WorkflowTemplate": (".dsl.workflow", "WorkflowTemplate"),
+    "dsl": (".dsl.dsl_decorators", None),
+    "Condition": (".dsl.condition", "Condition"),
+    "WorkflowNotFoundException": (
+        ".exceptions.workflow_not_found_exception",
+        "WorkflowNotFoundException",
+    ),
+    "WorkflowTimeoutException": (
+        ".exceptions.workflow_timeout_exception",
+        "WorkflowTimeoutException",
+    ),
+    "TemplateSyncResult": (".template_sync", "TemplateSyncResult"),
+    "WorkflowResult": (".workflow_result", "WorkflowResult"),
+    "WorkflowStatus": (".workflow_status", "WorkflowStatus"),
+    "WorkflowStatusTracker": (".workflow_status_tracker", "WorkflowStatusTracker"),
+    "merge_conditional_results": (".merge_result", "merge_conditional_results"),
+    "ExponentialBackoffPollingStrategy": (
+        ".polling_strategy",
+        "ExponentialBackoffPollingStrategy",
+    ),
+    "FixedPollingStrategy": (".polling_strategy", "FixedPollingStrategy"),
+    "PhaseAwarePollingStrategy": (".polling_strategy", "PhaseAwarePollingStrategy"),
+    "PollingStrategy": (".polling_strategy", "PollingStrategy"),
+}
+
+__all__ = sorted(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    module = importlib.import_module(module_name, __name__)
+    value = module if attribute is None else getattr(module, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+if TYPE_CHECKING:
+    from argo_workflow_tools.dsl import dsl_decorators as dsl  # noqa: F401
+
+    from argo_workflow_tools.argo_client import ArgoClient, SubmitRequest  # noqa: F401
+    from argo_workflow_tools.argo_options import ArgoOptions  # noqa: F401
+    from argo_workflow_tools.async_argo_client import AsyncArgoClient  # noqa: F401
+    from argo_workflow_tools.dsl.condition import Condition  # noqa: F401
+    from argo_workflow_tools.dsl.workflow import CronWorkflow, Workflow, WorkflowTemplate  # noqa: F401
+    from argo_workflow_tools.exceptions.workflow_not_found_exception import WorkflowNotFoundException  # noqa: F401
+    from argo_workflow_tools.exceptions.workflow_timeout_exception import WorkflowTimeoutException  # noqa: F401
+    from argo_workflow_tools.merge_result import merge_conditional_results  # noqa: F401
+    from argo_workflow_tools.polling_strategy import (  # noqa: F401
+        ExponentialBackoffPollingStrategy,
+        FixedPollingStrategy,
+        PhaseAwarePollingStrategy,
+        PollingStrategy,
+    )
+    from argo_workflow_tools.template_sync import TemplateSyncResult  # noqa: F401
+    from argo_workflow_tools.workflow_result import WorkflowResult  # noqa: F401
+    from argo_workflow_tools.workflow_status import WorkflowStatus  # noqa: F401
+    from argo_workflow_tools.workflow_status_tracker import WorkflowStatusTracker  # noqa: F401
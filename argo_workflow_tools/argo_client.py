@@ -1,6 +1,7 @@
 import contextlib
 import json
-from typing import Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
 
 from pydantic import BaseModel
 
@@ -11,13 +12,23 @@ from argo_workflow_tools.argo_http_client import (
     SubmitOptions,
 )
 from argo_workflow_tools.argo_options import ArgoOptions
-import argo_workflow_tools.dsl.building_mode_context as building_mode_context
+from argo_workflow_tools.dsl import building_mode_context
 from argo_workflow_tools.exceptions.workflow_not_found_exception import (
     WorkflowNotFoundException,
 )
+from argo_workflow_tools.template_sync import (
+    CREATED,
+    UNCHANGED,
+    UPDATED,
+    TemplateSyncResult,
+    compile_manifests,
+    diff_templates,
+    index_templates,
+)
 from argo_workflow_tools.workflow_result import WorkflowResult
 from argo_workflow_tools.workflow_status import WorkflowStatus
 from argo_workflow_tools.workflow_status_checker import WorkflowStatusChecker
+from argo_workflow_tools.workflow_status_tracker import WorkflowStatusTracker
 
 
 def _log_workflow_web_page_link(
@@ -36,6 +47,38 @@ def _parse_parameter(val: any) -> str:
         return json.dumps(val)
     return val
 
+
+def _build_submit_request_body(
+        template_name: str,
+        params: Dict[str, any],
+        namespace: str,
+        annotations: Dict[str, str],
+        labels: Dict[str, str],
+) -> ArgoSubmitRequestBody:
+    parameters = [f"{key}={_parse_parameter(val)}" for key, val in (params or {}).items()]
+    annotations = [f"{key}={val}" for key, val in (annotations or {}).items()]
+    labels = [f"{key}={val}" for key, val in (labels or {}).items()]
+    labels.append("submit-from-api=true")
+    sep = ','
+
+    return ArgoSubmitRequestBody(
+        namespace=namespace,
+        resourceKind="WorkflowTemplate",
+        resourceName=template_name,
+        submitOptions=SubmitOptions(
+            parameters=parameters, labels=sep.join(labels), annotations=sep.join(annotations)
+        ),
+    )
+
+
+class SubmitRequest(NamedTuple):
+    """a single workflow submission for ArgoClient.submit_many"""
+
+    template_name: str
+    params: Dict[str, any] = None
+    labels: Dict[str, str] = None
+
+
 class ArgoClient:
     """Client to run an manage argo workflows"""
 
@@ -70,21 +113,126 @@ class ArgoClient:
         if namespace is None:
             namespace = self._options.namespace
 
-        parameters = [f"{key}={_parse_parameter(val)}" for key, val in params.items()]
-        annotations = [f"{key}={val}" for key, val in annotations.items()]
-        labels = [f"{key}={val}" for key, val in labels.items()]
-        labels.append("submit-from-api=true")
-        sep = ','
+        body = _build_submit_request_body(
+            template_name, params, namespace, annotations, labels
+        )
+        return self._submit_workflow(namespace, body, wait)
+
+    def submit_many(
+            self,
+            requests: Iterable[Union[SubmitRequest, Tuple]],
+            max_in_flight: int = None,
+            namespace: str = None,
+    ) -> List[Union[WorkflowResult, Exception]]:
+        """submits many workflows concurrently over the client's shared connection pool
+
+        Args:
+            requests (Iterable[Union[SubmitRequest, Tuple]]): SubmitRequest or (template_name, params, labels) tuples
+            max_in_flight (int, optional): maximum number of concurrent submissions. Defaults to ArgoOptions.pool_size.
+            namespace (str, optional): override the namespace to run the workflows. Defaults to None.
 
-        body = ArgoSubmitRequestBody(
+        Returns:
+            List[Union[WorkflowResult, Exception]]: workflow status references in input order,
+            a failed submission is reported by the exception it raised in its place
+            (e.g. WorkflowNotFoundException), without aborting the rest of the batch
+        """
+        if max_in_flight is None:
+            max_in_flight = self._options.pool_size
+
+        with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+            futures = [
+                executor.submit(self._submit_request, request, namespace)
+                for request in requests
+            ]
+        return [future.exception() or future.result() for future in futures]
+
+    def _submit_request(self, request: Union[SubmitRequest, Tuple], namespace: str) -> WorkflowResult:
+        # built here so a malformed request is reported in its own place
+        request = SubmitRequest(*request)
+        return self.submit(
+            request.template_name,
+            params=request.params,
             namespace=namespace,
-            resourceKind="WorkflowTemplate",
-            resourceName=template_name,
-            submitOptions=SubmitOptions(
-                parameters=parameters, labels=sep.join(labels), annotations=sep.join(annotations)
-            ),
+            labels=request.labels,
         )
-        return self._submit_workflow(namespace, body, wait)
+
+    def sync_templates(
+            self,
+            templates: Iterable[Any],
+            namespace: str = None,
+            max_in_flight: int = None,
+            dry_run: bool = False,
+            embed_workflow_templates: bool = False,
+            compile_workers: int = 1,
+    ) -> List[Union[TemplateSyncResult, Exception]]:
+        """deploys workflow templates, creating or updating only the ones that differ from the deployed versions.
+        the deployed templates are fetched with a single list request per namespace, changes are applied
+        concurrently over the client's shared connection pool
+
+        Args:
+            templates (Iterable[Any]): functions decorated by the WorkflowTemplate decorator, dsl WorkflowTemplate objects, argo WorkflowTemplate models or manifest dictionaries
+            namespace (str, optional): namespace of templates that don't set one. Defaults to ArgoOptions.namespace.
+            max_in_flight (int, optional): maximum number of concurrent create and update requests. Defaults to ArgoOptions.pool_size.
+            dry_run (bool, optional): only compute the changes, without applying them. Defaults to False.
+            embed_workflow_templates (bool, optional): compile referenced workflow templates inline instead of using templateRefs. Defaults to False.
+            compile_workers (int, optional): number of processes compiling decorated functions. Defaults to 1.
+
+        Returns:
+            List[Union[TemplateSyncResult, Exception]]: the action taken for every template in input order,
+            a failed create or update is reported by the exception it raised in its place
+        """
+        if max_in_flight is None:
+            max_in_flight = self._options.pool_size
+        if namespace is None:
+            namespace = self._options.namespace
+
+        manifests = compile_manifests(templates, embed_workflow_templates, compile_workers)
+        namespaces = [
+            (manifest.get("metadata") or {}).get("namespace") or namespace
+            for manifest in manifests
+        ]
+        deployed = {
+            template_namespace: index_templates(
+                self._argo_http_client.list_workflow_templates(template_namespace)
+            )
+            for template_namespace in sorted(set(namespaces))
+        }
+
+        with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+            futures = [
+                executor.submit(
+                    self._sync_template,
+                    manifest,
+                    template_namespace,
+                    deployed[template_namespace].get(manifest["metadata"]["name"]),
+                    dry_run,
+                )
+                for manifest, template_namespace in zip(manifests, namespaces)
+            ]
+        return [future.exception() or future.result() for future in futures]
+
+    def _sync_template(
+            self, manifest: dict, namespace: str, deployed: Optional[dict], dry_run: bool
+    ) -> TemplateSyncResult:
+        name = manifest["metadata"]["name"]
+        if deployed is None:
+            if not dry_run:
+                self._argo_http_client.create_workflow_template(namespace, manifest)
+            return TemplateSyncResult(name, namespace, CREATED, [])
+
+        changes = diff_templates(manifest, deployed)
+        if not changes:
+            return TemplateSyncResult(name, namespace, UNCHANGED, [])
+        if not dry_run:
+            # updates are rejected unless they name the version they replace
+            metadata = {
+                **manifest["metadata"],
+                "resourceVersion": deployed["metadata"].get("resourceVersion"),
+            }
+            self._argo_http_client.update_workflow_template(
+                namespace, name, {**manifest, "metadata": metadata}
+            )
+        return TemplateSyncResult(name, namespace, UPDATED, changes)
 
     def create(
             self, workflow: Dict[str, any], namespace: str = None, wait: bool = False
@@ -127,7 +275,10 @@ class ArgoClient:
             )
 
             workflow_status_checker = WorkflowStatusChecker(
-                self._argo_http_client, namespace, workflow_name
+                self._argo_http_client,
+                namespace,
+                workflow_name,
+                polling_strategy=self._options.polling_strategy,
             )
             workflow_status_checker.sync()
             if not wait:
@@ -171,7 +322,10 @@ class ArgoClient:
             )
 
             workflow_status_checker = WorkflowStatusChecker(
-                self._argo_http_client, namespace, workflow_name
+                self._argo_http_client,
+                namespace,
+                workflow_name,
+                polling_strategy=self._options.polling_strategy,
             )
             workflow_status_checker.sync()
             if not wait:
@@ -192,6 +346,25 @@ class ArgoClient:
         except ArgoApiException:
             raise
 
+    def status_tracker(self) -> WorkflowStatusTracker:
+        """
+        creates a tracker that follows many workflows with a single list request per polling interval
+
+        Returns:
+            WorkflowStatusTracker: tracker sharing this client's connection pool
+        """
+        return WorkflowStatusTracker(
+            self._argo_http_client,
+            polling_strategy=self._options.polling_strategy,
+            logger=self._options.logger,
+        )
+
+    def close(self) -> None:
+        """
+        release the client's pooled connections to the argo server
+        """
+        self._argo_http_client.close()
+
     @contextlib.contextmanager
     def run_workflow(self):
         token = building_mode_context.dag_submit_mode.set(self)
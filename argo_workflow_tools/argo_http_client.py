@@ -1,5 +1,7 @@
+import contextlib
+import json
 from dataclasses import asdict, dataclass
-from typing import List
+from typing import BinaryIO, Iterator, List
 
 import requests
 from requests.adapters import HTTPAdapter
@@ -8,6 +10,9 @@ from urllib3 import Retry
 
 from argo_workflow_tools.argo_options import ArgoOptions
 
+RETRY_BACKOFF_FACTOR = 0.3
+RETRY_STATUS_CODES = [500, 502, 503, 504]
+
 
 class ArgoApiException(Exception):
     def __init__(self, status=None, reason=None, http_resp=None):
@@ -71,110 +76,211 @@ class HTTPArgoAuth(AuthBase):
 
 
 class ArgoHttpClient:
+    """
+    Argo server REST client.
+
+    All requests go through one long-lived ``requests.Session`` backed by a
+    thread-safe urllib3 connection pool, so TCP/TLS connections are kept alive
+    and shared between calls (and between threads using the same client).
+    Status retries are only applied to the verbs listed in
+    ``ArgoOptions.retry_methods``, non idempotent verbs are only retried on
+    connection errors, before the request reaches the server.
+    """
+
     def __init__(self, url, argo_options: ArgoOptions):
         self._argo_options = argo_options
         self._url = url
+        pool_adapter = HTTPAdapter(
+            pool_connections=argo_options.pool_size,
+            pool_maxsize=argo_options.pool_size,
+            max_retries=Retry(
+                total=argo_options.max_retries,
+                backoff_factor=RETRY_BACKOFF_FACTOR,
+                status_forcelist=RETRY_STATUS_CODES,
+                allowed_methods=frozenset(argo_options.retry_methods),
+                raise_on_status=True,
+            ),
+        )
+        # shares the connection pool of the retrying adapter, only the retry policy differs
+        no_retries_adapter = HTTPAdapter(max_retries=Retry(total=0, raise_on_status=False))
+        no_retries_adapter.poolmanager = pool_adapter.poolmanager
+        self._session = self._create_session(pool_adapter)
+        self._session_without_retries = self._create_session(no_retries_adapter)
+
+    @staticmethod
+    def _create_session(adapter: HTTPAdapter) -> requests.Session:
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def close(self) -> None:
+        """
+        release all pooled connections
+        """
+        self._session.close()
+        self._session_without_retries.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
 
     def _get_authorization(self):
         if self._argo_options.authorization_token:
             return HTTPArgoAuth(self._argo_options.authorization_token)
         return None
 
-    def submit_workflow(self, namespace, body: ArgoSubmitRequestBody):
-        response = requests.post(
-            f"{self._url}/api/v1/workflows/{namespace}/submit",
-            json=asdict(body),
-            auth=self._get_authorization(),
-        )
+    def _request(self, method: str, path: str, with_retries=True, **request_kwargs):
+        session = self._session if with_retries else self._session_without_retries
+        try:
+            return session.request(
+                method,
+                f"{self._url}{path}",
+                auth=self._get_authorization(),
+                **request_kwargs,
+            )
+        except requests.exceptions.RetryError as e:
+            raise ArgoApiException() from e
+
+    @staticmethod
+    def _raise_for_status(response, reason=None):
         if response.status_code != 200:
             raise ArgoApiException(
-                status=response.status_code, reason=response.reason, http_resp=response
+                status=response.status_code,
+                reason=reason if reason is not None else response.reason,
+                http_resp=response,
             )
+
+    def submit_workflow(self, namespace, body: ArgoSubmitRequestBody):
+        response = self._request(
+            "POST", f"/api/v1/workflows/{namespace}/submit", json=asdict(body)
+        )
+        self._raise_for_status(response)
         return response.json()
 
     def create_workflow(self, namespace, body: dict):
-        response = requests.post(
-            f"{self._url}/api/v1/workflows/{namespace}",
-            json={"workflow": body},
-            auth=self._get_authorization(),
+        response = self._request(
+            "POST", f"/api/v1/workflows/{namespace}", json={"workflow": body}
         )
-        if response.status_code != 200:
-            raise ArgoApiException(
-                status=response.status_code, reason=response.text, http_resp=response
-            )
+        self._raise_for_status(response, reason=response.text)
         return response.json()
 
-    def get_workflow(self, namespace, name, with_retries=False):
-        max_retries = 5 if with_retries else 0
+    def get_workflow(self, namespace, name, with_retries=False, fields: str = None):
+        response = self._request(
+            "GET",
+            f"/api/v1/workflows/{namespace}/{name}",
+            with_retries=with_retries,
+            params={"fields": fields} if fields else None,
+        )
+        self._raise_for_status(response)
+        return response.json()
+
+    @contextlib.contextmanager
+    def open_workflow_stream(self, namespace, name, with_retries=False) -> Iterator[BinaryIO]:
+        """
+        opens the workflow document as a raw response stream, for incremental parsing
+        """
+        response = self._request(
+            "GET",
+            f"/api/v1/workflows/{namespace}/{name}",
+            with_retries=with_retries,
+            stream=True,
+        )
         try:
-            response = self._get_with_retries(
-                f"{self._url}/api/v1/workflows/{namespace}/{name}",
-                max_retries,
-                auth=self._get_authorization()
-            )
-        except requests.exceptions.RetryError as e:
-            raise ArgoApiException() from e
+            self._raise_for_status(response)
+            response.raw.decode_content = True
+            yield response.raw
+        finally:
+            response.close()
 
-        if response.status_code != 200:
-            raise ArgoApiException(
-                status=response.status_code, reason=response.reason, http_resp=response
-            )
+    def list_workflows(self, namespace, label_selector: str = None, fields: str = None):
+        params = {}
+        if label_selector:
+            params["listOptions.labelSelector"] = label_selector
+        if fields:
+            params["fields"] = fields
+        response = self._request("GET", f"/api/v1/workflows/{namespace}", params=params)
+        self._raise_for_status(response)
         return response.json()
 
-    def workflow_resume(self, namespace, name):
-        response = requests.put(
-            f"{self._url}/api/v1/workflows/{namespace}/{name}/resume",
-            auth=self._get_authorization(),
+    def list_workflow_templates(self, namespace, fields: str = None):
+        response = self._request(
+            "GET",
+            f"/api/v1/workflow-templates/{namespace}",
+            params={"fields": fields} if fields else None,
         )
-        if response.status_code != 200:
-            raise ArgoApiException(
-                status=response.status_code, reason=response.reason, http_resp=response
-            )
+        self._raise_for_status(response)
         return response.json()
 
-    def workflow_retry(self, namespace, name):
-        response = requests.put(
-            f"{self._url}/api/v1/workflows/{namespace}/{name}/retry",
-            auth=self._get_authorization(),
+    def create_workflow_template(self, namespace, body: dict):
+        response = self._request(
+            "POST", f"/api/v1/workflow-templates/{namespace}", json={"template": body}
         )
-        if response.status_code != 200:
-            raise ArgoApiException(
-                status=response.status_code, reason=response.reason, http_resp=response
-            )
+        self._raise_for_status(response, reason=response.text)
         return response.json()
 
-    def workflow_stop(self, namespace, name):
-        response = requests.put(
-            f"{self._url}/api/v1/workflows/{namespace}/{name}/stop",
-            auth=self._get_authorization(),
+    def update_workflow_template(self, namespace, name, body: dict):
+        response = self._request(
+            "PUT", f"/api/v1/workflow-templates/{namespace}/{name}", json={"template": body}
         )
-        if response.status_code != 200:
-            raise ArgoApiException(
-                status=response.status_code, reason=response.reason, http_resp=response
-            )
+        self._raise_for_status(response, reason=response.text)
         return response.json()
 
-    def workflow_suspend(self, namespace, name):
-        response = requests.put(
-            f"{self._url}/api/v1/workflows/{namespace}/{name}/suspend",
-            auth=self._get_authorization(),
-        )
-        if response.status_code != 200:
-            raise ArgoApiException(
-                status=response.status_code, reason=response.reason, http_resp=response
+    def watch_workflow(
+        self, namespace, name, resource_version: str = None, fields: str = None, timeout=None
+    ) -> Iterator[dict]:
+        """
+        streams watch events of a single workflow, one dict per newline delimited json event.
+        the stream ends silently when the connection drops or a read times out, callers resume
+        it from the last resourceVersion they have seen, so the request is not retried.
+        """
+        params = {"listOptions.fieldSelector": f"metadata.name={name}"}
+        if resource_version:
+            params["listOptions.resourceVersion"] = resource_version
+        if fields:
+            params["fields"] = fields
+        try:
+            response = self._request(
+                "GET",
+                f"/api/v1/workflow-events/{namespace}",
+                with_retries=False,
+                params=params,
+                stream=True,
+                timeout=timeout,
             )
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            return
+        try:
+            self._raise_for_status(response)
+            for line in response.iter_lines():
+                if line:
+                    yield json.loads(line)
+        except (
+            requests.exceptions.ConnectionError,
+            requests.exceptions.ChunkedEncodingError,
+        ):
+            return
+        finally:
+            response.close()
+
+    def workflow_resume(self, namespace, name):
+        response = self._request("PUT", f"/api/v1/workflows/{namespace}/{name}/resume")
+        self._raise_for_status(response)
         return response.json()
 
-    @staticmethod
-    def _get_with_retries(url: str, max_retries_count: int, **request_kwargs):
-        http_adapter = HTTPAdapter(
-            max_retries=Retry(total=max_retries_count,
-                              backoff_factor=0.3,
-                              status_forcelist=[500, 502, 503, 504])
-        )
-        with requests.Session() as session:
-            session.mount('http://', http_adapter)
-            session.mount('https://', http_adapter)
+    def workflow_retry(self, namespace, name):
+        response = self._request("PUT", f"/api/v1/workflows/{namespace}/{name}/retry")
+        self._raise_for_status(response)
+        return response.json()
 
-            response = session.get(url, **request_kwargs)
-            return response
+    def workflow_stop(self, namespace, name):
+        response = self._request("PUT", f"/api/v1/workflows/{namespace}/{name}/stop")
+        self._raise_for_status(response)
+        return response.json()
+
+    def workflow_suspend(self, namespace, name):
+        response = self._request("PUT", f"/api/v1/workflows/{namespace}/{name}/suspend")
+        self._raise_for_status(response)
+        return response.json()
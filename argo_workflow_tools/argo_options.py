@@ -1,3 +1,8 @@
+from typing import Iterable
+
+from argo_workflow_tools.polling_strategy import FixedPollingStrategy, PollingStrategy
+
+
 class ArgoOptions:
     def __init__(
         self,
@@ -6,6 +11,10 @@ class ArgoOptions:
         namespace="argo",
         polling_interval: float = 1.0,
         authorization_token: str = None,
+        pool_size: int = 10,
+        max_retries: int = 5,
+        retry_methods: Iterable[str] = ("GET",),
+        polling_strategy: PollingStrategy = None,
     ):
         """[summary]
 
@@ -15,9 +24,17 @@ class ArgoOptions:
             namespace (str, optional): default namespace. Defaults to "argo".
             polling_interval (float, optional): workflows status polling interval when waiting for workflow to completes. Defaults to 1 second.
             authorization_token (str, optional): authorization token. Defaults to None.
+            pool_size (int, optional): maximum number of keep-alive connections kept open to the argo server. Defaults to 10.
+            max_retries (int, optional): number of retries for failed requests. Defaults to 5.
+            retry_methods (Iterable[str], optional): http verbs retried on server errors, other verbs are only retried on connection errors. Defaults to ("GET",).
+            polling_strategy (PollingStrategy, optional): decides the interval between status polls. Defaults to polling every polling_interval seconds.
         """
         self.client_side_validation = client_side_validation
         self.namespace = namespace
         self.logger = logger
         self.polling_interval = polling_interval
         self.authorization_token = authorization_token
+        self.pool_size = pool_size
+        self.max_retries = max_retries
+        self.retry_methods = retry_methods
+        self.polling_strategy = polling_strategy or FixedPollingStrategy(polling_interval)
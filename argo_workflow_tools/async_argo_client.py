@@ -0,0 +1,126 @@
+from typing import Dict
+
+from argo_workflow_tools.argo_client import (
+    _build_submit_request_body,
+    _log_workflow_web_page_link,
+)
+from argo_workflow_tools.argo_http_client import ArgoApiException
+from argo_workflow_tools.argo_options import ArgoOptions
+from argo_workflow_tools.async_argo_http_client import AsyncArgoHttpClient
+from argo_workflow_tools.async_workflow_result import AsyncWorkflowResult
+from argo_workflow_tools.async_workflow_status_checker import AsyncWorkflowStatusChecker
+from argo_workflow_tools.exceptions.workflow_not_found_exception import (
+    WorkflowNotFoundException,
+)
+from argo_workflow_tools.workflow_status import WorkflowStatus
+
+
+class AsyncArgoClient:
+    """asyncio client to run and manage argo workflows, many workflows can be submitted and
+    awaited concurrently from a single event loop"""
+
+    def __init__(self, argo_server_uri: str, options: ArgoOptions):
+        self._argo_server_uri = argo_server_uri
+        self._argo_http_client = AsyncArgoHttpClient(argo_server_uri, options)
+        self._options = options
+
+    async def close(self) -> None:
+        """
+        release the client's pooled connections to the argo server
+        """
+        await self._argo_http_client.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def submit(
+            self,
+            template_name: str,
+            params: Dict[str, any] = None,
+            namespace: str = None,
+            annotations={},
+            labels={},
+            wait: bool = False,
+    ) -> AsyncWorkflowResult:
+        """[summary]
+
+        Args:
+            template_name (str): template
+            params (Dict[str, any], optional): workflow parameters. Defaults to None.
+            namespace (str, optional): override the namespace to run the workflow. Defaults to None.
+            annotations (dict, optional): workflow annotations. Defaults to {}.
+            labels (dict, optional): workflow labels. Defaults to {}.
+            wait (bool, optional): wait for workflow to finish before returning. Defaults to False.
+
+        Returns:
+            AsyncWorkflowResult: workflow status reference
+        """
+        if namespace is None:
+            namespace = self._options.namespace
+
+        body = _build_submit_request_body(
+            template_name, params, namespace, annotations, labels
+        )
+        try:
+            created_workflow_response = await self._argo_http_client.submit_workflow(
+                namespace, body
+            )
+        except ArgoApiException as err:
+            if err.status == 404:
+                raise WorkflowNotFoundException(
+                    f"Resource {body.resourceName} does not exist on namespace {namespace}"
+                )
+            raise
+        return await self._track_workflow(namespace, created_workflow_response, wait)
+
+    async def create(
+            self, workflow: Dict[str, any], namespace: str = None, wait: bool = False
+    ) -> AsyncWorkflowResult:
+        """[summary]
+
+        Args:
+            workflow (dict[str, any]): workflow manifest object
+            namespace (str, optional): namespace to run the workflow in. Defaults to None.
+            wait (bool, optional): wait for workflow to finish before returning. Defaults to False.
+
+        Returns:
+            AsyncWorkflowResult: workflow status reference
+        """
+        if namespace is None:
+            namespace = self._options.namespace
+
+        created_workflow_response = await self._argo_http_client.create_workflow(
+            namespace, workflow
+        )
+        return await self._track_workflow(namespace, created_workflow_response, wait)
+
+    async def _track_workflow(
+            self, namespace: str, created_workflow_response: dict, wait: bool
+    ) -> AsyncWorkflowResult:
+        workflow_name = created_workflow_response["metadata"]["name"]
+        _log_workflow_web_page_link(
+            created_workflow_response["metadata"]["namespace"],
+            workflow_name,
+            self._argo_server_uri,
+            self._options.logger,
+        )
+
+        workflow_status_checker = AsyncWorkflowStatusChecker(
+            self._argo_http_client,
+            namespace,
+            workflow_name,
+            polling_strategy=self._options.polling_strategy,
+        )
+        await workflow_status_checker.sync()
+        if wait:
+            await workflow_status_checker.wait_for_completion()
+        return AsyncWorkflowResult(
+            workflow_name=workflow_name,
+            workflow_status=WorkflowStatus.value_of(
+                workflow_status_checker.current_phase
+            ),
+            workflow_status_checker=workflow_status_checker,
+        )
@@ -0,0 +1,130 @@
+import asyncio
+from dataclasses import asdict
+
+from argo_workflow_tools.argo_http_client import (
+    RETRY_BACKOFF_FACTOR,
+    RETRY_STATUS_CODES,
+    ArgoApiException,
+    ArgoSubmitRequestBody,
+)
+from argo_workflow_tools.argo_options import ArgoOptions
+
+
+class AsyncArgoHttpClient:
+    """
+    asyncio counterpart of ArgoHttpClient, built on an httpx.AsyncClient connection pool.
+    requires the optional `async` extra (httpx).
+    """
+
+    def __init__(self, url, argo_options: ArgoOptions):
+        try:
+            import httpx
+        except ImportError as e:
+            raise ImportError(
+                "AsyncArgoHttpClient requires httpx, "
+                "install it with `pip install argo-workflow-tools[async]`"
+            ) from e
+
+        self._argo_options = argo_options
+        self._url = url
+        self._retry_methods = {method.upper() for method in argo_options.retry_methods}
+        self._client = httpx.AsyncClient(
+            base_url=url,
+            # the client ignores its own limits when given a transport, the pool is the transport's
+            transport=httpx.AsyncHTTPTransport(
+                # transport level retries only cover connection errors
+                retries=argo_options.max_retries,
+                limits=httpx.Limits(
+                    max_connections=argo_options.pool_size,
+                    max_keepalive_connections=argo_options.pool_size,
+                ),
+            ),
+            timeout=None,
+        )
+
+    async def close(self) -> None:
+        """
+        release all pooled connections
+        """
+        await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    def _get_headers(self):
+        if self._argo_options.authorization_token:
+            return {"Authorization": self._argo_options.authorization_token}
+        return None
+
+    async def _request(self, method: str, path: str, with_retries=True, **request_kwargs):
+        max_retries = (
+            self._argo_options.max_retries
+            if with_retries and method in self._retry_methods
+            else 0
+        )
+        for attempt in range(max_retries + 1):
+            response = await self._client.request(
+                method, path, headers=self._get_headers(), **request_kwargs
+            )
+            if response.status_code not in RETRY_STATUS_CODES:
+                return response
+            if attempt < max_retries:
+                await asyncio.sleep(RETRY_BACKOFF_FACTOR * (2 ** attempt))
+        if max_retries > 0:
+            raise ArgoApiException()
+        return response
+
+    @staticmethod
+    def _raise_for_status(response, reason=None):
+        if response.status_code != 200:
+            raise ArgoApiException(
+                status=response.status_code,
+                reason=reason if reason is not None else response.reason_phrase,
+            )
+
+    async def submit_workflow(self, namespace, body: ArgoSubmitRequestBody):
+        response = await self._request(
+            "POST", f"/api/v1/workflows/{namespace}/submit", json=asdict(body)
+        )
+        self._raise_for_status(response)
+        return response.json()
+
+    async def create_workflow(self, namespace, body: dict):
+        response = await self._request(
+            "POST", f"/api/v1/workflows/{namespace}", json={"workflow": body}
+        )
+        self._raise_for_status(response, reason=response.text)
+        return response.json()
+
+    async def get_workflow(self, namespace, name, with_retries=False, fields: str = None):
+        response = await self._request(
+            "GET",
+            f"/api/v1/workflows/{namespace}/{name}",
+            with_retries=with_retries,
+            params={"fields": fields} if fields else None,
+        )
+        self._raise_for_status(response)
+        return response.json()
+
+    async def workflow_resume(self, namespace, name):
+        response = await self._request("PUT", f"/api/v1/workflows/{namespace}/{name}/resume")
+        self._raise_for_status(response)
+        return response.json()
+
+    async def workflow_retry(self, namespace, name):
+        response = await self._request("PUT", f"/api/v1/workflows/{namespace}/{name}/retry")
+        self._raise_for_status(response)
+        return response.json()
+
+    async def workflow_stop(self, namespace, name):
+        response = await self._request("PUT", f"/api/v1/workflows/{namespace}/{name}/stop")
+        self._raise_for_status(response)
+        return response.json()
+
+    async def workflow_suspend(self, namespace, name):
+        response = await self._request("PUT", f"/api/v1/workflows/{namespace}/{name}/suspend")
+        self._raise_for_status(response)
+        return response.json()
@@ -0,0 +1,58 @@
+from typing import Dict, Union
+
+from argo_workflow_tools.artifact import Artifact
+from argo_workflow_tools.async_workflow_status_checker import AsyncWorkflowStatusChecker
+from argo_workflow_tools.workflow_result import WorkflowResult
+from argo_workflow_tools.workflow_status_checker import _is_running
+from argo_workflow_tools.workflow_status import WorkflowStatus
+
+
+class AsyncWorkflowResult:
+    """asyncio counterpart of WorkflowResult, control methods are coroutines"""
+
+    def __init__(
+        self,
+        workflow_name: str,
+        workflow_status: WorkflowStatus,
+        workflow_status_checker: AsyncWorkflowStatusChecker = None,
+    ):
+        self.workflow_name = workflow_name
+        self.status = workflow_status
+        self.workflow_status_checker = workflow_status_checker
+
+    def _update_status(self) -> WorkflowStatus:
+        self.status = WorkflowStatus.value_of(
+            self.workflow_status_checker.current_phase
+        )
+        return self.status
+
+    async def wait_for_completion(self, timeout=None):
+        await self.workflow_status_checker.wait_for_completion(timeout)
+        return self._update_status()
+
+    async def stop(self):
+        await self.workflow_status_checker.stop()
+        return self._update_status()
+
+    async def retry(self):
+        await self.workflow_status_checker.retry()
+        return self._update_status()
+
+    async def resume(self):
+        await self.workflow_status_checker.resume()
+        return self._update_status()
+
+    async def suspend(self):
+        await self.workflow_status_checker.suspend()
+        return self._update_status()
+
+    @property
+    def outputs(self) -> Dict[str, Union[str, Artifact]]:
+        # the full workflow is only fetched once the workflow stops running
+        workflow = self.workflow_status_checker.workflow_current_status_data_dict
+        if self.status is None or _is_running(self.status) or workflow is None:
+            return {}
+        else:
+            nodes = (workflow.get("status") or {}).get("nodes") or {}
+            entrypoint_node = nodes.get(self.workflow_name) or {}
+            return WorkflowResult._get_outputs(entrypoint_node.get("outputs") or {})
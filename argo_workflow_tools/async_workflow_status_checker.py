@@ -0,0 +1,97 @@
+import asyncio
+import time
+from typing import Optional
+
+from argo_workflow_tools.async_argo_http_client import AsyncArgoHttpClient
+from argo_workflow_tools.polling_strategy import FixedPollingStrategy, PollingStrategy
+from argo_workflow_tools.workflow_status_checker import (
+    POLLING_INTERVAL_SECONDS,
+    STATUS_FIELDS,
+    _get_workflow_phase,
+    _is_running,
+    _next_poll_delay,
+)
+
+
+class AsyncWorkflowStatusChecker:
+    def __init__(
+        self,
+        _argo_http_client: AsyncArgoHttpClient,
+        workflow_namespace: str,
+        workflow_name: str,
+        polling_strategy: PollingStrategy = None,
+    ):
+        self._argo_http_client = _argo_http_client
+        self._polling_strategy = polling_strategy or FixedPollingStrategy(
+            POLLING_INTERVAL_SECONDS
+        )
+        self._workflow_namespace = workflow_namespace
+        self._workflow_name = workflow_name
+        self._current_phase = None
+        self.workflow_current_status_data_dict = None
+
+    async def sync(self) -> None:
+        workflow_current_status_response = await self._argo_http_client.get_workflow(
+            namespace=self._workflow_namespace,
+            name=self._workflow_name,
+            with_retries=True,
+            fields=STATUS_FIELDS,
+        )
+
+        self._current_phase = _get_workflow_phase(workflow_current_status_response)
+        self.workflow_current_status_data_dict = None
+        if not _is_running(self._current_phase):
+            # outputs can't be fetched lazily from a synchronous property,
+            # so the full workflow is fetched once it stops running
+            self.workflow_current_status_data_dict = await self._argo_http_client.get_workflow(
+                namespace=self._workflow_namespace,
+                name=self._workflow_name,
+                with_retries=True,
+            )
+
+    async def wait_for_completion(self, timeout=None):
+        started = time.monotonic()
+        attempt = 0
+        while _is_running(self.current_phase):
+            await asyncio.sleep(
+                _next_poll_delay(
+                    self._polling_strategy,
+                    attempt,
+                    started,
+                    self.current_phase,
+                    timeout,
+                    self._workflow_name,
+                )
+            )
+            attempt += 1
+            await self.sync()
+
+        return self.current_phase
+
+    async def stop(self):
+        await self._argo_http_client.workflow_stop(
+            self._workflow_namespace, self._workflow_name
+        )
+        await self.sync()
+
+    async def retry(self):
+        await self._argo_http_client.workflow_retry(
+            self._workflow_namespace, self._workflow_name
+        )
+        await self.sync()
+
+    async def resume(self):
+        await self._argo_http_client.workflow_resume(
+            self._workflow_namespace, self._workflow_name
+        )
+        await self.sync()
+
+    async def suspend(self):
+        await self._argo_http_client.workflow_suspend(
+            self._workflow_namespace, self._workflow_name
+        )
+        await self.sync()
+
+    @property
+    def current_phase(self) -> Optional[str]:
+        return self._current_phase
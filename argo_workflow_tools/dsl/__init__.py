@@ -1,3 +1,38 @@
-import argo_workflow_tools.dsl.dsl_decorators as dsl
-from argo_workflow_tools.dsl.workflow import CronWorkflow, Workflow, WorkflowTemplate
-from argo_workflow_tools.dsl.workflow_compiler import compile_workflow
+import importlib
+from typing import TYPE_CHECKING
+
+# imported lazily on first access (PEP 562), the DSL pulls in the generated argo models
+_LAZY_ATTRIBUTES = {
+    "dsl": (".dsl_decorators", None),
+    "CompilationProfiler": (".compilation_profiler", "CompilationProfiler"),
+    "CronWorkflow": (".workflow", "CronWorkflow"),
+    "ManifestCache": (".manifest_cache", "ManifestCache"),
+    "Workflow": (".workflow", "Workflow"),
+    "WorkflowTemplate": (".workflow", "WorkflowTemplate"),
+    "compile_all": (".workflow_compiler", "compile_all"),
+    "compile_workflow": (".workflow_compiler", "compile_workflow"),
+}
+
+__all__ = sorted(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    module = importlib.import_module(module_name, __name__)
+    value = module if attribute is None else getattr(module, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+if TYPE_CHECKING:
+    from argo_workflow_tools.dsl import dsl_decorators as dsl  # noqa: F401
+    from argo_workflow_tools.dsl.compilation_profiler import CompilationProfiler  # noqa: F401
+    from argo_workflow_tools.dsl.manifest_cache import ManifestCache  # noqa: F401
+    from argo_workflow_tools.dsl.workflow import CronWorkflow, Workflow, WorkflowTemplate  # noqa: F401
+    from argo_workflow_tools.dsl.workflow_compiler import compile_all, compile_workflow  # noqa: F401
@@ -0,0 +1,293 @@
+"""
+cache of compiled templates, shared across compile_dag calls.
+entries are kept per decorated node (so they go away with the node) and keyed by the code of the
+node function and of everything else that ends up in the template, its decorator properties and the
+plain module constants and closure values it reads. compiled templates are shared between compilations
+and must not be mutated in place.
+an active ManifestCache adds a persistent layer below the in memory entries, to which every build
+reports the nodes its template depends on.
+"""
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Callable, Dict, Hashable, Iterator, List, NamedTuple, Optional, Tuple
+from weakref import WeakKeyDictionary, ref
+
+from argo_workflow_tools.dsl import compilation_profiler, workflow_template_collector
+from argo_workflow_tools.dsl.dag_task import TaskReference
+from argo_workflow_tools.dsl.node import Node
+from argo_workflow_tools.dsl.utils import fingerprint
+from argo_workflow_tools.models.io.argoproj.workflow.v1alpha1 import Template
+
+if TYPE_CHECKING:
+    from argo_workflow_tools.dsl.manifest_cache import ManifestCache
+
+
+# variant of a node referenced by templateRef, its template is not built by the referencing DAG
+REFERENCE_VARIANT = ("templateRef",)
+
+
+class _CacheEntry(NamedTuple):
+    template: Template
+    # every (template, origin, state of the origin) registered while the entry was built, the template
+    # itself included, in order. origins are weak, the entry's own node among them would otherwise keep
+    # its weak key alive
+    templates: List[Tuple[Template, "ref[Node]", str]]
+
+
+def _entry(template: Template, templates: List[Tuple[Template, Node]]) -> _CacheEntry:
+    return _CacheEntry(
+        template, [(child, ref(origin), _state(origin)) for child, origin in templates]
+    )
+
+
+def _registered_templates(entry: _CacheEntry) -> Optional[List[Tuple[Template, Node]]]:
+    """
+    the templates of an entry with their origins, None once one of the origins was collected or its
+    state changed
+    """
+    templates = []
+    for template, origin, state in entry.templates:
+        node = origin()
+        if node is None or _state(node) != state:
+            return None
+        templates.append((template, node))
+    return templates
+
+
+_entries: "WeakKeyDictionary[Node, Dict[Hashable, _CacheEntry]]" = WeakKeyDictionary()
+_lock = threading.Lock()
+
+_enabled: ContextVar[bool] = ContextVar("compilation_cache_enabled", default=True)
+# entries built or reused by the running compilation, keyed by (node, key)
+_compilation_memo: ContextVar[Optional[Dict[Tuple[Node, Hashable], _CacheEntry]]] = ContextVar(
+    "compilation_memo", default=None
+)
+_recorders: ContextVar[Tuple[List[Tuple[Template, Node]], ...]] = ContextVar(
+    "compilation_cache_recorders", default=()
+)
+# state of every node seen by the running compilation, DAGs see the state they started with
+_compilation_states: ContextVar[Optional[Dict[Node, str]]] = ContextVar(
+    "compilation_states", default=None
+)
+_manifest_cache: ContextVar[Optional["ManifestCache"]] = ContextVar("manifest_cache", default=None)
+# (node, variant) of every template the template being built refers to, only recorded for a ManifestCache
+_dependencies: ContextVar[Optional[List[Tuple[Node, Tuple]]]] = ContextVar(
+    "compilation_dependencies", default=None
+)
+
+
+def _code(func: Optional[Callable]):
+    return None if func is None else func.__code__
+
+
+def task_variant(task_reference: TaskReference) -> Tuple:
+    """
+    the part of a task cache key that depends on the call site rather than on the task code
+    """
+    return tuple(task_reference.arguments.keys())
+
+
+def dag_variant(embed_workflow_templates: bool) -> Tuple:
+    """
+    the part of a DAG cache key that depends on the compilation rather than on the DAG code
+    """
+    return (embed_workflow_templates,)
+
+
+def _state(node: Node) -> str:
+    """
+    hash of what a template depends on besides the node code: the decorator properties and the plain
+    module constants and closure values the function reads, DAGs may be generated from them
+    """
+    states = _compilation_states.get()
+    state = states.get(node) if states is not None else None
+    if state is None:
+        state = fingerprint.content_hash(
+            [
+                fingerprint.fingerprint(node.properties),
+                fingerprint.global_constants(node.func),
+                fingerprint.closure_values(node.func),
+            ]
+        )
+        if states is not None:
+            states[node] = state
+    return state
+
+
+def task_key(task_reference: TaskReference) -> Hashable:
+    """
+    cache key of a task template, the generated script depends on the bound argument names
+    """
+    return (
+        _code(task_reference.func),
+        _code(task_reference.pre_func_hooks),
+        _code(task_reference.post_func_hooks),
+        task_variant(task_reference),
+        _state(task_reference.node),
+    )
+
+
+def dag_key(node: Node, embed_workflow_templates: bool) -> Hashable:
+    """
+    cache key of a DAG template
+    """
+    return _code(node.func), dag_variant(embed_workflow_templates), _state(node)
+
+
+def register_template(template: Template, origin: Node) -> None:
+    """
+    add a template to the current workflow compilation flow, recording it for the cache
+    entries being built
+    Parameters
+    ----------
+    template : compiled template
+    origin : the node the template was built from
+    """
+    for recorder in _recorders.get():
+        recorder.append((template, origin))
+    workflow_template_collector.add_template(template, origin)
+
+
+def register_reference(node: Node) -> None:
+    """
+    record that the template being built refers to a node by templateRef, without building it
+    """
+    _add_dependency(node, REFERENCE_VARIANT)
+
+
+def _add_dependency(node: Node, variant: Tuple) -> None:
+    dependencies = _dependencies.get()
+    if dependencies is not None:
+        dependencies.append((node, variant))
+
+
+def cached_build(
+    node: Node, key: Hashable, variant: Tuple, build: Callable[[], Template]
+) -> Template:
+    """
+    returns the cached template of a node, building it on a miss.
+    within one compilation every node is expanded once, across compilations a hit registers again
+    every template registered by the original build, so nested templates are collected exactly as
+    they would have been by a fresh build
+    Parameters
+    ----------
+    node : decorated node the template is built from
+    key : cache key of the template within the node's entries
+    variant : the part of the key that does not come from the node code, e.g. the bound argument
+        names of a task, it must be JSON serializable
+    build : builds the template, registering it and its children with register_template
+
+    Returns
+    -------
+    Argo Template
+    """
+    memo = _compilation_memo.get()
+    entry = memo.get((node, key)) if memo is not None else None
+    if entry is not None:
+        compilation_profiler.instant(compilation_profiler.MEMO_HIT, node.func)
+        # already registered in this compilation, only the entries being built need to know about it
+        templates = _registered_templates(entry)
+        for recorder in _recorders.get():
+            recorder.extend(templates)
+        _add_dependency(node, variant)
+        return entry.template
+
+    entry = _build_entry(node, key, variant, build)
+    if memo is not None:
+        memo[(node, key)] = entry
+    _add_dependency(node, variant)
+    return entry.template
+
+
+def _build_entry(
+    node: Node, key: Hashable, variant: Tuple, build: Callable[[], Template]
+) -> _CacheEntry:
+    if not _enabled.get():
+        return _CacheEntry(build(), [])
+
+    with _lock:
+        entry = _entries.get(node, {}).get(key)
+    templates = _registered_templates(entry) if entry is not None else None
+    if templates is not None:
+        compilation_profiler.instant(compilation_profiler.CACHE_HIT, node.func)
+        for template, origin in templates:
+            register_template(template, origin)
+        return entry
+
+    manifest_cache = _manifest_cache.get()
+    if manifest_cache is not None:
+        loaded = manifest_cache.load(node, variant)
+        if loaded is not None:
+            entry = _entry(*loaded)
+            for template, origin in loaded[1]:
+                register_template(template, origin)
+            with _lock:
+                _entries.setdefault(node, {})[key] = entry
+            return entry
+
+    compilation_profiler.instant(compilation_profiler.CACHE_MISS, node.func)
+
+    recorded: List[Tuple[Template, Node]] = []
+    dependencies: Optional[List[Tuple[Node, Tuple]]] = [] if manifest_cache is not None else None
+    token = _recorders.set(_recorders.get() + (recorded,))
+    dependencies_token = _dependencies.set(dependencies)
+    try:
+        template = build()
+    finally:
+        _dependencies.reset(dependencies_token)
+        _recorders.reset(token)
+
+    entry = _entry(template, recorded)
+    with _lock:
+        _entries.setdefault(node, {})[key] = entry
+    if manifest_cache is not None:
+        manifest_cache.store(node, variant, template, dependencies)
+    return entry
+
+
+@contextmanager
+def compilation() -> Iterator[None]:
+    """
+    scope of a single compile_dag call, nodes are expanded at most once inside it
+    """
+    token = _compilation_memo.set({})
+    states_token = _compilation_states.set({})
+    try:
+        yield
+    finally:
+        _compilation_states.reset(states_token)
+        _compilation_memo.reset(token)
+
+
+def clear() -> None:
+    """
+    drop every cached template
+    """
+    with _lock:
+        _entries.clear()
+
+
+@contextmanager
+def persistent(manifest_cache: "ManifestCache") -> Iterator[None]:
+    """
+    read and fill a persistent manifest cache below the in memory entries
+    """
+    token = _manifest_cache.set(manifest_cache)
+    try:
+        yield
+    finally:
+        _manifest_cache.reset(token)
+
+
+@contextmanager
+def disabled() -> Iterator[None]:
+    """
+    compile without reading or filling the cache, e.g. for DAGs whose structure depends on state
+    outside their arguments
+    """
+    token = _enabled.set(False)
+    try:
+        yield
+    finally:
+        _enabled.reset(token)
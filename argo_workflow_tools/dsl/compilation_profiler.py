@@ -0,0 +1,179 @@
+"""
+opt-in instrumentation of the DSL compiler. compile inside a CompilationProfiler to record how long
+every template took to build, cache hits and misses, inspect.getsource time and generated script sizes.
+when no profiler is active the compiler hooks only read a context variable.
+"""
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from argo_workflow_tools.dsl.utils.utils import generate_template_name_from_func
+
+
+DAG = "dag"
+TASK = "task"
+COMPILE = "compile"
+GETSOURCE = "getsource"
+CACHE_HIT = "cache_hit"
+CACHE_MISS = "cache_miss"
+MEMO_HIT = "memo_hit"
+SCRIPT = "script"
+
+
+class CompilationEvent(NamedTuple):
+    category: str
+    name: str
+    # seconds since the profiler started
+    start: float
+    # None for instant events
+    duration: Optional[float]
+    thread_id: int
+    attributes: Dict[str, Any]
+
+
+class CompilationProfiler:
+    """
+    Records compiler events while active. write_trace writes the chrome trace event format, open it
+    in chrome://tracing, perfetto or speedscope to see a flame graph of the compilation
+    """
+
+    def __init__(self, callback: Callable[[CompilationEvent], None] = None):
+        """
+        Parameters
+        ----------
+        callback : called with every recorded event, e.g. to stream events into a logger
+        """
+        self.events: List[CompilationEvent] = []
+        self._callback = callback
+        self._started = None
+        self._token = None
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "CompilationProfiler":
+        self._started = time.perf_counter()
+        self._token = _active_profiler.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        _active_profiler.reset(self._token)
+
+    def record(
+        self, category: str, name: str, started: float, duration: float = None, **attributes
+    ) -> None:
+        event = CompilationEvent(
+            category,
+            name,
+            started - self._started,
+            duration,
+            threading.get_ident(),
+            attributes,
+        )
+        with self._lock:
+            self.events.append(event)
+        if self._callback:
+            self._callback(event)
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        aggregated counters: number of events and total seconds per category, and the build time and
+        script size of every template
+        """
+        counts: Dict[str, int] = defaultdict(int)
+        seconds: Dict[str, float] = defaultdict(float)
+        templates: Dict[str, Dict[str, float]] = defaultdict(dict)
+        for event in self.events:
+            counts[event.category] += 1
+            if event.duration is not None:
+                seconds[event.category] += event.duration
+            if event.category in (DAG, TASK):
+                templates[event.name]["wall_time"] = (
+                    templates[event.name].get("wall_time", 0.0) + event.duration
+                )
+            elif event.category == SCRIPT:
+                templates[event.name]["script_size"] = event.attributes["size"]
+        return {
+            "counts": dict(counts),
+            "seconds": dict(seconds),
+            "templates": dict(templates),
+        }
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """
+        events in the chrome trace event format
+        """
+        trace_events = []
+        for event in self.events:
+            trace_event = {
+                "name": event.name,
+                "cat": event.category,
+                "ts": event.start * 1e6,
+                "pid": os.getpid(),
+                "tid": event.thread_id,
+                "args": event.attributes,
+            }
+            if event.duration is None:
+                trace_event.update(ph="i", s="t")
+            else:
+                trace_event.update(ph="X", dur=event.duration * 1e6)
+            trace_events.append(trace_event)
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+    def write_trace(self, path: str) -> None:
+        with open(path, "w") as trace_file:
+            json.dump(self.to_chrome_trace(), trace_file, default=str)
+
+
+_active_profiler: ContextVar[Optional[CompilationProfiler]] = ContextVar(
+    "compilation_profiler", default=None
+)
+
+
+@contextmanager
+def _span(profiler: CompilationProfiler, category: str, name: str, attributes: dict):
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        profiler.record(
+            category, name, started, time.perf_counter() - started, **attributes
+        )
+
+
+class _NoSpan:
+    def __enter__(self):
+        return None
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+_NO_SPAN = _NoSpan()
+
+
+def span(category: str, func: Callable, **attributes):
+    """
+    times a compiler step, a no-op when no profiler is active
+    Parameters
+    ----------
+    category : event category, e.g. DAG or TASK
+    func : the function the step compiles, the event is named after its template
+    attributes : extra event attributes
+    """
+    profiler = _active_profiler.get()
+    if profiler is None:
+        return _NO_SPAN
+    return _span(profiler, category, generate_template_name_from_func(func), attributes)
+
+
+def instant(category: str, func: Callable, **attributes) -> None:
+    """
+    records a point in time event, a no-op when no profiler is active
+    """
+    profiler = _active_profiler.get()
+    if profiler is not None:
+        profiler.record(category, generate_template_name_from_func(func), time.perf_counter(), **attributes)
@@ -1,10 +1,14 @@
-import inspect
 import os
 from contextvars import copy_context
 from itertools import groupby
 from typing import Mapping, Optional, Union, Dict, List, Callable
 
-from argo_workflow_tools.dsl import building_mode_context, workflow_template_collector
+from argo_workflow_tools.dsl import (
+    building_mode_context,
+    compilation_cache,
+    compilation_profiler,
+    workflow_template_collector,
+)
 from argo_workflow_tools.dsl.condition import BinaryOp, UnaryOp
 from argo_workflow_tools.dsl.dag_task import (
     DAGReference,
@@ -12,7 +16,7 @@ from argo_workflow_tools.dsl.dag_task import (
     TaskReference,
     WorkflowTemplateReference,
 )
-from argo_workflow_tools.dsl.node import DAGNode
+from argo_workflow_tools.dsl.node import DAGNode, source_without_decorators
 from argo_workflow_tools.dsl.input_definition import InputDefinition, SourceType
 from argo_workflow_tools.dsl.node_properties import (
     DAGNodeProperties,
@@ -26,10 +30,13 @@ from argo_workflow_tools.dsl.utils.utils import (
     get_arguments,
     get_inputs,
     get_outputs,
-    sanitize_name, generate_template_name_from_func,
+    sanitize_name, generate_template_name_from_func, is_iterator_annotation,
 )
 from argo_workflow_tools.models.io.argoproj.workflow import v1alpha1 as argo
 
+# iterator annotations are part of the task source, tasks using them need the typing names
+ITERATOR_IMPORTS = "from typing import Generator, Iterable, Iterator"
+
 
 def _create_task_script(
         func_obj: TaskReference, parameters: Dict[str, argo.Parameter]
@@ -47,12 +54,12 @@ def _create_task_script(
     if func_obj.func is None:
         return None
 
-    function_signature = inspect.signature(func_obj.func)
+    node = func_obj.node
     builder_imports = set()
     inputs = ""
     outputs = ""
     for name, argument in func_obj.arguments.items():
-        parameter_annotation = function_signature.parameters[name].annotation
+        parameter_annotation = node.signature.parameters[name].annotation
         json_parameter = func_obj.properties.inputs.get(
             name, DefaultParameterBuilder(parameter_annotation)
         )
@@ -72,27 +79,34 @@ def _create_task_script(
         )
     if outputs == "":
         output_builder = func_obj.properties.outputs.get(
-            "result", DefaultParameterBuilder(function_signature.return_annotation)
+            "result", DefaultParameterBuilder(node.return_annotation)
         )
         outputs = output_builder.variable_to_output("result", "result", func_obj)
 
-    func_code = _extract_source_without_decorators(func_obj.func)
+    annotations = [node.return_annotation] + [
+        parameter.annotation for parameter in node.signature.parameters.values()
+    ]
+    if any(is_iterator_annotation(annotation) for annotation in annotations):
+        builder_imports.add(ITERATOR_IMPORTS)
+
+    func_code = node.source
 
     pre_func_hook = func_obj.pre_func_hooks or _dummy_pre_func_hook
-    pre_func_hook_code = _extract_source_without_decorators(pre_func_hook)
+    pre_func_hook_code = source_without_decorators(pre_func_hook)
 
     post_func_hook = func_obj.post_func_hooks or _dummy_post_func_hook
-    post_func_hook_code = _extract_source_without_decorators(post_func_hook)
+    post_func_hook_code = source_without_decorators(post_func_hook)
 
     script = _build_full_source_script(func_obj, func_code, builder_imports, inputs, outputs, pre_func_hook,
                                        pre_func_hook_code, post_func_hook, post_func_hook_code)
+    compilation_profiler.instant(compilation_profiler.SCRIPT, func_obj.func, size=len(script))
     return script
 
 
 def _build_full_source_script(func_obj, func_code, builder_imports, inputs, outputs,
                               pre_func_hook, pre_func_hook_code, post_func_hook, post_func_hook_code):
     indentation = ' ' * 4
-    func_call = f"result={func_obj.func.__name__}({str.join(',', inspect.signature(func_obj.func).parameters.keys())})"
+    func_call = f"result={func_obj.func.__name__}({str.join(',', func_obj.node.signature.parameters.keys())})"
     func_and_hooks_call = (
             f"{pre_func_hook.__name__}()\n"
             + f"try:\n"
@@ -113,12 +127,6 @@ def _build_full_source_script(func_obj, func_code, builder_imports, inputs, outp
     return script
 
 
-def _extract_source_without_decorators(func):
-    code = inspect.getsource(func)
-    code = code[code.find("def "):]
-    return code
-
-
 def _dummy_pre_func_hook():
     pass
 
@@ -227,7 +235,7 @@ def _build_exit_hook(exit_hook: Callable, embed_workflow_templates: bool) -> Dic
             for input_name, input_type in dag_tasks[0].arguments.items()
         ]
         if isinstance(dag_tasks[0], DAGReference):
-            template = _build_dag_template(dag_tasks[0], embed_workflow_templates)
+            template = _build_dag_template(dag_tasks[0].node, embed_workflow_templates)
         elif isinstance(dag_tasks[0], TaskReference):
             template = _build_task_template(dag_tasks[0])
         else:
@@ -295,6 +303,7 @@ def _build_dag_task(
         )
         return task
     elif isinstance(dag_task, WorkflowTemplateReference):
+        compilation_cache.register_reference(dag_task.node)
         template_name = generate_template_name_from_func(dag_task.func)
         task = argo.DAGTask(
             name=dag_task.id,
@@ -372,7 +381,8 @@ def _build_dag_outputs(
 
 def _build_task_template(task_node: TaskReference) -> argo.Template:
     """
-    Builds an Argo Script Template out of a TaskNode
+    Builds an Argo Script Template out of a TaskNode, reusing the template compiled for an
+    identical call of the same task
     Parameters
     ----------
     task_node : TaskNode to parse into a Script Template
@@ -382,18 +392,23 @@ def _build_task_template(task_node: TaskReference) -> argo.Template:
     Argo Script Template
 
     """
+    with compilation_profiler.span(compilation_profiler.TASK, task_node.func):
+        return compilation_cache.cached_build(
+            task_node.node,
+            compilation_cache.task_key(task_node),
+            compilation_cache.task_variant(task_node),
+            lambda: _compile_task_template(task_node),
+        )
+
+
+def _compile_task_template(task_node: TaskReference) -> argo.Template:
     parameters = {
         param_name: InputDefinition(
             source_type=SourceType.PARAMETER,
             name=sanitize_name(param_name, snake_case=True),
-            default=None
-            if isinstance(param_definition.default, type)
-               and param_definition.default.__name__ == "_empty"
-            else param_definition.default,
+            default=default,
         )
-        for param_name, param_definition in inspect.signature(
-            task_node.func
-        ).parameters.items()
+        for param_name, default in task_node.node.parameter_defaults.items()
     }
 
     task_inputs = {
@@ -427,14 +442,14 @@ def _build_task_template(task_node: TaskReference) -> argo.Template:
 
     task_template = _fill_task_metadata(task_template, task_node.properties)
 
-    workflow_template_collector.add_template(task_template)
+    compilation_cache.register_template(task_template, task_node.node)
 
     return task_template
 
 
 def _build_dag_template(node: DAGNode, embed_workflow_templates: bool) -> argo.Template:
     """
-    Builds an Argo DAG Template out of a DAGNode
+    Builds an Argo DAG Template out of a DAGNode, reusing the templates compiled for the same DAG
     Parameters
     ----------
     node : DAGNode to parse into a DAG Template
@@ -445,18 +460,23 @@ def _build_dag_template(node: DAGNode, embed_workflow_templates: bool) -> argo.T
     Argo DAG Template
 
     """
+    with compilation_profiler.span(compilation_profiler.DAG, node.func):
+        return compilation_cache.cached_build(
+            node,
+            compilation_cache.dag_key(node, embed_workflow_templates),
+            compilation_cache.dag_variant(embed_workflow_templates),
+            lambda: _compile_dag_template(node, embed_workflow_templates),
+        )
+
+
+def _compile_dag_template(node: DAGNode, embed_workflow_templates: bool) -> argo.Template:
     parameters = {
         param_name: InputDefinition(
             source_type=SourceType.PARAMETER,
             name=sanitize_name(param_name, snake_case=True),
-            default=None
-            if isinstance(param_definition.default, type)
-               and param_definition.default.__name__ == "_empty"
-            else param_definition.default,
+            default=default,
         )
-        for param_name, param_definition in inspect.signature(
-            node.func
-        ).parameters.items()
+        for param_name, default in node.parameter_defaults.items()
     }
     ctx = copy_context()
     dag_output = ctx.run(node.func, **parameters)
@@ -481,7 +501,7 @@ def _build_dag_template(node: DAGNode, embed_workflow_templates: bool) -> argo.T
 
     dag_template = _fill_dag_metadata(dag_template, node.properties)
 
-    workflow_template_collector.add_template(dag_template)
+    compilation_cache.register_template(dag_template, node)
     return dag_template
 
 
@@ -506,12 +526,15 @@ def compile_dag(entrypoint: DAGNode, on_exit: DAGNode = None,
             raise ValueError(
                 f"{entrypoint.__name__} is not decorated with DAG or Task decorator"
             )
-        result = _build_dag_template(entrypoint, embed_workflow_templates)
-
-        if on_exit:
-            on_exit_result = _build_dag_template(on_exit, embed_workflow_templates).name
-        else:
-            on_exit_result = None
+        with compilation_profiler.span(
+            compilation_profiler.COMPILE, entrypoint.func
+        ), compilation_cache.compilation():
+            result = _build_dag_template(entrypoint, embed_workflow_templates)
+
+            if on_exit:
+                on_exit_result = _build_dag_template(on_exit, embed_workflow_templates).name
+            else:
+                on_exit_result = None
 
         workflow_templates = workflow_template_collector.collect_templates()
         workflowspec = argo.WorkflowSpec(
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Callable, Mapping, Union, List, Optional
+from typing import TYPE_CHECKING, Callable, Mapping, Union, List, Optional
 
 from argo_workflow_tools.dsl.input_definition import InputDefinition
 from argo_workflow_tools.dsl.node_properties import (
@@ -7,56 +7,105 @@ from argo_workflow_tools.dsl.node_properties import (
     TaskNodeProperties,
 )
 
+if TYPE_CHECKING:
+    from argo_workflow_tools.dsl.node import Node
 
-@dataclass
+
+# references are created for every call site of a DAG, they are slotted and frozen and keep only
+# what differs between call sites, everything else is read from the called node
+@dataclass(frozen=True)
 class NodeReference(object):
     """
     Represents a result reference from a called node
     """
 
+    __slots__ = (
+        "id",
+        "name",
+        "outputs",
+        "node",
+        "arguments",
+        "wait_for",
+        "continue_on_fail",
+        "exit",
+        "conditions",
+    )
+
     id: str
     name: str
     outputs: Mapping[str, InputDefinition]
-    func: Callable
-    pre_func_hooks: Optional[Callable[[], None]]
-    post_func_hooks: Optional[Callable[[], None]]
-    node: str
+    node: "Node"
     arguments: Mapping[str, Union[InputDefinition]]
     wait_for: List[InputDefinition]
     continue_on_fail: bool
     exit: Callable
     conditions: List[any]
 
+    @property
+    def func(self) -> Callable:
+        return self.node.func
+
+    @property
+    def pre_func_hooks(self) -> Optional[Callable[[], None]]:
+        return None
 
-@dataclass
+    @property
+    def post_func_hooks(self) -> Optional[Callable[[], None]]:
+        return None
+
+
+@dataclass(frozen=True)
 class DAGReference(NodeReference):
     """
     Represents a result reference from a called DAG
     """
 
-    properties: DAGNodeProperties
+    __slots__ = ()
+
+    @property
+    def properties(self) -> DAGNodeProperties:
+        return self.node.properties
 
 
-@dataclass
+@dataclass(frozen=True)
 class TaskReference(NodeReference):
     """
     Represents a result reference from a called task
     """
 
-    properties: TaskNodeProperties
+    __slots__ = ()
+
+    @property
+    def properties(self) -> TaskNodeProperties:
+        return self.node.properties
+
+    @property
+    def pre_func_hooks(self) -> Optional[Callable[[], None]]:
+        return self.node._pre_hook
+
+    @property
+    def post_func_hooks(self) -> Optional[Callable[[], None]]:
+        return self.node._post_hook
 
     def __repr__(self):
         return f"TaskReference(name={self.name} id={self.id})"
 
 
-@dataclass
+@dataclass(frozen=True)
 class WorkflowTemplateReference(NodeReference):
     """
     Represents a result reference from a called task
     """
 
-    workflow_template_name: str
-    properties: DAGNodeProperties
+    __slots__ = ()
+
+    @property
+    def workflow_template_name(self) -> str:
+        return self.node.name
+
+    @property
+    def properties(self) -> DAGNodeProperties:
+        return self.node.properties
 
     def __repr__(self):
         return f"WorkflowTemplateReference(name={self.name} id={self.id})"
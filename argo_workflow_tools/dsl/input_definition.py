@@ -1,5 +1,6 @@
+import sys
 from enum import Enum
-from typing import Iterator, Optional
+from typing import Dict, Iterator, Optional, Tuple
 
 from argo_workflow_tools.dsl.parameter_builders import ParameterBuilder
 from argo_workflow_tools.dsl.utils.path_builder import (
@@ -22,7 +23,31 @@ class SourceType(Enum):
     CONST = "const"
 
 
+_UNRESOLVED = object()
+
+
 class InputDefinition:
+    """
+    a value flowing through a DAG while it is built. instances are immutable and slotted, DAGs with
+    many call sites create a lot of them
+    """
+
+    __slots__ = (
+        "source_type",
+        "name",
+        "source_node_id",
+        "source_template",
+        "reference",
+        "parameter_builder",
+        "key_name",
+        "value",
+        "default",
+        "is_expression",
+        "_children",
+        "_key_path",
+        "_paths",
+    )
+
     def __init__(
         self,
         source_type: SourceType,
@@ -36,16 +61,49 @@ class InputDefinition:
         default: any = None,
         is_expression: bool = False,
     ):
-        self.source_type = source_type
-        self.name = name
-        self.source_node_id = source_node_id
-        self.source_template = source_template
-        self.reference = references
-        self.parameter_builder = parameter_builder
-        self.key_name = key_name
-        self.value = convert_str(value)
-        self.default = convert_str(default)
-        self.is_expression = is_expression
+        initialize = super().__setattr__
+        initialize("source_type", source_type)
+        initialize("name", name)
+        initialize("source_node_id", source_node_id)
+        initialize("source_template", source_template)
+        initialize("reference", references)
+        initialize("parameter_builder", parameter_builder)
+        initialize("key_name", sys.intern(key_name) if isinstance(key_name, str) else key_name)
+        initialize("value", convert_str(value))
+        initialize("default", convert_str(default))
+        initialize("is_expression", is_expression)
+        # keys, properties and partitions taken from this input, shared by repeated lookups
+        initialize("_children", None)
+        # resolved on first use, inputs are immutable
+        initialize("_key_path", _UNRESOLVED)
+        initialize("_paths", None)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"InputDefinition is immutable, can't set '{name}'")
+
+    def _child(self, source_type: SourceType, key_name: str = None) -> "InputDefinition":
+        children: Optional[Dict[Tuple[SourceType, str], InputDefinition]] = self._children
+        if children is None:
+            children = {}
+            super().__setattr__("_children", children)
+        try:
+            child = children.get((source_type, key_name))
+        except TypeError:
+            # unhashable keys can't be shared, build a new child every time
+            return self._new_child(source_type, key_name)
+        if child is None:
+            child = self._new_child(source_type, key_name)
+            children[(source_type, key_name)] = child
+        return child
+
+    def _new_child(self, source_type: SourceType, key_name: str = None) -> "InputDefinition":
+        return InputDefinition(
+            source_type=source_type,
+            name=self.name,
+            source_node_id=self.source_node_id,
+            references=self,
+            key_name=key_name,
+        )
 
     @property
     def is_node_output(self):
@@ -77,6 +135,13 @@ class InputDefinition:
 
     @property
     def key_path(self):
+        key_path = self._key_path
+        if key_path is _UNRESOLVED:
+            key_path = self._resolve_key_path()
+            super().__setattr__("_key_path", key_path)
+        return key_path
+
+    def _resolve_key_path(self) -> Optional[str]:
         if (
             self.source_type == SourceType.KEY
             or self.source_type == SourceType.PROPERTY
@@ -97,6 +162,15 @@ class InputDefinition:
             return self
 
     def path(self, as_const=False) -> str:
+        paths: Optional[Dict[bool, str]] = self._paths
+        if paths is None:
+            paths = {}
+            super().__setattr__("_paths", paths)
+        if as_const not in paths:
+            paths[as_const] = self._resolve_path(as_const)
+        return paths[as_const]
+
+    def _resolve_path(self, as_const: bool) -> str:
         if self.is_partition:
             return with_item_path(self.key_path)
         if self.is_node_output:
@@ -120,38 +194,17 @@ class InputDefinition:
         return parameter_path(self.name, self.key_path)
 
     def __iter__(self) -> Iterator:
-        return iter(
-            [
-                InputDefinition(
-                    source_type=SourceType.PARTITION,
-                    name=self.name,
-                    source_node_id=self.source_node_id,
-                    references=self,
-                )
-            ]
-        )
+        return iter([self._child(SourceType.PARTITION)])
 
     def __getitem__(self, name) -> "InputDefinition":
-        return InputDefinition(
-            source_type=SourceType.KEY,
-            name=self.name,
-            source_node_id=self.source_node_id,
-            references=self,
-            key_name=name,
-        )
+        return self._child(SourceType.KEY, name)
 
     def __getattr__(self, name) -> "InputDefinition":
         if name.startswith("__") and name.endswith("__"):
             raise ValueError(
                 f"You are trying to reference attribute '{name}'. Argo does not support special methods"
             )
-        return InputDefinition(
-            source_type=SourceType.PROPERTY,
-            name=self.name,
-            source_node_id=self.source_node_id,
-            references=self,
-            key_name=name,
-        )
+        return self._child(SourceType.PROPERTY, name)
 
     def __repr__(self):
         return f"InputDefinition(source_type={self.source_type.name} name={self.name} source_node_id={self.source_node_id})"
@@ -0,0 +1,253 @@
+"""
+persistent cache of compiled templates, shared across processes through a JSON file.
+every template is stored under a content hash of the node it was built from: the function source, the
+decorator properties, the parameter builder imports and the call site variant. an entry is reused while
+its own hash and the hashes of every template it refers to are unchanged, so editing a task recompiles
+that task and the DAGs above it only.
+"""
+import inspect
+import json
+import os
+import threading
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from argo_workflow_tools.dsl import compilation_cache
+from argo_workflow_tools.dsl.node import Node, TaskNode, WorkflowTemplateNode
+from argo_workflow_tools.dsl.utils.fingerprint import (
+    closure_values,
+    content_hash,
+    fingerprint,
+    global_constants,
+    qualified_name,
+)
+from argo_workflow_tools.dsl.utils.serialization import to_serializable
+from argo_workflow_tools.dsl.utils.utils import (
+    generate_template_name_from_func,
+    node_import_path,
+    resolve_import_path,
+)
+from argo_workflow_tools.models.io.argoproj.workflow.v1alpha1 import Template
+
+
+CACHE_FORMAT = 1
+
+try:
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        _PACKAGE_VERSION = version("argo-workflow-tools")
+    except PackageNotFoundError:
+        _PACKAGE_VERSION = None
+except ImportError:  # python 3.7
+    _PACKAGE_VERSION = None
+
+
+class ManifestCache:
+    """
+    Reuses templates compiled by previous runs while active, e.g. to regenerate the manifests of a
+    repository where only a few tasks changed
+
+        with ManifestCache(".argo-manifest-cache.json") as cache:
+            manifests = [compile_workflow(template).to_yaml() for template in templates]
+        print(cache.rebuilt)
+
+    only nodes importable by module and qualified name are cached, nodes defined inside functions are
+    always recompiled along with the templates that use them
+    """
+
+    def __init__(self, path: str):
+        """
+        Parameters
+        ----------
+        path : cache file, created on exit if missing
+        """
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        # names of the templates compiled while active
+        self.rebuilt: List[str] = []
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._used: Set[str] = set()
+        self._keys: Dict[Tuple[Node, Tuple], Optional[str]] = {}
+        self._valid: Dict[str, bool] = {}
+        self._templates: Dict[str, Template] = {}
+        self._lock = threading.RLock()
+        self._context = None
+
+    def __enter__(self) -> "ManifestCache":
+        self._entries = self._read()
+        # in memory entries built before were never stored, rebuild them through this cache
+        compilation_cache.clear()
+        self._context = compilation_cache.persistent(self)
+        self._context.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._context.__exit__(exc_type, exc_val, exc_tb)
+        self._context = None
+        self.save()
+
+    def load(self, node: Node, variant: Tuple) -> Optional[Tuple[Template, List[Tuple[Template, Node]]]]:
+        """
+        returns the stored template of a node and every template it registers, None when the node or
+        anything it refers to changed
+        """
+        with self._lock:
+            key = self.key(node, variant)
+            if key is None or not self._is_valid(key):
+                self.misses += 1
+                return None
+            self.hits += 1
+            registered: List[Tuple[Template, Node]] = []
+            template = self._register(key, registered, set())
+            return template, registered
+
+    def store(
+        self,
+        node: Node,
+        variant: Tuple,
+        template: Template,
+        dependencies: List[Tuple[Node, Tuple]],
+    ) -> None:
+        """
+        stores a freshly compiled template with the (node, variant) of every template it refers to
+        """
+        with self._lock:
+            self.rebuilt.append(template.name)
+            key = self.key(node, variant)
+            if key is None:
+                return
+            references = []
+            for dependency, dependency_variant in dependencies:
+                dependency_key = self.key(dependency, dependency_variant)
+                if dependency_key is None:
+                    return
+                references.append(
+                    [list(node_import_path(dependency)), list(dependency_variant), dependency_key]
+                )
+            self._entries[key] = {
+                "name": template.name,
+                "origin": list(node_import_path(node)),
+                "variant": list(variant),
+                "template": to_serializable(template),
+                "dependencies": references,
+            }
+            self._templates[key] = template
+            self._valid[key] = True
+            self._used.add(key)
+
+    def key(self, node: Node, variant: Tuple) -> Optional[str]:
+        """
+        content hash of a node compiled for a variant, None for nodes that can't be cached
+        """
+        with self._lock:
+            if (node, variant) not in self._keys:
+                self._keys[(node, variant)] = (
+                    content_hash(_node_fingerprint(node, variant))
+                    if node_import_path(node) is not None
+                    else None
+                )
+            return self._keys[(node, variant)]
+
+    def save(self) -> None:
+        """
+        writes the cache file. stale entries of the nodes compiled while active are dropped, entries of
+        nodes that were not compiled are kept
+        """
+        with self._lock:
+            compiled = {tuple(self._entries[key]["origin"]) for key in self._used}
+            entries = {
+                key: entry
+                for key, entry in self._entries.items()
+                if key in self._used or tuple(entry["origin"]) not in compiled
+            }
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            temporary_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(temporary_path, "w") as cache_file:
+                json.dump(
+                    {"format": CACHE_FORMAT, "entries": entries}, cache_file, default=str
+                )
+            os.replace(temporary_path, self.path)
+
+    def _read(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.path) as cache_file:
+                stored = json.load(cache_file)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(stored, dict) or stored.get("format") != CACHE_FORMAT:
+            return {}
+        return stored.get("entries", {})
+
+    def _is_valid(self, key: str) -> bool:
+        if key not in self._valid:
+            # a dependency cycle can't be reused
+            self._valid[key] = False
+            entry = self._entries.get(key)
+            self._valid[key] = entry is not None and all(
+                self._dependency_is_valid(*dependency) for dependency in entry["dependencies"]
+            )
+        return self._valid[key]
+
+    def _dependency_is_valid(self, origin: List[str], variant: List[Any], key: str) -> bool:
+        try:
+            node = resolve_import_path(tuple(origin))
+        except (ImportError, AttributeError):
+            return False
+        if not isinstance(node, Node) or self.key(node, tuple(variant)) != key:
+            return False
+        return tuple(variant) == compilation_cache.REFERENCE_VARIANT or self._is_valid(key)
+
+    def _register(
+        self, key: str, registered: List[Tuple[Template, Node]], seen: Set[str]
+    ) -> Template:
+        """
+        collects the templates of an entry in the order the original build registered them
+        """
+        entry = self._entries[key]
+        self._used.add(key)
+        for origin, variant, dependency_key in entry["dependencies"]:
+            if tuple(variant) == compilation_cache.REFERENCE_VARIANT or dependency_key in seen:
+                continue
+            self._register(dependency_key, registered, seen)
+        template = self._template(key)
+        if key not in seen:
+            seen.add(key)
+            registered.append((template, resolve_import_path(tuple(entry["origin"]))))
+        return template
+
+    def _template(self, key: str) -> Template:
+        if key not in self._templates:
+            self._templates[key] = Template.parse_obj(self._entries[key]["template"])
+        return self._templates[key]
+
+
+def _node_fingerprint(node: Node, variant: Tuple) -> Dict[str, Any]:
+    builders = [*node.properties.inputs.values(), *node.properties.outputs.values()]
+    node_fingerprint = {
+        "format": CACHE_FORMAT,
+        "version": _PACKAGE_VERSION,
+        "node": type(node).__name__,
+        "template": generate_template_name_from_func(node.func),
+        "source": _source(node.func),
+        "globals": global_constants(node.func),
+        "closure": closure_values(node.func),
+        "properties": fingerprint(node.properties),
+        "imports": sorted(set().union(*[builder.imports() for builder in builders])),
+        "variant": list(variant),
+    }
+    if isinstance(node, TaskNode):
+        node_fingerprint["hooks"] = [_source(node._pre_hook), _source(node._post_hook)]
+    if isinstance(node, WorkflowTemplateNode):
+        node_fingerprint["workflow_template"] = [node.name, node.namespace]
+    return node_fingerprint
+
+
+def _source(func: Optional[Callable]) -> Optional[str]:
+    if func is None:
+        return None
+    try:
+        return inspect.getsource(func)
+    except (OSError, TypeError):
+        return qualified_name(func)
@@ -1,8 +1,10 @@
 import inspect
 from abc import abstractmethod
 from typing import Any, Callable, Dict, Iterable, Mapping, Sequence, cast, List, Optional
+from weakref import WeakKeyDictionary
 
 from argo_workflow_tools.dsl import building_mode_context as context
+from argo_workflow_tools.dsl import compilation_profiler
 from argo_workflow_tools.dsl.dag_task import (
     DAGReference,
     TaskReference,
@@ -25,6 +27,23 @@ from argo_workflow_tools.dsl.workflow_template_collector import (
 )
 
 
+# decorator-stripped source of task functions and hooks, read from disk once per function
+_sources: "WeakKeyDictionary[Callable, str]" = WeakKeyDictionary()
+
+
+def source_without_decorators(func: Callable) -> str:
+    """
+    source code of a function starting at its def statement
+    """
+    source = _sources.get(func)
+    if source is None:
+        with compilation_profiler.span(compilation_profiler.GETSOURCE, func):
+            source = inspect.getsource(func)
+        source = source[source.find("def "):]
+        _sources[func] = source
+    return source
+
+
 class Node(object):
     def __init__(self, func: Callable, **kwargs):
         """
@@ -36,6 +55,18 @@ class Node(object):
         """
         self._func = func
         self.kwargs = kwargs
+        # inspected once here, every call site and compilation of the node reuses them
+        self.signature = inspect.signature(func)
+        self.return_annotation = self.signature.return_annotation
+        self.parameter_defaults = {
+            name: None if parameter.default is inspect.Parameter.empty else parameter.default
+            for name, parameter in self.signature.parameters.items()
+        }
+        self._var_keyword_parameters = [
+            name
+            for name, parameter in self.signature.parameters.items()
+            if parameter.kind == inspect.Parameter.VAR_KEYWORD
+        ]
 
     @property
     def func(self) -> Callable:
@@ -47,6 +78,16 @@ class Node(object):
         """
         return self._func
 
+    @property
+    def source(self) -> str:
+        """
+
+        Returns
+        -------
+        the function source without decorators, read on first use
+        """
+        return source_without_decorators(self._func)
+
     @abstractmethod
     def __call__(self, *args, **kwargs) -> Any:
         """
@@ -132,7 +173,7 @@ class Node(object):
         return arg
 
     def _bind_arguments(self, *args, **kwargs) -> Mapping[str, Any]:
-        signature = inspect.signature(self._func)
+        signature = self.signature
         kwargs_filtered = self._filter_dag_args(kwargs)
         try:
             bound_args = signature.bind(*args, **kwargs_filtered)
@@ -144,12 +185,7 @@ class Node(object):
                 f"{e}."
             ) from e
 
-        kwarg_parameters = [
-            name
-            for name, param in signature.parameters.items()
-            if param.kind == inspect.Parameter.VAR_KEYWORD
-        ]
-        for kwarg_param_name in kwarg_parameters:
+        for kwarg_param_name in self._var_keyword_parameters:
             arguments = {**arguments, **arguments[kwarg_param_name]}
             del arguments[kwarg_param_name]
 
@@ -254,16 +290,12 @@ class DAGNode(Node):
             DAGReference(
                 id=guid,
                 name=sanitize_name(self._func.__name__),
-                func=self._func,
-                pre_func_hooks=None,
-                post_func_hooks=None,
                 wait_for=self._get_wait(kwargs),
                 continue_on_fail=kwargs.get("continue_on_fail"),
                 exit=exit_handler,
                 arguments=self._arguments(arguments),
                 outputs=outputs,
                 node=self,
-                properties=self.properties,
                 conditions=conditions,
             ),
         )
@@ -338,9 +370,7 @@ class TaskNode(Node):
                     references=partitioned_arguments,
                     parameter_builder=self.properties.outputs.get(
                         "result",
-                        DefaultParameterBuilder(
-                            inspect.signature(self._func).return_annotation
-                        ),
+                        DefaultParameterBuilder(self.return_annotation),
                     ),
                 )
             }
@@ -361,15 +391,11 @@ class TaskNode(Node):
             TaskReference(
                 id=guid,
                 name=sanitize_name(self._func.__name__),
-                func=self._func,
-                pre_func_hooks=self._pre_hook,
-                post_func_hooks=self._post_hook,
                 wait_for=self._get_wait(kwargs),
                 continue_on_fail=kwargs.get("continue_on_fail"),
                 exit=exit_handler,
                 arguments=self._arguments(arguments),
                 outputs=outputs,
-                properties=self.properties,
                 node=self,
                 conditions=conditions,
             ),
@@ -474,18 +500,13 @@ class WorkflowTemplateNode(DAGNode):
 
         add_task(
             WorkflowTemplateReference(
-                workflow_template_name=self.name,
                 id=guid,
                 name=sanitize_name(self._func.__name__),
-                func=self._func,
-                pre_func_hooks=None,
-                post_func_hooks=None,
                 wait_for=self._get_wait(kwargs),
                 arguments=self._arguments(arguments),
                 outputs=outputs,
                 exit=exit_handler,
                 node=self,
-                properties=self.properties,
                 conditions=conditions,
                 continue_on_fail=kwargs.get("continue_on_fail")
             ),
@@ -1,3 +1,12 @@
+from .artifact_parameter_builder import ArtifactParameterBuilder  # noqa
+from .codec_parameter_builder import (  # noqa
+    ArrowParameterBuilder,
+    CodecParameterBuilder,
+    MsgpackParameterBuilder,
+    NumpyParameterBuilder,
+    PickleParameterBuilder,
+)
 from .default_parameter_builder import DefaultParameterBuilder  # noqa
 from .multiple_output_parameter_builder import MultipleOutputParameterBuilder  # noqa
 from .parameter_builder import ParameterBuilder  # noqa
+from .stream_parameter_builder import StreamParameterBuilder  # noqa
@@ -0,0 +1,78 @@
+from typing import Callable, Set
+
+from pydantic import BaseModel
+
+from argo_workflow_tools.dsl.parameter_builders.parameter_builder import (
+    ParameterBuilder,
+)
+
+DEFAULT_THRESHOLD = 256 * 1024
+# unique per task run, argo substitutes the variables in the script source
+DEFAULT_KEY = "{{workflow.name}}/{{pod.name}}"
+
+
+class ArtifactParameterBuilder(ParameterBuilder):
+    """
+    Passes values as parameters while they are small and through an object store once they exceed a
+    threshold, keeping large values out of the workflow object. set it on both the producing output
+    and the consuming inputs, consumers load uploaded values from a file instead of the script source
+    """
+
+    def __init__(
+        self,
+        store_url: str,
+        type_annotation: type = None,
+        threshold: int = DEFAULT_THRESHOLD,
+        key_prefix: str = "parameters",
+        file_prefix: str = "/tmp",
+    ):
+        """
+        Parameters
+        ----------
+        store_url : `s3://bucket/prefix` (add `?endpoint_url=...` for MinIO) or `file:///path` of a shared volume
+        type_annotation : pydantic model to parse inputs into, None for json values
+        threshold : largest value size in bytes passed as a parameter
+        key_prefix : prefix of the store keys
+        file_prefix : directory of the output parameter files
+        """
+        super().__init__()
+        self.store_url = store_url
+        self.type_annotation = type_annotation
+        self.threshold = threshold
+        self.key_prefix = key_prefix
+        self.file_prefix = file_prefix
+
+    def _is_model(self) -> bool:
+        return isinstance(self.type_annotation, type) and issubclass(
+            self.type_annotation, BaseModel
+        )
+
+    def imports(self) -> Set[str]:
+        imports = {
+            "from argo_workflow_tools.dsl.parameter_builders.artifact_store import read_parameter, write_parameter"
+        }
+        if self._is_model():
+            imports.add(
+                f"from {self.type_annotation.__module__} import {self.type_annotation.__name__}"
+            )
+        return imports
+
+    def artifact_path(self, parameter_name: str) -> str:
+        return f"{self.file_prefix}/{parameter_name}.json"
+
+    def variable_from_input(
+        self, parameter_name: str, variable_name: str, function: Callable
+    ) -> str:
+        model = self.type_annotation.__name__ if self._is_model() else "None"
+        return (
+            f"{variable_name} = read_parameter(r'''{{{{inputs.parameters.{parameter_name}}}}}''', {model})"
+        )
+
+    def variable_to_output(
+        self, parameter_name: str, variable_name: str, function: Callable
+    ) -> str:
+        key = f"{self.key_prefix}/{DEFAULT_KEY}/{parameter_name}.json"
+        return (
+            f"write_parameter({variable_name}, '{self.artifact_path(parameter_name)}', "
+            f"'{self.store_url}', '{key}', {self.threshold})"
+        )
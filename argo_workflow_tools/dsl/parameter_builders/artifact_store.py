@@ -0,0 +1,158 @@
+"""
+runtime side of ArtifactParameterBuilder, imported by the generated task scripts. values larger than a
+threshold are uploaded to an object store and replaced by a small pointer parameter, consumers stream
+them back into a local file before loading them. stores are addressed by url: `s3://bucket/prefix`
+(an `endpoint_url` query parameter points it at MinIO, requires the optional `s3` extra, boto3) or a
+local directory, `file:///path`.
+"""
+import json
+import os
+import shutil
+import tempfile
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+from urllib.parse import parse_qs, urlparse
+
+from pydantic import BaseModel
+
+# key of the pointer that replaces a value uploaded to the store
+POINTER_KEY = "$artifact"
+STORE_KEY = "store"
+
+
+class ArtifactStore(ABC):
+    @abstractmethod
+    def upload(self, local_path: str, key: str) -> None:
+        pass
+
+    @abstractmethod
+    def download(self, key: str, local_path: str) -> None:
+        pass
+
+
+class FileSystemStore(ArtifactStore):
+    """
+    keys are files under a root directory, e.g. a shared volume or a local store for tests
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.root, *key.split("/"))
+
+    def upload(self, local_path: str, key: str) -> None:
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        shutil.copyfile(local_path, path)
+
+    def download(self, key: str, local_path: str) -> None:
+        shutil.copyfile(self._path(key), local_path)
+
+
+class S3Store(ArtifactStore):
+    """
+    keys are objects under a bucket prefix of S3 or any S3 compatible store
+    """
+
+    def __init__(self, bucket: str, prefix: str = "", endpoint_url: str = None):
+        self.bucket = bucket
+        self.prefix = prefix.strip("/")
+        self.endpoint_url = endpoint_url
+        self._client = None
+
+    def _object_key(self, key: str) -> str:
+        return f"{self.prefix}/{key}" if self.prefix else key
+
+    def _s3(self):
+        if self._client is None:
+            try:
+                import boto3
+            except ImportError as e:
+                raise ImportError(
+                    "s3 artifact stores require boto3, "
+                    "install it with `pip install argo-workflow-tools[s3]`"
+                ) from e
+            self._client = boto3.client("s3", endpoint_url=self.endpoint_url)
+        return self._client
+
+    def upload(self, local_path: str, key: str) -> None:
+        # multipart upload from the file, the value is never held in memory
+        self._s3().upload_file(local_path, self.bucket, self._object_key(key))
+
+    def download(self, key: str, local_path: str) -> None:
+        self._s3().download_file(self.bucket, self._object_key(key), local_path)
+
+
+def store_from_url(url: str) -> ArtifactStore:
+    """
+    the store addressed by a `s3://bucket/prefix` or `file:///path` url, plain paths are directories
+    """
+    parsed = urlparse(url)
+    if parsed.scheme == "s3":
+        endpoint_url = parse_qs(parsed.query).get("endpoint_url", [None])[0]
+        return S3Store(parsed.netloc, parsed.path, endpoint_url=endpoint_url)
+    if parsed.scheme in ("file", ""):
+        return FileSystemStore(parsed.path)
+    raise ValueError(f"unsupported artifact store '{url}', expected an s3:// or file:// url")
+
+
+def write_parameter(
+    value: Any, output_path: str, store_url: str, key: str, threshold: int
+) -> None:
+    """
+    writes a task output to its parameter file, uploading it when it is larger than threshold bytes
+    Parameters
+    ----------
+    value : the output value, json serializable or a pydantic model
+    output_path : file argo reads the output parameter from
+    store_url : url of the store large values are uploaded to
+    key : key of the value in the store
+    threshold : largest value size in bytes passed as a parameter
+    """
+    payload_path = f"{output_path}.payload"
+    with open(payload_path, "w") as payload_file:
+        if isinstance(value, BaseModel):
+            payload_file.write(value.json())
+        else:
+            json.dump(value, payload_file)
+
+    if os.path.getsize(payload_path) <= threshold:
+        os.replace(payload_path, output_path)
+        return
+    store_from_url(store_url).upload(payload_path, key)
+    os.remove(payload_path)
+    with open(output_path, "w") as output_file:
+        json.dump({POINTER_KEY: key, STORE_KEY: store_url}, output_file)
+
+
+def read_parameter(raw: str, model: Optional[type] = None) -> Any:
+    """
+    loads a task input from its parameter value, downloading it when the parameter is a pointer
+    Parameters
+    ----------
+    raw : the parameter value
+    model : pydantic model to parse the value into
+
+    Returns
+    -------
+    the input value
+    """
+    try:
+        value = json.loads(raw)
+    except ValueError:
+        # plain string parameters are not json encoded
+        value = raw
+    if isinstance(value, dict) and POINTER_KEY in value:
+        value = _download(value[STORE_KEY], value[POINTER_KEY])
+    if model is not None and not isinstance(value, model):
+        return model.parse_obj(value)
+    return value
+
+
+def _download(store_url: str, key: str) -> Any:
+    with tempfile.TemporaryDirectory() as directory:
+        local_path = os.path.join(directory, "payload.json")
+        store_from_url(store_url).download(key, local_path)
+        with open(local_path) as payload_file:
+            return json.load(payload_file)
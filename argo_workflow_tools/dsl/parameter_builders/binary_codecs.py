@@ -0,0 +1,269 @@
+"""
+runtime side of the codec parameter builders, imported by the generated task scripts. values are
+serialized with a binary codec, optionally compressed, and passed base64 encoded in the parameter.
+when a store url is set, payloads larger than a threshold are uploaded like ArtifactParameterBuilder
+does and replaced by a pointer. codecs other than pickle need optional extras, they are imported
+when a value is first encoded or decoded.
+"""
+import base64
+import bz2
+import gzip
+import io
+import json
+import lzma
+import os
+import pickle
+import struct
+import tempfile
+from abc import ABC, abstractmethod
+from typing import Any, BinaryIO, Dict, Optional
+
+from pydantic import BaseModel
+
+from argo_workflow_tools.dsl.parameter_builders.artifact_store import (
+    POINTER_KEY,
+    STORE_KEY,
+    store_from_url,
+)
+
+COMPRESSIONS = {
+    "gzip": gzip.open,
+    "bz2": bz2.open,
+    "lzma": lzma.open,
+}
+
+
+def _require(module: str, extra: str):
+    try:
+        return __import__(module)
+    except ImportError as e:
+        raise ImportError(
+            f"this codec requires {module}, "
+            f"install it with `pip install argo-workflow-tools[{extra}]`"
+        ) from e
+
+
+class Codec(ABC):
+    extension: str
+
+    @abstractmethod
+    def dump(self, value: Any, stream: BinaryIO) -> None:
+        pass
+
+    @abstractmethod
+    def load(self, stream: BinaryIO) -> Any:
+        pass
+
+
+class PickleCodec(Codec):
+    """
+    pickle protocol 5, buffers of numpy arrays and similar objects are written out of band after the
+    pickle stream instead of being copied into it
+    """
+
+    extension = "pkl"
+    protocol = min(5, pickle.HIGHEST_PROTOCOL)
+    _length = struct.Struct("<Q")
+
+    def dump(self, value: Any, stream: BinaryIO) -> None:
+        buffers = []
+        options = {"buffer_callback": buffers.append} if self.protocol >= 5 else {}
+        data = pickle.dumps(value, protocol=self.protocol, **options)
+        views = [memoryview(data), *(buffer.raw() for buffer in buffers)]
+        stream.write(self._length.pack(len(views) - 1))
+        for view in views:
+            stream.write(self._length.pack(view.nbytes))
+            stream.write(view)
+
+    def load(self, stream: BinaryIO) -> Any:
+        (count,) = self._length.unpack(stream.read(self._length.size))
+        chunks = []
+        for _ in range(count + 1):
+            (length,) = self._length.unpack(stream.read(self._length.size))
+            chunks.append(stream.read(length))
+        data, buffers = chunks[0], chunks[1:]
+        if buffers:
+            # out of band buffers are only produced by protocol 5
+            return pickle.loads(data, buffers=[bytearray(buffer) for buffer in buffers])
+        return pickle.loads(data)
+
+
+class MsgpackCodec(Codec):
+    """
+    msgpack, a compact binary encoding of json like values. pydantic models are packed as dicts
+    """
+
+    extension = "msgpack"
+
+    def dump(self, value: Any, stream: BinaryIO) -> None:
+        msgpack = _require("msgpack", "msgpack")
+        if isinstance(value, BaseModel):
+            value = json.loads(value.json())
+        msgpack.pack(value, stream, use_bin_type=True)
+
+    def load(self, stream: BinaryIO) -> Any:
+        msgpack = _require("msgpack", "msgpack")
+        return msgpack.unpack(stream, raw=False)
+
+
+class NumpyCodec(Codec):
+    """
+    a single numpy array in the `.npy` format, object arrays are rejected
+    """
+
+    extension = "npy"
+
+    def dump(self, value: Any, stream: BinaryIO) -> None:
+        numpy = _require("numpy", "numpy")
+        numpy.save(stream, numpy.asarray(value), allow_pickle=False)
+
+    def load(self, stream: BinaryIO) -> Any:
+        numpy = _require("numpy", "numpy")
+        # np.load seeks, compressed streams are read into memory first
+        return numpy.load(io.BytesIO(stream.read()), allow_pickle=False)
+
+
+class ArrowCodec(Codec):
+    """
+    tabular values, a pyarrow Table or a pandas DataFrame, as an arrow IPC stream. loads a pyarrow
+    Table, call `to_pandas()` on it for a DataFrame
+    """
+
+    extension = "arrow"
+
+    def _table(self, value: Any):
+        pyarrow = _require("pyarrow", "arrow")
+        if isinstance(value, pyarrow.Table):
+            return value
+        return pyarrow.Table.from_pandas(value)
+
+    def dump(self, value: Any, stream: BinaryIO) -> None:
+        pyarrow = _require("pyarrow", "arrow")
+        table = self._table(value)
+        with pyarrow.ipc.new_stream(stream, table.schema) as writer:
+            writer.write_table(table)
+
+    def load(self, stream: BinaryIO) -> Any:
+        pyarrow = _require("pyarrow", "arrow")
+        return pyarrow.ipc.open_stream(stream).read_all()
+
+
+class ParquetCodec(ArrowCodec):
+    """
+    tabular values as a parquet file, loads a pyarrow Table
+    """
+
+    extension = "parquet"
+
+    def dump(self, value: Any, stream: BinaryIO) -> None:
+        _require("pyarrow", "arrow")
+        import pyarrow.parquet
+
+        pyarrow.parquet.write_table(self._table(value), stream)
+
+    def load(self, stream: BinaryIO) -> Any:
+        _require("pyarrow", "arrow")
+        import pyarrow.parquet
+
+        return pyarrow.parquet.read_table(io.BytesIO(stream.read()))
+
+
+CODECS: Dict[str, Codec] = {
+    "pickle": PickleCodec(),
+    "msgpack": MsgpackCodec(),
+    "npy": NumpyCodec(),
+    "arrow": ArrowCodec(),
+    "parquet": ParquetCodec(),
+}
+
+
+def get_codec(codec: str, compression: Optional[str] = None) -> Codec:
+    """
+    the codec registered under a name, validating the compression used with it
+    """
+    if codec not in CODECS:
+        raise ValueError(
+            f"unsupported codec '{codec}', expected one of {', '.join(CODECS)}"
+        )
+    if compression is not None and compression not in COMPRESSIONS:
+        raise ValueError(
+            f"unsupported compression '{compression}', expected one of {', '.join(COMPRESSIONS)}"
+        )
+    return CODECS[codec]
+
+
+def _open(path: str, mode: str, compression: Optional[str]) -> BinaryIO:
+    if compression is None:
+        return open(path, mode)
+    return COMPRESSIONS[compression](path, mode)
+
+
+def encode_parameter(
+    value: Any,
+    output_path: str,
+    codec: str,
+    compression: Optional[str] = None,
+    store_url: Optional[str] = None,
+    key: Optional[str] = None,
+    threshold: Optional[int] = None,
+) -> None:
+    """
+    writes a task output to its parameter file
+    Parameters
+    ----------
+    value : the output value
+    output_path : file argo reads the output parameter from
+    codec : name of the codec serializing the value
+    compression : gzip, bz2, lzma or None
+    store_url : url of the store large payloads are uploaded to, None to always pass them inline
+    key : key of the payload in the store
+    threshold : largest payload size in bytes passed inline
+    """
+    payload_path = f"{output_path}.payload"
+    with _open(payload_path, "wb", compression) as payload_file:
+        get_codec(codec, compression).dump(value, payload_file)
+
+    if store_url is not None and os.path.getsize(payload_path) > threshold:
+        store_from_url(store_url).upload(payload_path, key)
+        with open(output_path, "w") as output_file:
+            json.dump({POINTER_KEY: key, STORE_KEY: store_url}, output_file)
+    else:
+        with open(payload_path, "rb") as payload_file, open(output_path, "wb") as output_file:
+            base64.encode(payload_file, output_file)
+    os.remove(payload_path)
+
+
+def decode_parameter(
+    raw: str,
+    codec: str,
+    compression: Optional[str] = None,
+    model: Optional[type] = None,
+) -> Any:
+    """
+    loads a task input from its parameter value, downloading it when the parameter is a pointer
+    Parameters
+    ----------
+    raw : the parameter value, base64 encoded payload or a json pointer
+    codec : name of the codec the value was serialized with
+    compression : compression the value was written with
+    model : pydantic model to parse the value into
+
+    Returns
+    -------
+    the input value
+    """
+    decoder = get_codec(codec, compression)
+    with tempfile.TemporaryDirectory() as directory:
+        payload_path = os.path.join(directory, f"payload.{decoder.extension}")
+        # base64 never starts with a brace, pointers are json objects
+        if raw.lstrip().startswith("{"):
+            pointer = json.loads(raw)
+            store_from_url(pointer[STORE_KEY]).download(pointer[POINTER_KEY], payload_path)
+        else:
+            with open(payload_path, "wb") as payload_file:
+                payload_file.write(base64.b64decode(raw))
+        with _open(payload_path, "rb", compression) as payload_file:
+            value = decoder.load(payload_file)
+    if model is not None and not isinstance(value, model):
+        return model.parse_obj(value)
+    return value
@@ -0,0 +1,135 @@
+from typing import Callable, Set
+
+from pydantic import BaseModel
+
+from argo_workflow_tools.dsl.parameter_builders.artifact_parameter_builder import (
+    DEFAULT_KEY,
+    DEFAULT_THRESHOLD,
+)
+from argo_workflow_tools.dsl.parameter_builders.binary_codecs import get_codec
+from argo_workflow_tools.dsl.parameter_builders.parameter_builder import (
+    ParameterBuilder,
+)
+
+
+class CodecParameterBuilder(ParameterBuilder):
+    """
+    Passes values serialized with a binary codec instead of json, base64 encoded in the parameter.
+    set it on both the producing output and the consuming inputs. with a store url, payloads larger
+    than the threshold are uploaded and passed as a pointer, like ArtifactParameterBuilder does
+    """
+
+    def __init__(
+        self,
+        codec: str,
+        type_annotation: type = None,
+        compression: str = None,
+        store_url: str = None,
+        threshold: int = DEFAULT_THRESHOLD,
+        key_prefix: str = "parameters",
+        file_prefix: str = "/tmp",
+    ):
+        """
+        Parameters
+        ----------
+        codec : pickle, msgpack, npy, arrow or parquet
+        type_annotation : pydantic model to parse inputs into, None to use the decoded value
+        compression : gzip, bz2, lzma or None
+        store_url : `s3://bucket/prefix` or `file:///path` large payloads are uploaded to,
+            None to always pass them in the parameter
+        threshold : largest payload size in bytes passed in the parameter
+        key_prefix : prefix of the store keys
+        file_prefix : directory of the output parameter files
+        """
+        super().__init__()
+        # fails at compile time rather than in the task
+        self._codec = get_codec(codec, compression)
+        self.codec = codec
+        self.type_annotation = type_annotation
+        self.compression = compression
+        self.store_url = store_url
+        self.threshold = threshold
+        self.key_prefix = key_prefix
+        self.file_prefix = file_prefix
+
+    def _is_model(self) -> bool:
+        return isinstance(self.type_annotation, type) and issubclass(
+            self.type_annotation, BaseModel
+        )
+
+    def imports(self) -> Set[str]:
+        imports = {
+            "from argo_workflow_tools.dsl.parameter_builders.binary_codecs import decode_parameter, encode_parameter"
+        }
+        if self._is_model():
+            imports.add(
+                f"from {self.type_annotation.__module__} import {self.type_annotation.__name__}"
+            )
+        return imports
+
+    def artifact_path(self, parameter_name: str) -> str:
+        return f"{self.file_prefix}/{parameter_name}.{self._codec.extension}"
+
+    def variable_from_input(
+        self, parameter_name: str, variable_name: str, function: Callable
+    ) -> str:
+        model = self.type_annotation.__name__ if self._is_model() else "None"
+        return (
+            f"{variable_name} = decode_parameter(r'''{{{{inputs.parameters.{parameter_name}}}}}''', "
+            f"{self.codec!r}, {self.compression!r}, {model})"
+        )
+
+    def variable_to_output(
+        self, parameter_name: str, variable_name: str, function: Callable
+    ) -> str:
+        key = f"{self.key_prefix}/{DEFAULT_KEY}/{self.artifact_path(parameter_name).rsplit('/', 1)[-1]}"
+        return (
+            f"encode_parameter({variable_name}, '{self.artifact_path(parameter_name)}', "
+            f"{self.codec!r}, {self.compression!r}, {self.store_url!r}, '{key}', {self.threshold})"
+        )
+
+
+class PickleParameterBuilder(CodecParameterBuilder):
+    """
+    Passes values pickled with protocol 5, buffers of arrays are written out of band
+    """
+
+    def __init__(self, type_annotation: type = None, **kwargs):
+        super().__init__("pickle", type_annotation, **kwargs)
+
+
+class MsgpackParameterBuilder(CodecParameterBuilder):
+    """
+    Passes json like values and pydantic models encoded with msgpack, requires the `msgpack` extra
+    """
+
+    def __init__(self, type_annotation: type = None, **kwargs):
+        super().__init__("msgpack", type_annotation, **kwargs)
+
+
+class NumpyParameterBuilder(CodecParameterBuilder):
+    """
+    Passes numpy arrays in the `.npy` format, requires the `numpy` extra
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__("npy", **kwargs)
+
+
+class ArrowParameterBuilder(CodecParameterBuilder):
+    """
+    Passes tables, pyarrow Tables or pandas DataFrames, as arrow IPC streams or parquet files.
+    inputs are loaded as pyarrow Tables, requires the `arrow` extra
+    """
+
+    def __init__(self, file_format: str = "arrow", **kwargs):
+        """
+        Parameters
+        ----------
+        file_format : arrow for IPC streams or parquet
+        """
+        if file_format not in ("arrow", "parquet"):
+            raise ValueError(
+                f"unsupported table format '{file_format}', expected arrow or parquet"
+            )
+        super().__init__(file_format, **kwargs)
@@ -6,9 +6,24 @@ from pydantic import BaseModel
 from argo_workflow_tools.dsl.parameter_builders.parameter_builder import (
     ParameterBuilder,
 )
+from argo_workflow_tools.dsl.utils.utils import (
+    is_iterator_annotation,
+    iterator_item_annotation,
+)
+
+
+def _is_model(annotation: type) -> bool:
+    return isinstance(annotation, type) and issubclass(annotation, BaseModel)
 
 
 class DefaultParameterBuilder(ParameterBuilder):
+    """
+    Passes values as json parameters, serializers are chosen by the type annotation.
+    Iterator and Generator results are written item by item, only the output side streams: argo
+    substitutes the whole parameter into the consuming script, which loads the list before iterating
+    it. use StreamParameterBuilder for consumers that should not hold the whole result
+    """
+
     def __init__(
         self,
         type_annotation: type,
@@ -18,14 +33,18 @@ class DefaultParameterBuilder(ParameterBuilder):
         self.file_prefix = file_prefix
         self.type_annotation = type_annotation
 
+    def _model(self) -> type:
+        if is_iterator_annotation(self.type_annotation):
+            item_annotation = iterator_item_annotation(self.type_annotation)
+            return item_annotation if _is_model(item_annotation) else None
+        return self.type_annotation if _is_model(self.type_annotation) else None
+
     def imports(self) -> Set[str]:
-        if self.type_annotation and issubclass(self.type_annotation, BaseModel):
-            return {
-                "import json",
-                f"from {self.type_annotation.__module__} import {self.type_annotation.__name__}\n",
-            }
-        else:
-            return {"import json"}
+        imports = {"import json"}
+        model = self._model()
+        if model:
+            imports.add(f"from {model.__module__} import {model.__name__}\n")
+        return imports
 
     def artifact_path(self, parameter_name: str) -> str:
         return f"{self.file_prefix}/{parameter_name}.json"
@@ -33,6 +52,11 @@ class DefaultParameterBuilder(ParameterBuilder):
     def variable_from_input(
         self, parameter_name: str, variable_name: str, function: Callable
     ) -> str:
+        if is_iterator_annotation(self.type_annotation):
+            # the whole json list is loaded, only the items are built lazily
+            model = self._model()
+            item = f"{model.__name__}.parse_obj(item)" if model else "item"
+            return f"{variable_name}=({item} for item in json.loads('{{{{inputs.parameters.{parameter_name}}}}}'))"
         if self.type_annotation.__name__ == "_empty":
             raise ValueError(
                 "DefaultParameterBuilder uses type annotations to generate serializers for types, "
@@ -63,6 +87,16 @@ class DefaultParameterBuilder(ParameterBuilder):
     def variable_to_output(
         self, parameter_name: str, variable_name: str, function: Callable
     ) -> str:
+        if is_iterator_annotation(self.type_annotation):
+            # items are written as they are yielded, the task never holds the whole list
+            item = "item.json()" if self._model() else "json.dumps(item)"
+            return (
+                f"with open('{self.artifact_path(parameter_name)}', 'a') as file:\n"
+                + "  file.write('[')\n"
+                + f"  for index, item in enumerate({variable_name}):\n"
+                + f"    file.write((',' if index else '') + {item})\n"
+                + "  file.write(']')"
+            )
         if self.type_annotation and issubclass(self.type_annotation, BaseModel):
             return f"with open('{self.artifact_path(parameter_name)}', 'a') as file:\n  file.write({variable_name}.json())"
         else:
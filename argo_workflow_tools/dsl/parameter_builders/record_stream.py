@@ -0,0 +1,117 @@
+"""
+runtime side of StreamParameterBuilder, imported by the generated task scripts. items of a task
+result are written as json lines into shards of a fixed number of records, every full shard is
+uploaded to a store and removed, so the task holds a single shard at a time. the output parameter is
+the list of shard pointers, loops fan out over the shards and consumers read the records lazily.
+"""
+import json
+import os
+import tempfile
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from pydantic import BaseModel
+
+from argo_workflow_tools.dsl.parameter_builders.artifact_store import (
+    POINTER_KEY,
+    STORE_KEY,
+    store_from_url,
+)
+from argo_workflow_tools.dsl.parameter_builders.binary_codecs import COMPRESSIONS
+
+# number of records in a shard pointer
+COUNT_KEY = "count"
+COMPRESSION_KEY = "compression"
+
+
+def _open_text(path: str, mode: str, compression: Optional[str]):
+    if compression is None:
+        return open(path, mode)
+    return COMPRESSIONS[compression](path, f"{mode}t")
+
+
+def write_stream(
+    items: Iterable[Any],
+    output_path: str,
+    store_url: str,
+    key: str,
+    shard_size: int,
+    compression: Optional[str] = None,
+) -> None:
+    """
+    writes the items of a task result as json lines shards, uploading each shard when it is full
+    Parameters
+    ----------
+    items : the task result, usually a generator
+    output_path : file argo reads the output parameter, the shard pointers, from
+    store_url : url of the store shards are uploaded to
+    key : key prefix of the shards in the store
+    shard_size : number of records in a shard
+    compression : gzip, bz2, lzma or None
+    """
+    shards: List[Dict[str, Any]] = []
+    shard_path = f"{output_path}.shard"
+    shard_file = None
+    count = 0
+
+    def upload():
+        shard_file.close()
+        shard_key = f"{key}/{len(shards):05d}.jsonl"
+        store_from_url(store_url).upload(shard_path, shard_key)
+        os.remove(shard_path)
+        shards.append(
+            {
+                POINTER_KEY: shard_key,
+                STORE_KEY: store_url,
+                COUNT_KEY: count,
+                COMPRESSION_KEY: compression,
+            }
+        )
+
+    for item in items:
+        if shard_file is None:
+            shard_file = _open_text(shard_path, "w", compression)
+            count = 0
+        shard_file.write(item.json() if isinstance(item, BaseModel) else json.dumps(item))
+        shard_file.write("\n")
+        count += 1
+        if count == shard_size:
+            upload()
+            shard_file = None
+    if shard_file is not None:
+        upload()
+
+    with open(output_path, "w") as output_file:
+        json.dump(shards, output_file)
+
+
+def read_stream(raw: str, model: Optional[type] = None) -> Iterator[Any]:
+    """
+    iterates over the records of a task input, downloading one shard at a time
+    Parameters
+    ----------
+    raw : the parameter value, a list of shard pointers, a single shard in a loop or a json list
+    model : pydantic model to parse the records into
+
+    Returns
+    -------
+    iterator of the records
+    """
+    value = json.loads(raw)
+    shards = [value] if isinstance(value, dict) else value
+    for shard in shards:
+        if isinstance(shard, dict) and POINTER_KEY in shard:
+            records = _read_shard(shard)
+        else:
+            # plain items, e.g. a list passed as a workflow argument
+            records = [shard]
+        for record in records:
+            yield model.parse_obj(record) if model is not None else record
+
+
+def _read_shard(shard: Dict[str, Any]) -> Iterator[Any]:
+    with tempfile.TemporaryDirectory() as directory:
+        shard_path = os.path.join(directory, "shard.jsonl")
+        store_from_url(shard[STORE_KEY]).download(shard[POINTER_KEY], shard_path)
+        with _open_text(shard_path, "r", shard.get(COMPRESSION_KEY)) as shard_file:
+            for line in shard_file:
+                yield json.loads(line)
@@ -0,0 +1,88 @@
+from typing import Callable, Set
+
+from pydantic import BaseModel
+
+from argo_workflow_tools.dsl.parameter_builders.artifact_parameter_builder import (
+    DEFAULT_KEY,
+)
+from argo_workflow_tools.dsl.parameter_builders.binary_codecs import COMPRESSIONS
+from argo_workflow_tools.dsl.parameter_builders.parameter_builder import (
+    ParameterBuilder,
+)
+
+DEFAULT_SHARD_SIZE = 100000
+
+
+class StreamParameterBuilder(ParameterBuilder):
+    """
+    Streams the items of a task result, usually a generator, as json lines shards to an object store
+    and passes the list of shards as the parameter. set it on the producing output and on the
+    consuming inputs, consumers receive an iterator reading one shard at a time. loops over the
+    output fan out over the shards
+    """
+
+    def __init__(
+        self,
+        store_url: str,
+        type_annotation: type = None,
+        shard_size: int = DEFAULT_SHARD_SIZE,
+        compression: str = None,
+        key_prefix: str = "streams",
+        file_prefix: str = "/tmp",
+    ):
+        """
+        Parameters
+        ----------
+        store_url : `s3://bucket/prefix` (add `?endpoint_url=...` for MinIO) or `file:///path` of a shared volume
+        type_annotation : pydantic model to parse input records into, None for json records
+        shard_size : number of records in a shard, bounds the memory and the disk used by the producer
+        compression : gzip, bz2, lzma or None
+        key_prefix : prefix of the store keys
+        file_prefix : directory of the output parameter files
+        """
+        super().__init__()
+        if compression is not None and compression not in COMPRESSIONS:
+            raise ValueError(
+                f"unsupported compression '{compression}', expected one of {', '.join(COMPRESSIONS)}"
+            )
+        self.store_url = store_url
+        self.type_annotation = type_annotation
+        self.shard_size = shard_size
+        self.compression = compression
+        self.key_prefix = key_prefix
+        self.file_prefix = file_prefix
+
+    def _is_model(self) -> bool:
+        return isinstance(self.type_annotation, type) and issubclass(
+            self.type_annotation, BaseModel
+        )
+
+    def imports(self) -> Set[str]:
+        imports = {
+            "from argo_workflow_tools.dsl.parameter_builders.record_stream import read_stream, write_stream"
+        }
+        if self._is_model():
+            imports.add(
+                f"from {self.type_annotation.__module__} import {self.type_annotation.__name__}"
+            )
+        return imports
+
+    def artifact_path(self, parameter_name: str) -> str:
+        return f"{self.file_prefix}/{parameter_name}.json"
+
+    def variable_from_input(
+        self, parameter_name: str, variable_name: str, function: Callable
+    ) -> str:
+        model = self.type_annotation.__name__ if self._is_model() else "None"
+        return (
+            f"{variable_name} = read_stream(r'''{{{{inputs.parameters.{parameter_name}}}}}''', {model})"
+        )
+
+    def variable_to_output(
+        self, parameter_name: str, variable_name: str, function: Callable
+    ) -> str:
+        key = f"{self.key_prefix}/{DEFAULT_KEY}/{parameter_name}"
+        return (
+            f"write_stream({variable_name}, '{self.artifact_path(parameter_name)}', "
+            f"'{self.store_url}', '{key}', {self.shard_size}, {self.compression!r})"
+        )
@@ -0,0 +1,113 @@
+"""
+JSON serializable descriptions of what a compiled template depends on besides the code of its node,
+shared by the in memory compilation cache and the persistent ManifestCache.
+"""
+import dataclasses
+import enum
+import hashlib
+import inspect
+import json
+import types
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet
+
+from pydantic import BaseModel
+
+from argo_workflow_tools.dsl.utils.serialization import to_serializable
+
+PLAIN_TYPES = (str, int, float, bool, type(None))
+
+
+def content_hash(value: Any) -> str:
+    """
+    sha256 of a fingerprint
+    """
+    return hashlib.sha256(
+        json.dumps(value, sort_keys=True, default=repr).encode()
+    ).hexdigest()
+
+
+@lru_cache(maxsize=4096)
+def _global_names(code: types.CodeType) -> FrozenSet[str]:
+    names = set()
+    codes = [code]
+    while codes:
+        code = codes.pop()
+        names.update(code.co_names)
+        codes.extend(const for const in code.co_consts if isinstance(const, types.CodeType))
+    return frozenset(names)
+
+
+def global_constants(func: Callable) -> Dict[str, Any]:
+    """
+    module level constants the function reads, DAGs may be generated from them
+    """
+    module_globals = getattr(func, "__globals__", {})
+    return {
+        name: fingerprint(module_globals[name])
+        for name in sorted(_global_names(func.__code__))
+        if name in module_globals and is_plain(module_globals[name])
+    }
+
+
+def closure_values(func: Callable) -> Dict[str, Any]:
+    """
+    plain values the function reads from enclosing functions, e.g. arguments of a node factory
+    """
+    cells = getattr(func, "__closure__", None) or ()
+    values = {}
+    for name, cell in zip(func.__code__.co_freevars, cells):
+        try:
+            value = cell.cell_contents
+        except ValueError:  # not assigned yet
+            continue
+        if is_plain(value):
+            values[name] = fingerprint(value)
+    return values
+
+
+def is_plain(value: Any) -> bool:
+    if isinstance(value, PLAIN_TYPES):
+        return True
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return all(is_plain(item) for item in value)
+    if isinstance(value, dict):
+        return all(is_plain(key) and is_plain(item) for key, item in value.items())
+    return False
+
+
+def qualified_name(value: Any) -> str:
+    return f"{getattr(value, '__module__', None)}.{getattr(value, '__qualname__', repr(value))}"
+
+
+def fingerprint(value: Any) -> Any:
+    """
+    a JSON serializable description of a value that is stable across processes
+    """
+    if isinstance(value, PLAIN_TYPES):
+        return value
+    if isinstance(value, enum.Enum):
+        return fingerprint(value.value)
+    if isinstance(value, BaseModel):
+        return to_serializable(value)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {
+            field.name: fingerprint(getattr(value, field.name))
+            for field in dataclasses.fields(value)
+        }
+    if isinstance(value, dict):
+        return [[fingerprint(key), fingerprint(item)] for key, item in value.items()]
+    if isinstance(value, (list, tuple)):
+        return [fingerprint(item) for item in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted((fingerprint(item) for item in value), key=repr)
+    if isinstance(value, type) or inspect.isroutine(value):
+        return qualified_name(value)
+    if isinstance(value, types.ModuleType):
+        return value.__name__
+    if hasattr(value, "__dict__"):
+        return {
+            "type": qualified_name(type(value)),
+            "attributes": {name: fingerprint(item) for name, item in sorted(vars(value).items())},
+        }
+    return repr(value)
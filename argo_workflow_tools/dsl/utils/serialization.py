@@ -0,0 +1,55 @@
+"""
+single pass serialization of the generated argo models. equivalent to
+delete_none(model.dict(by_alias=True)), without materialising the None fields of the models first.
+"""
+import json
+from typing import Any
+
+import yaml
+from pydantic import BaseModel
+
+
+ROOT_KEY = "__root__"
+
+# the libyaml emitter loads back to the same documents as yaml.Dumper (long strings may be folded
+# at different points) and is several times faster
+YamlDumper = getattr(yaml, "CDumper", yaml.Dumper)
+
+
+def to_serializable(value: Any) -> Any:
+    """
+    converts models into plain dictionaries keyed by field alias, dropping None values
+    Parameters
+    ----------
+    value : pydantic model, or a container of models
+
+    Returns
+    -------
+    plain python value
+    """
+    if isinstance(value, BaseModel):
+        fields = value.__fields__
+        if ROOT_KEY in fields:
+            return to_serializable(value.__dict__[ROOT_KEY])
+        serialized = {}
+        for name, field_value in value.__dict__.items():
+            if field_value is None:
+                continue
+            field = fields.get(name)
+            serialized[field.alias if field else name] = to_serializable(field_value)
+        return serialized
+    if isinstance(value, dict):
+        return {
+            key: to_serializable(item) for key, item in value.items() if item is not None
+        }
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return value.__class__(to_serializable(item) for item in value)
+    return value
+
+
+def dump_yaml(data: Any) -> str:
+    return yaml.dump(data, Dumper=YamlDumper)
+
+
+def dump_json(data: Any, indent: int = None) -> str:
+    return json.dumps(data, indent=indent, default=str)
@@ -1,4 +1,6 @@
-from typing import Union, List, Dict, Tuple, Callable
+from typing import Any, Optional, Union, List, Dict, Tuple, Callable, TypeVar
+import collections.abc
+import importlib
 import json
 import hashlib
 import shortuuid
@@ -91,6 +93,48 @@ def generate_template_name_from_func(func: Callable, snake_case=False) -> str:
     return f'{sanitized}-{hash_value}'
 
 
+def node_import_path(node: Any) -> Optional[Tuple[str, str]]:
+    """
+    (module, qualified name) a decorated node can be imported from in another process, None if it
+    is not reachable as a module attribute, e.g. when it was created inside a function
+    """
+    func = node.func
+    module_name, qualname = func.__module__, func.__qualname__
+    if module_name == "__main__" or "<locals>" in qualname:
+        return None
+    try:
+        resolved = resolve_import_path((module_name, qualname))
+    except (ImportError, AttributeError):
+        return None
+    return (module_name, qualname) if resolved is node else None
+
+
+def resolve_import_path(import_path: Tuple[str, str]) -> Any:
+    module_name, qualname = import_path
+    resolved = importlib.import_module(module_name)
+    for attribute in qualname.split("."):
+        resolved = getattr(resolved, attribute)
+    return resolved
+
+
+def is_iterator_annotation(annotation: Any) -> bool:
+    """
+    whether a type annotation is an Iterator or a Generator, e.g. of a task yielding its result
+    """
+    origin = getattr(annotation, "__origin__", annotation)
+    return isinstance(origin, type) and issubclass(origin, collections.abc.Iterator)
+
+
+def iterator_item_annotation(annotation: Any) -> Any:
+    """
+    the item type of an Iterator or Generator annotation, None when it is not set
+    """
+    args = getattr(annotation, "__args__", None)
+    if not args or isinstance(args[0], TypeVar):
+        return None
+    return args[0]
+
+
 def convert_str(value: any) -> str:
     if value is None:
         return None
@@ -1,10 +1,13 @@
 from typing import Callable, Any
 from typing import Dict, List, Union
-import yaml
 
 from argo_workflow_tools.dsl.dag_compiler import compile_dag
+from argo_workflow_tools.dsl.utils.serialization import (
+    dump_json,
+    dump_yaml,
+    to_serializable,
+)
 from argo_workflow_tools.dsl.utils.utils import (
-    delete_none,
     get_arguments,
     sanitize_name,
 )
@@ -75,13 +78,19 @@ class WorkflowTemplate:
         """
         convert workflow to dictionary
         """
-        return delete_none(self.to_model(embed_workflow_templates).dict(by_alias=True))
+        return to_serializable(self.to_model(embed_workflow_templates))
 
     def to_yaml(self, embed_workflow_templates: bool = False) -> str:
         """
         convert workflow to yaml
         """
-        return yaml.dump(self.to_dict(embed_workflow_templates))
+        return dump_yaml(self.to_dict(embed_workflow_templates))
+
+    def to_json(self, embed_workflow_templates: bool = False, indent: int = None) -> str:
+        """
+        convert workflow to json
+        """
+        return dump_json(self.to_dict(embed_workflow_templates), indent)
 
 
 class CronWorkflow:
@@ -156,13 +165,19 @@ class CronWorkflow:
         """
         convert workflow to dictionary
         """
-        return delete_none(self.to_model(embed_workflow_templates).dict(by_alias=True))
+        return to_serializable(self.to_model(embed_workflow_templates))
 
     def to_yaml(self, embed_workflow_templates: bool = False) -> str:
         """
-        convert workflow to dictionary
+        convert workflow to yaml
+        """
+        return dump_yaml(self.to_dict(embed_workflow_templates))
+
+    def to_json(self, embed_workflow_templates: bool = False, indent: int = None) -> str:
+        """
+        convert workflow to json
         """
-        return yaml.dump(self.to_dict(embed_workflow_templates))
+        return dump_json(self.to_dict(embed_workflow_templates), indent)
 
 
 class Workflow:
@@ -214,10 +229,16 @@ class Workflow:
         """
         convert workflow to dictionary
         """
-        return delete_none(self.to_model(embed_workflow_templates).dict(by_alias=True))
+        return to_serializable(self.to_model(embed_workflow_templates))
 
     def to_yaml(self, embed_workflow_templates: bool = False) -> str:
         """
-        convert workflow to dictionary
+        convert workflow to yaml
+        """
+        return dump_yaml(self.to_dict(embed_workflow_templates))
+
+    def to_json(self, embed_workflow_templates: bool = False, indent: int = None) -> str:
+        """
+        convert workflow to json
         """
-        return yaml.dump(self.to_dict(embed_workflow_templates))
+        return dump_json(self.to_dict(embed_workflow_templates), indent)
@@ -1,5 +1,17 @@
+import contextlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Iterable, List, Tuple
+
 from argo_workflow_tools.dsl.workflow import WorkflowTemplate
 from argo_workflow_tools.dsl.node import WorkflowTemplateNode
+from argo_workflow_tools.dsl.utils.utils import node_import_path, resolve_import_path
+
+OUTPUT_MODEL = "model"
+OUTPUT_DICT = "dict"
+OUTPUT_YAML = "yaml"
+OUTPUT_JSON = "json"
+OUTPUTS = (OUTPUT_MODEL, OUTPUT_DICT, OUTPUT_YAML, OUTPUT_JSON)
 
 
 def compile_workflow(workflow_template_node: WorkflowTemplateNode) -> WorkflowTemplate:
@@ -15,3 +27,78 @@ def compile_workflow(workflow_template_node: WorkflowTemplateNode) -> WorkflowTe
         workflow_annotations=workflow_template_node.properties.workflow_annotations,
     )
     return workflow_template
+
+
+def _render(
+    workflow_template_node: WorkflowTemplateNode, output: str, embed_workflow_templates: bool
+) -> Any:
+    workflow_template = compile_workflow(workflow_template_node)
+    if output == OUTPUT_MODEL:
+        return workflow_template.to_model(embed_workflow_templates)
+    if output == OUTPUT_DICT:
+        return workflow_template.to_dict(embed_workflow_templates)
+    if output == OUTPUT_YAML:
+        return workflow_template.to_yaml(embed_workflow_templates)
+    return workflow_template.to_json(embed_workflow_templates)
+
+
+def _compile_imported(
+    import_path: Tuple[str, str], output: str, embed_workflow_templates: bool
+) -> Any:
+    return _render(resolve_import_path(import_path), output, embed_workflow_templates)
+
+
+def compile_all(
+    workflow_template_nodes: Iterable[WorkflowTemplateNode],
+    workers: int = None,
+    output: str = OUTPUT_MODEL,
+    embed_workflow_templates: bool = False,
+) -> List[Any]:
+    """
+    compiles many workflow templates concurrently in a process pool
+    Parameters
+    ----------
+    workflow_template_nodes : functions decorated by the WorkflowTemplate decorator. templates are compiled
+        in worker processes which import them by name, templates that are not module attributes are
+        compiled in the calling process
+    workers : number of worker processes, defaults to the number of cpus. 1 compiles in the calling process
+    output : "model" for argo.WorkflowTemplate models, "dict", "yaml" or "json"
+    embed_workflow_templates : boolean that determines whether to compile workflow template inline or use templateRefs
+
+    Returns
+    -------
+    compiled templates, in the order of workflow_template_nodes
+    """
+    if output not in OUTPUTS:
+        raise ValueError(f"unknown output '{output}', expected one of {list(OUTPUTS)}")
+    nodes = list(workflow_template_nodes)
+    for node in nodes:
+        if not isinstance(node, WorkflowTemplateNode):
+            raise ValueError(
+                f"{getattr(node, '__name__', node)} is not decorated with WorkflowTemplate decorator"
+            )
+    workers = workers or os.cpu_count() or 1
+    import_paths = [node_import_path(node) for node in nodes] if workers > 1 else [None] * len(nodes)
+    importable = [index for index, import_path in enumerate(import_paths) if import_path]
+
+    results: List[Any] = [None] * len(nodes)
+    with contextlib.ExitStack() as stack:
+        compiled = []
+        if importable:
+            executor = stack.enter_context(
+                ProcessPoolExecutor(max_workers=min(workers, len(importable)))
+            )
+            compiled = executor.map(
+                _compile_imported,
+                [import_paths[index] for index in importable],
+                [output] * len(importable),
+                [embed_workflow_templates] * len(importable),
+                chunksize=max(1, len(importable) // (workers * 4)),
+            )
+        # templates the workers can't import compile here while the workers are busy
+        for index, node in enumerate(nodes):
+            if not import_paths[index]:
+                results[index] = _render(node, output, embed_workflow_templates)
+        for index, result in zip(importable, compiled):
+            results[index] = result
+    return results
@@ -1,5 +1,5 @@
 from contextvars import ContextVar
-from typing import List
+from typing import Any, Dict, List, NamedTuple
 
 from argo_workflow_tools.dsl.dag_task import NodeReference
 from argo_workflow_tools.models.io.argoproj.workflow.v1alpha1 import Template
@@ -45,20 +45,53 @@ def collect_conditions() -> any:
     return _conditions.get([]).copy()
 
 
-_workflow_templates: ContextVar[List[Template]] = ContextVar("workflow_templates")
+class _RegisteredTemplate(NamedTuple):
+    template: Template
+    origin: Any
 
 
-def add_template(template: Template) -> None:
+# keyed by template name, dicts keep insertion order so templates are collected in the order they were added
+_workflow_templates: ContextVar[Dict[str, _RegisteredTemplate]] = ContextVar(
+    "workflow_templates"
+)
+
+
+def _describe_origin(origin: Any) -> str:
+    func = getattr(origin, "func", origin)
+    return f"{getattr(func, '__module__', '')}.{getattr(func, '__qualname__', repr(func))}"
+
+
+def add_template(template: Template, origin: Any = None) -> None:
     """
     add template to the current workflow compilation flow
     Parameters
     ----------
     template : called template reference
+    origin : the node the template was built from, a template name generated by two different
+        nodes, or with two different definitions, is an error
     """
-    templates = _workflow_templates.get([])
-    if template.name in map(lambda t: t.name, templates):
+    templates = _workflow_templates.get({})
+    registered = templates.get(template.name)
+    if registered is not None:
+        if (
+            origin is not None
+            and registered.origin is not None
+            and origin is not registered.origin
+        ):
+            raise ValueError(
+                f"template name '{template.name}' is generated by both "
+                f"{_describe_origin(registered.origin)} and {_describe_origin(origin)}, "
+                f"templates are named after their function, rename one of them"
+            )
+        if registered.template is not template and registered.template != template:
+            raise ValueError(
+                f"template name '{template.name}' is generated with two different definitions"
+                f"{'' if origin is None else ' by ' + _describe_origin(origin)}, "
+                f"the template of a task depends on the arguments it is called with, "
+                f"pass the same arguments in every call"
+            )
         return
-    templates.append(template)
+    templates[template.name] = _RegisteredTemplate(template, origin)
     _workflow_templates.set(templates)
 
 
@@ -66,8 +99,8 @@ def collect_templates() -> List[Template]:
     """
     return collected templates in the current workflow context
     """
-    return _workflow_templates.get([])
+    return [registered.template for registered in _workflow_templates.get({}).values()]
 
 
 def clear():
-    _workflow_templates.set([])
+    _workflow_templates.set({})
@@ -0,0 +1,2 @@
+class WorkflowTimeoutException(TimeoutError):
+    pass
@@ -0,0 +1,84 @@
+import random
+from abc import ABC, abstractmethod
+from typing import Optional
+
+PENDING_PHASES = (None, "", "Pending")
+
+
+class PollingStrategy(ABC):
+    """decides how long to wait before the next workflow status poll"""
+
+    @abstractmethod
+    def next_interval(self, attempt: int, elapsed: float, phase: Optional[str]) -> float:
+        """
+        Parameters
+        ----------
+        attempt : number of polls made so far while waiting, starting at 0
+        elapsed : seconds since waiting started
+        phase : last known workflow phase
+
+        Returns
+        -------
+        seconds to wait before the next poll
+        """
+        pass
+
+
+class FixedPollingStrategy(PollingStrategy):
+    def __init__(self, interval: float):
+        self.interval = interval
+
+    def next_interval(self, attempt: int, elapsed: float, phase: Optional[str]) -> float:
+        return self.interval
+
+
+class ExponentialBackoffPollingStrategy(PollingStrategy):
+    def __init__(
+        self,
+        initial_interval: float = 1.0,
+        max_interval: float = 60.0,
+        multiplier: float = 2.0,
+        jitter: float = 0.1,
+    ):
+        """
+        Parameters
+        ----------
+        initial_interval : interval before the first poll
+        max_interval : upper bound of the interval
+        multiplier : interval growth factor between polls
+        jitter : relative random spread added to every interval, avoids polling in lockstep
+        """
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.multiplier = multiplier
+        self.jitter = jitter
+
+    def next_interval(self, attempt: int, elapsed: float, phase: Optional[str]) -> float:
+        interval = min(self.initial_interval * self.multiplier ** attempt, self.max_interval)
+        return interval * (1 + random.uniform(-self.jitter, self.jitter))
+
+
+class PhaseAwarePollingStrategy(PollingStrategy):
+    def __init__(
+        self,
+        fast_interval: float = 1.0,
+        running_interval: float = 20.0,
+        fast_period: float = 30.0,
+    ):
+        """
+        polls quickly while the workflow is pending or was just submitted, and slowly once
+        it has been running for a while
+        Parameters
+        ----------
+        fast_interval : interval while pending and during the fast period
+        running_interval : interval while running after the fast period
+        fast_period : seconds after waiting started in which fast_interval is used
+        """
+        self.fast_interval = fast_interval
+        self.running_interval = running_interval
+        self.fast_period = fast_period
+
+    def next_interval(self, attempt: int, elapsed: float, phase: Optional[str]) -> float:
+        if phase in PENDING_PHASES or elapsed < self.fast_period:
+            return self.fast_interval
+        return self.running_interval
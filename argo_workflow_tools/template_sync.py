@@ -0,0 +1,171 @@
+import re
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional
+
+from pydantic import BaseModel
+
+from argo_workflow_tools.dsl.utils.serialization import to_serializable
+
+CREATED = "created"
+UPDATED = "updated"
+UNCHANGED = "unchanged"
+
+# metadata compared with the deployed template, the server adds labels and annotations of its own
+# so only the ones set by the template are compared
+COMPARED_METADATA = ("labels", "annotations")
+
+
+class TemplateSyncResult(NamedTuple):
+    """outcome of syncing a single workflow template with ArgoClient.sync_templates"""
+
+    name: str
+    namespace: str
+    action: str
+    # paths of the fields that differ from the deployed template, e.g. spec.templates[2].script.source
+    changes: List[str]
+
+
+def compile_manifests(
+    templates: Iterable[Any], embed_workflow_templates: bool = False, workers: int = 1
+) -> List[dict]:
+    """
+    converts templates into WorkflowTemplate manifests
+    Parameters
+    ----------
+    templates : functions decorated by the WorkflowTemplate decorator, dsl WorkflowTemplate objects,
+        argo WorkflowTemplate models or manifest dictionaries
+    embed_workflow_templates : boolean that determines whether to compile workflow template inline or use templateRefs
+    workers : number of processes compiling decorated functions, see compile_all
+
+    Returns
+    -------
+    manifests, in the order of templates
+    """
+    templates = list(templates)
+    manifests: List[Optional[dict]] = [None] * len(templates)
+    decorated = []
+    for index, template in enumerate(templates):
+        if isinstance(template, dict):
+            manifests[index] = template
+        elif isinstance(template, BaseModel):
+            manifests[index] = to_serializable(template)
+        elif hasattr(template, "to_dict"):
+            manifests[index] = template.to_dict(embed_workflow_templates)
+        else:
+            decorated.append(index)
+
+    if decorated:
+        # the DSL is only imported when there is something to compile
+        from argo_workflow_tools.dsl.workflow_compiler import OUTPUT_DICT, compile_all
+
+        compiled = compile_all(
+            [templates[index] for index in decorated],
+            workers=workers,
+            output=OUTPUT_DICT,
+            embed_workflow_templates=embed_workflow_templates,
+        )
+        for index, manifest in zip(decorated, compiled):
+            manifests[index] = manifest
+    return manifests
+
+
+def diff_templates(desired: dict, deployed: dict) -> List[str]:
+    """
+    structural diff of a compiled WorkflowTemplate manifest and the deployed template
+    Parameters
+    ----------
+    desired : compiled manifest
+    deployed : template returned by the argo server
+
+    Returns
+    -------
+    paths of the fields that differ, empty when the deployed template is up to date
+    """
+    changes = _diff(
+        _canonical_task_names(_normalize(desired.get("spec"))),
+        _canonical_task_names(_normalize(deployed.get("spec"))),
+        "spec",
+    )
+    desired_metadata = desired.get("metadata") or {}
+    deployed_metadata = deployed.get("metadata") or {}
+    for field in COMPARED_METADATA:
+        deployed_values = deployed_metadata.get(field) or {}
+        changes.extend(
+            f"metadata.{field}.{key}"
+            for key, value in (desired_metadata.get(field) or {}).items()
+            if deployed_values.get(key) != value
+        )
+    return changes
+
+
+def _normalize(value: Any) -> Any:
+    """
+    drops None values and empty containers, the server omits them
+    """
+    if isinstance(value, dict):
+        normalized = {key: _normalize(item) for key, item in value.items()}
+        return {key: item for key, item in normalized.items() if item not in (None, {}, [])}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(item) for item in value]
+    return value
+
+
+def _canonical_task_names(spec: Any) -> Any:
+    """
+    renames the tasks of every DAG template by position. the compiler names DAG tasks with a random
+    suffix, so two compilations of the same template differ only by task names
+    """
+    if not isinstance(spec, dict):
+        return spec
+    templates = []
+    for template in spec.get("templates", []):
+        tasks = (template.get("dag") or {}).get("tasks") or []
+        names = {task["name"]: f"task-{index}" for index, task in enumerate(tasks)}
+        if names:
+            pattern = re.compile(
+                r"(?<![\w-])(" + "|".join(map(re.escape, names)) + r")(?![\w-])"
+            )
+            template = _replace_strings(
+                template, lambda text: pattern.sub(lambda match: names[match.group(1)], text)
+            )
+        templates.append(template)
+    return {**spec, "templates": templates} if "templates" in spec else spec
+
+
+def _replace_strings(value: Any, replace) -> Any:
+    if isinstance(value, str):
+        return replace(value)
+    if isinstance(value, dict):
+        return {key: _replace_strings(item, replace) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_replace_strings(item, replace) for item in value]
+    return value
+
+
+def _diff(desired: Any, deployed: Any, path: str) -> List[str]:
+    if isinstance(desired, dict) and isinstance(deployed, dict):
+        changes = []
+        for key in sorted(desired.keys() | deployed.keys()):
+            if key not in desired or key not in deployed:
+                changes.append(f"{path}.{key}")
+            else:
+                changes.extend(_diff(desired[key], deployed[key], f"{path}.{key}"))
+        return changes
+    if isinstance(desired, list) and isinstance(deployed, list):
+        changes = []
+        for index in range(max(len(desired), len(deployed))):
+            if index >= len(desired) or index >= len(deployed):
+                changes.append(f"{path}[{index}]")
+            else:
+                changes.extend(_diff(desired[index], deployed[index], f"{path}[{index}]"))
+        return changes
+    return [] if desired == deployed else [path]
+
+
+def index_templates(template_list: Dict[str, Any]) -> Dict[str, dict]:
+    """
+    deployed templates of a list response by name
+    """
+    return {
+        template["metadata"]["name"]: template
+        for template in template_list.get("items") or []
+    }
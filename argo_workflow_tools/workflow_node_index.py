@@ -0,0 +1,77 @@
+from collections import defaultdict
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+def _template_name(node: dict) -> Optional[str]:
+    if node.get("templateName"):
+        return node["templateName"]
+    template_ref = node.get("templateRef")
+    if template_ref:
+        return template_ref.get("template")
+    return None
+
+
+class WorkflowNodeIndex:
+    """
+    Indexed view of a workflow's status nodes, keyed by node id, display name, template name
+    and phase. built in a single pass, every lookup is a dictionary access.
+    """
+
+    def __init__(self, workflow_name: str, nodes: Iterable[Tuple[str, dict]]):
+        self._workflow_name = workflow_name
+        self._by_id: Dict[str, dict] = {}
+        self._by_display_name: Dict[str, List[dict]] = defaultdict(list)
+        self._by_template_name: Dict[str, List[dict]] = defaultdict(list)
+        self._by_phase: Dict[str, List[dict]] = defaultdict(list)
+        for node_id, node in nodes:
+            self._by_id[node_id] = node
+            self._by_display_name[node.get("displayName")].append(node)
+            self._by_template_name[_template_name(node)].append(node)
+            self._by_phase[node.get("phase")].append(node)
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    @property
+    def root(self) -> Optional[dict]:
+        """
+        the entrypoint node, argo names the root node after the workflow
+        """
+        return self._by_id.get(self._workflow_name)
+
+    def get(self, node_id: str) -> Optional[dict]:
+        return self._by_id.get(node_id)
+
+    def by_display_name(self, display_name: str) -> List[dict]:
+        return self._by_display_name.get(display_name, [])
+
+    def by_template_name(self, template_name: str) -> List[dict]:
+        return self._by_template_name.get(template_name, [])
+
+    def find(self, name: str) -> Optional[dict]:
+        """
+        resolves a node by id, display name or template name, in that order
+        Parameters
+        ----------
+        name : node id, task display name or template name
+
+        Returns
+        -------
+        the matching node, None if there is no match
+        """
+        node = self._by_id.get(name)
+        if node is not None:
+            return node
+        for candidates in (self.by_display_name(name), self.by_template_name(name)):
+            if len(candidates) > 1:
+                raise ValueError(
+                    f"'{name}' matches {len(candidates)} workflow nodes, reference the node by its id instead"
+                )
+            if candidates:
+                return candidates[0]
+        return None
+
+    def iter_nodes(self, phase: str = None) -> Iterator[dict]:
+        if phase is None:
+            return iter(self._by_id.values())
+        return iter(self._by_phase.get(phase, []))
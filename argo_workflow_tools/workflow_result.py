@@ -1,4 +1,4 @@
-from typing import Dict, Union
+from typing import Dict, Iterator, Union
 
 from argo_workflow_tools.artifact import Artifact
 from argo_workflow_tools.workflow_status import WorkflowStatus
@@ -32,8 +32,8 @@ class WorkflowResult:
         self.status = workflow_status
         self.workflow_status_checker = workflow_status_checker
 
-    def wait_for_completion(self, timeout=None):
-        self.workflow_status_checker.wait_for_completion(timeout)
+    def wait_for_completion(self, timeout=None, mode: str = "poll"):
+        self.workflow_status_checker.wait_for_completion(timeout, mode)
         self.status = WorkflowStatus.value_of(
             self.workflow_status_checker.current_phase
         )
@@ -76,10 +76,29 @@ class WorkflowResult:
         if self.status is None or self.status == WorkflowStatus.Running:
             return {}
         else:
-            return self._get_outputs(
-                list(
-                    self.workflow_status_checker.workflow_current_status_data_dict[
-                        "status"
-                    ]["nodes"].values()
-                )[0]["outputs"]
-            )
+            entrypoint_node = self.workflow_status_checker.entrypoint_node or {}
+            return self._get_outputs(entrypoint_node.get("outputs") or {})
+
+    def node_outputs(self, task_name: str) -> Dict[str, Union[str, Artifact]]:
+        """
+        outputs of a single workflow node
+        Args:
+            task_name (str): node id, task display name or template name
+
+        Returns:
+            Dict[str, Union[str, Artifact]]: node output parameters and artifacts
+        """
+        node = self.workflow_status_checker.node_index.find(task_name)
+        if node is None:
+            raise KeyError(f"workflow {self.workflow_name} has no node named '{task_name}'")
+        return self._get_outputs(node.get("outputs") or {})
+
+    def iter_nodes(self, phase: Union[str, WorkflowStatus] = None) -> Iterator[dict]:
+        """
+        iterates the workflow's status nodes
+        Args:
+            phase (Union[str, WorkflowStatus], optional): only nodes in this phase. Defaults to None.
+        """
+        return self.workflow_status_checker.node_index.iter_nodes(
+            phase.value if isinstance(phase, WorkflowStatus) else phase
+        )
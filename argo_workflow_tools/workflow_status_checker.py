@@ -1,11 +1,58 @@
 import time
-from typing import Optional
+from typing import Callable, Iterable, Iterator, Optional, Tuple
 
+from argo_workflow_tools import workflow_stream_parser
 from argo_workflow_tools.argo_http_client import ArgoHttpClient
+from argo_workflow_tools.exceptions.workflow_timeout_exception import (
+    WorkflowTimeoutException,
+)
+from argo_workflow_tools.polling_strategy import FixedPollingStrategy, PollingStrategy
 from argo_workflow_tools.terminal_loading_animation import TerminalLoadingAnimation
+from argo_workflow_tools.workflow_node_index import WorkflowNodeIndex
 
 POLLING_INTERVAL_SECONDS = 20.0
 RUNNING_PHASE = "Running"
+PENDING_PHASE = "Pending"
+# polling only needs the phase, the full workflow (including status.nodes) is fetched on demand
+STATUS_FIELDS = "metadata.name,metadata.resourceVersion,spec.suspend,status.phase"
+WATCH_FIELDS = ",".join(
+    ["result.type"] + [f"result.object.{field}" for field in STATUS_FIELDS.split(",")]
+)
+POLL_MODE = "poll"
+WATCH_MODE = "watch"
+
+
+def _get_workflow_phase(workflow: dict) -> Optional[str]:
+    if (workflow.get("spec") or {}).get("suspend", False):
+        return "Suspended"
+    return (workflow.get("status") or {}).get("phase", None)
+
+
+def _is_running(phase: Optional[str]) -> bool:
+    return not phase or phase.lower() in (RUNNING_PHASE.lower(), PENDING_PHASE.lower())
+
+
+def _next_poll_delay(
+    polling_strategy: PollingStrategy,
+    attempt: int,
+    started: float,
+    phase: Optional[str],
+    timeout: Optional[float],
+    workflow_name: str,
+) -> float:
+    """
+    seconds to wait before the next poll, capped by the remaining timeout
+    """
+    elapsed = time.monotonic() - started
+    delay = polling_strategy.next_interval(attempt, elapsed, phase)
+    if timeout is None:
+        return delay
+    remaining = timeout - elapsed
+    if remaining <= 0:
+        raise WorkflowTimeoutException(
+            f"workflow {workflow_name} is still {phase} after {timeout} seconds"
+        )
+    return min(delay, remaining)
 
 
 class WorkflowStatusChecker:
@@ -14,41 +61,172 @@ class WorkflowStatusChecker:
         _argo_http_client: ArgoHttpClient,
         workflow_namespace: str,
         workflow_name: str,
+        polling_strategy: PollingStrategy = None,
     ):
         self._argo_http_client = _argo_http_client
+        self._polling_strategy = polling_strategy or FixedPollingStrategy(
+            POLLING_INTERVAL_SECONDS
+        )
         self._workflow_namespace = workflow_namespace
         self._workflow_name = workflow_name
         self._current_phase = None
+        self._resource_version = None
+        self._workflow_data = None
+        self._entrypoint_node = None
+        self._node_index = None
+
+    def _update(self, workflow: dict) -> None:
+        self._current_phase = _get_workflow_phase(workflow)
+        self._resource_version = (workflow.get("metadata") or {}).get("resourceVersion")
+        self._workflow_data = None
+        self._entrypoint_node = None
+        self._node_index = None
 
     def sync(self) -> None:
         # using the default value _preload_content=True causes some s3 credentials errors, so
         # working with the raw rest api responses will do
         workflow_current_status_response = self._argo_http_client.get_workflow(
-            namespace=self._workflow_namespace, name=self._workflow_name, with_retries=True
+            namespace=self._workflow_namespace,
+            name=self._workflow_name,
+            with_retries=True,
+            fields=STATUS_FIELDS,
         )
 
-        self._current_phase = workflow_current_status_response["status"].get(
-            "phase", None
-        )
-        if workflow_current_status_response["spec"].get("suspend", False):
-            self._current_phase = "Suspended"
-        self.workflow_current_status_data_dict = workflow_current_status_response
+        self._update(workflow_current_status_response)
+
+    @property
+    def workflow_current_status_data_dict(self) -> dict:
+        """
+        the full workflow object, fetched once after the last sync
+        """
+        if self._workflow_data is None:
+            self._workflow_data = self._argo_http_client.get_workflow(
+                namespace=self._workflow_namespace,
+                name=self._workflow_name,
+                with_retries=True,
+            )
+        return self._workflow_data
+
+    def iter_nodes(
+        self, node_ids: Iterable[str] = None, predicate: Callable[[dict], bool] = None
+    ) -> Iterator[Tuple[str, dict]]:
+        """
+        iterates the workflow's status nodes. when the streaming extra is installed and the full
+        workflow was not fetched yet, nodes are parsed incrementally from the response stream
+        Parameters
+        ----------
+        node_ids : only return these nodes
+        predicate : filter applied to every node
+        """
+        if self._workflow_data is not None or not workflow_stream_parser.is_available():
+            nodes = (self.workflow_current_status_data_dict.get("status") or {}).get("nodes") or {}
+            if node_ids is not None:
+                nodes = {node_id: nodes[node_id] for node_id in node_ids if node_id in nodes}
+            for node_id, node in nodes.items():
+                if predicate is None or predicate(node):
+                    yield node_id, node
+            return
 
-    def wait_for_completion(self, timeout=None):
+        with self._argo_http_client.open_workflow_stream(
+            self._workflow_namespace, self._workflow_name, with_retries=True
+        ) as stream:
+            yield from workflow_stream_parser.iter_nodes(stream, node_ids, predicate)
+
+    @property
+    def node_index(self) -> WorkflowNodeIndex:
+        """
+        index of the workflow's status nodes, built once after the last sync
+        """
+        if self._node_index is None:
+            self._node_index = WorkflowNodeIndex(self._workflow_name, self.iter_nodes())
+        return self._node_index
+
+    @property
+    def entrypoint_node(self) -> Optional[dict]:
+        """
+        the workflow's root node, whose id is the workflow name
+        """
+        if self._node_index is not None:
+            return self._node_index.root
+        if self._entrypoint_node is None:
+            self._entrypoint_node = next(
+                (node for _, node in self.iter_nodes(node_ids=[self._workflow_name])), None
+            )
+        return self._entrypoint_node
+
+    def wait_for_completion(self, timeout=None, mode: str = POLL_MODE):
+        """
+        block until the workflow stops running
+        Parameters
+        ----------
+        timeout : maximum number of seconds to wait, waits forever if None
+        mode : "poll" to poll the workflow status, or "watch" to follow the argo server's
+            workflow event stream and return as soon as the phase changes
+
+        Returns
+        -------
+        final workflow phase
+        """
+        if mode not in (POLL_MODE, WATCH_MODE):
+            raise ValueError(f"unknown wait mode '{mode}', use '{POLL_MODE}' or '{WATCH_MODE}'")
+        started = time.monotonic()
+        attempt = 0
         with TerminalLoadingAnimation.open(
             loading_title="workflow is still running"
         ) as loading_animation:
-            while (
-                self.current_phase is None
-                or self.current_phase.lower() == RUNNING_PHASE.lower()
-            ):
+            while _is_running(self.current_phase):
                 loading_animation.update()
-                time.sleep(POLLING_INTERVAL_SECONDS)
-                self.sync()
+                if mode == WATCH_MODE:
+                    self._watch(started, timeout, loading_animation)
+                    if not _is_running(self.current_phase):
+                        break
+                time.sleep(
+                    _next_poll_delay(
+                        self._polling_strategy,
+                        attempt,
+                        started,
+                        self.current_phase,
+                        timeout,
+                        self._workflow_name,
+                    )
+                )
+                attempt += 1
+                if mode == POLL_MODE:
+                    self.sync()
 
         workflow_final_phase = self.current_phase
         return workflow_final_phase
 
+    def _watch(self, started: float, timeout: Optional[float], loading_animation) -> None:
+        """
+        follows the workflow event stream until the workflow stops running or the stream ends,
+        a dropped stream returns early and is resumed by the caller after a polling delay.
+        reads wait at most for the remaining timeout
+        """
+        remaining = None if timeout is None else timeout - (time.monotonic() - started)
+        if remaining is not None and remaining <= 0:
+            return
+        for event in self._argo_http_client.watch_workflow(
+            self._workflow_namespace,
+            self._workflow_name,
+            resource_version=self._resource_version,
+            fields=WATCH_FIELDS,
+            timeout=remaining,
+        ):
+            if "error" in event:
+                # e.g. an expired resourceVersion, resynchronize and watch from now on
+                self.sync()
+                return
+            self._update(event["result"]["object"])
+            loading_animation.update()
+            if not _is_running(self.current_phase):
+                return
+            # a workflow emitting events keeps the stream alive, the read timeout never fires
+            if timeout is not None and time.monotonic() - started >= timeout:
+                raise WorkflowTimeoutException(
+                    f"workflow {self._workflow_name} is still {self.current_phase} after {timeout} seconds"
+                )
+
     def stop(self):
         self._argo_http_client.workflow_stop(
             self._workflow_namespace, self._workflow_name
@@ -76,3 +254,11 @@ class WorkflowStatusChecker:
     @property
     def current_phase(self) -> Optional[str]:
         return self._current_phase
+
+    @property
+    def workflow_namespace(self) -> str:
+        return self._workflow_namespace
+
+    @property
+    def workflow_name(self) -> str:
+        return self._workflow_name
@@ -0,0 +1,241 @@
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import requests
+
+from argo_workflow_tools.argo_http_client import ArgoApiException, ArgoHttpClient
+from argo_workflow_tools.exceptions.workflow_timeout_exception import (
+    WorkflowTimeoutException,
+)
+from argo_workflow_tools.polling_strategy import FixedPollingStrategy, PollingStrategy
+from argo_workflow_tools.workflow_result import WorkflowResult
+from argo_workflow_tools.workflow_status import WorkflowStatus
+from argo_workflow_tools.workflow_status_checker import (
+    POLLING_INTERVAL_SECONDS,
+    _get_workflow_phase,
+    _is_running,
+)
+
+SUBMIT_FROM_API_LABEL_SELECTOR = "submit-from-api=true"
+LIST_STATUS_FIELDS = "items.metadata.name,items.spec.suspend,items.status.phase"
+# consecutive failed ticks after which the background tracker fails the pending futures
+MAX_CONSECUTIVE_FAILURES = 5
+MAX_BACKOFF_SECONDS = 60.0
+
+
+def _is_transient(error: Exception) -> bool:
+    """
+    whether a failed status refresh is worth retrying, server errors and dropped connections are
+    """
+    if isinstance(error, ArgoApiException):
+        return error.status is None or error.status == 429 or error.status >= 500
+    return isinstance(
+        error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+    )
+
+
+class _TrackedWorkflow:
+    def __init__(
+        self,
+        result: WorkflowResult,
+        future: Future,
+        callback: Optional[Callable[[WorkflowResult], None]],
+    ):
+        self.result = result
+        self.future = future
+        self.callback = callback
+
+
+class WorkflowStatusTracker:
+    """
+    Tracks the status of many workflows at once. every tick issues a single label selector
+    list call per namespace, instead of one status request per workflow.
+    workflows missing from the listing (e.g. created without the submit label) fall back
+    to an individual status request.
+    """
+
+    def __init__(
+        self,
+        argo_http_client: ArgoHttpClient,
+        label_selector: str = SUBMIT_FROM_API_LABEL_SELECTOR,
+        polling_strategy: PollingStrategy = None,
+        logger: Callable[[str], None] = print,
+        max_consecutive_failures: int = MAX_CONSECUTIVE_FAILURES,
+    ):
+        self._argo_http_client = argo_http_client
+        self._logger = logger
+        self._max_consecutive_failures = max_consecutive_failures
+        self._label_selector = label_selector
+        self._polling_strategy = polling_strategy or FixedPollingStrategy(
+            POLLING_INTERVAL_SECONDS
+        )
+        self._tracked: Dict[Tuple[str, str], _TrackedWorkflow] = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def track(
+        self,
+        workflow_result: WorkflowResult,
+        callback: Optional[Callable[[WorkflowResult], None]] = None,
+    ) -> "Future[WorkflowStatus]":
+        """
+        start tracking a workflow
+        Parameters
+        ----------
+        workflow_result : submitted workflow
+        callback : called with the workflow result once the workflow completes
+
+        Returns
+        -------
+        future resolved with the final workflow status
+        """
+        checker = workflow_result.workflow_status_checker
+        tracked = _TrackedWorkflow(workflow_result, Future(), callback)
+        tracked.future.set_running_or_notify_cancel()
+        with self._lock:
+            self._tracked[(checker.workflow_namespace, checker.workflow_name)] = tracked
+        if not _is_running(checker.current_phase):
+            self._complete(tracked)
+        return tracked.future
+
+    def track_all(
+        self,
+        workflow_results: Iterable[WorkflowResult],
+        callback: Optional[Callable[[WorkflowResult], None]] = None,
+    ) -> List["Future[WorkflowStatus]"]:
+        return [self.track(result, callback) for result in workflow_results]
+
+    @property
+    def pending(self) -> int:
+        """
+        number of tracked workflows that are still running
+        """
+        with self._lock:
+            return len(self._tracked)
+
+    def sync(self) -> None:
+        """
+        refresh the status of every tracked workflow
+        """
+        with self._lock:
+            tracked_workflows = dict(self._tracked)
+
+        namespaces = {namespace for namespace, _ in tracked_workflows}
+        for namespace in namespaces:
+            listing = self._argo_http_client.list_workflows(
+                namespace, label_selector=self._label_selector, fields=LIST_STATUS_FIELDS
+            )
+            phases = {
+                workflow["metadata"]["name"]: _get_workflow_phase(workflow)
+                for workflow in listing.get("items") or []
+            }
+            for (workflow_namespace, name), tracked in tracked_workflows.items():
+                if workflow_namespace != namespace:
+                    continue
+                checker = tracked.result.workflow_status_checker
+                if name in phases and _is_running(phases[name]):
+                    phase = phases[name]
+                else:
+                    # not listed or completed, confirm with the workflow's own status
+                    checker.sync()
+                    phase = checker.current_phase
+                tracked.result.status = WorkflowStatus.value_of(phase)
+                if not _is_running(phase):
+                    self._complete(tracked)
+
+    def _complete(self, tracked: _TrackedWorkflow) -> None:
+        checker = tracked.result.workflow_status_checker
+        key = (checker.workflow_namespace, checker.workflow_name)
+        with self._lock:
+            # a background sync and wait_for_completion may both see the workflow complete
+            if self._tracked.get(key) is not tracked or tracked.future.done():
+                return
+            del self._tracked[key]
+        tracked.result.status = WorkflowStatus.value_of(checker.current_phase)
+        tracked.future.set_result(tracked.result.status)
+        if tracked.callback:
+            try:
+                tracked.callback(tracked.result)
+            except Exception as e:
+                # like future callbacks, a failing callback doesn't affect the other workflows
+                self._logger(f"workflow completion callback failed: {e!r}")
+
+    def _fail_pending(self, error: Exception) -> None:
+        with self._lock:
+            tracked_workflows = list(self._tracked.values())
+            self._tracked.clear()
+        for tracked in tracked_workflows:
+            if not tracked.future.done():
+                tracked.future.set_exception(error)
+
+    def wait_for_completion(self, timeout: float = None) -> None:
+        """
+        block until every tracked workflow completes
+        Parameters
+        ----------
+        timeout : maximum number of seconds to wait, waits forever if None
+        """
+        started = time.monotonic()
+        attempt = 0
+        while self.pending and not self._stop_event.is_set():
+            self.sync()
+            if not self.pending:
+                break
+            elapsed = time.monotonic() - started
+            delay = self._polling_strategy.next_interval(attempt, elapsed, None)
+            if timeout is not None:
+                remaining = timeout - elapsed
+                if remaining <= 0:
+                    raise WorkflowTimeoutException(
+                        f"{self.pending} workflows are still running after {timeout} seconds"
+                    )
+                delay = min(delay, remaining)
+            attempt += 1
+            self._stop_event.wait(delay)
+
+    def start(self) -> "WorkflowStatusTracker":
+        """
+        track workflows in a background thread, until stop is called
+        """
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        """
+        background polling loop. transient errors are logged and retried with backoff, other
+        errors, or too many consecutive failures, fail the pending futures instead of leaving
+        their callers blocked
+        """
+        started = time.monotonic()
+        attempt = 0
+        failures = 0
+        while not self._stop_event.is_set():
+            delay = self._polling_strategy.next_interval(
+                attempt, time.monotonic() - started, None
+            )
+            if self.pending:
+                try:
+                    self.sync()
+                    failures = 0
+                except Exception as e:
+                    failures += 1
+                    if _is_transient(e) and failures < self._max_consecutive_failures:
+                        self._logger(f"failed to refresh workflow statuses, retrying: {e!r}")
+                        delay = min(delay * 2 ** failures, MAX_BACKOFF_SECONDS)
+                    else:
+                        self._logger(f"failed to refresh workflow statuses, giving up: {e!r}")
+                        self._fail_pending(e)
+                        failures = 0
+            self._stop_event.wait(delay)
+            attempt += 1
@@ -0,0 +1,77 @@
+"""
+incremental parsing of workflow documents, reading only the parts that are needed from the
+response stream instead of materialising the whole workflow (status.nodes can be hundreds of MB
+for large fan-outs). requires the optional `streaming` extra (ijson).
+"""
+from typing import BinaryIO, Callable, Iterable, Iterator, Tuple
+
+NODES_PREFIX = "status.nodes"
+
+
+def _import_ijson():
+    try:
+        import ijson
+    except ImportError as e:
+        raise ImportError(
+            "incremental workflow parsing requires ijson, "
+            "install it with `pip install argo-workflow-tools[streaming]`"
+        ) from e
+    return ijson
+
+
+def is_available() -> bool:
+    """
+    whether the incremental parser dependencies are installed
+    """
+    try:
+        _import_ijson()
+    except ImportError:
+        return False
+    return True
+
+
+def iter_nodes(
+    stream: BinaryIO,
+    node_ids: Iterable[str] = None,
+    predicate: Callable[[dict], bool] = None,
+) -> Iterator[Tuple[str, dict]]:
+    """
+    yields status.nodes entries one at a time, only one node is held in memory at once
+    Parameters
+    ----------
+    stream : workflow json document
+    node_ids : only build these nodes, other nodes are skipped without being materialised.
+        iteration stops once all of them were found
+    predicate : filter applied to every built node
+
+    Returns
+    -------
+    iterator of (node id, node) tuples
+    """
+    ijson = _import_ijson()
+    remaining_ids = set(node_ids) if node_ids is not None else None
+    events = ijson.parse(stream)
+    for prefix, event, value in events:
+        if prefix != NODES_PREFIX or event != "map_key":
+            continue
+        node_id = value
+        wanted = remaining_ids is None or node_id in remaining_ids
+        builder = ijson.ObjectBuilder() if wanted else None
+        depth = 0
+        for _, node_event, node_value in events:
+            if builder is not None:
+                builder.event(node_event, node_value)
+            if node_event in ("start_map", "start_array"):
+                depth += 1
+            elif node_event in ("end_map", "end_array"):
+                depth -= 1
+            if depth == 0:
+                break
+        if builder is None:
+            continue
+        if predicate is None or predicate(builder.value):
+            yield node_id, builder.value
+        if remaining_ids is not None:
+            remaining_ids.discard(node_id)
+            if not remaining_ids:
+                return
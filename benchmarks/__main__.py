@@ -0,0 +1,52 @@
+"""
+DSL compiler and import time benchmarks
+
+    python -m benchmarks --save baseline.json
+    python -m benchmarks --compare baseline.json --threshold 0.2
+"""
+import argparse
+import sys
+
+from benchmarks import compiler_benchmark, generators, import_benchmark
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=sorted([*generators.SCENARIOS, import_benchmark.IMPORTS]),
+        help="scenario to run, may be repeated. runs every scenario by default",
+    )
+    parser.add_argument("--scale", type=float, default=1.0, help="scenario size multiplier")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per stage")
+    parser.add_argument("--save", metavar="PATH", help="save the results as a baseline")
+    parser.add_argument("--compare", metavar="PATH", help="compare the results to a baseline")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="relative growth reported as a regression, defaults to 0.2 (20%%)",
+    )
+    args = parser.parse_args(argv)
+
+    results = compiler_benchmark.run(args.scenario, args.scale, args.repeat)
+    print(compiler_benchmark.format_results(results))
+    if args.save:
+        compiler_benchmark.save(results, args.save)
+
+    if args.compare:
+        comparisons = compiler_benchmark.compare(
+            results, compiler_benchmark.load(args.compare)
+        )
+        print()
+        print(compiler_benchmark.format_comparisons(comparisons))
+        regressions = compiler_benchmark.regressions(comparisons, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} metrics regressed by more than {args.threshold:.0%}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
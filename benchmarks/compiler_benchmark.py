@@ -0,0 +1,163 @@
+"""
+times the DSL compiler stages on synthetic programs, and compares results against a saved baseline
+"""
+import json
+import platform
+import statistics
+import time
+import tracemalloc
+from typing import Callable, Dict, Iterable, List, NamedTuple
+
+from argo_workflow_tools.dsl import compilation_cache
+from argo_workflow_tools.dsl.dag_compiler import compile_dag
+from argo_workflow_tools.dsl.workflow import WorkflowTemplate
+from benchmarks import generators, import_benchmark
+
+PEAK_MEMORY = "peak_memory_bytes"
+
+
+class Comparison(NamedTuple):
+    scenario: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        if not self.baseline:
+            return 0.0
+        return (self.current - self.baseline) / self.baseline
+
+
+def _median_seconds(func: Callable[[], object], repeat: int, cold: bool = True) -> float:
+    timings = []
+    for _ in range(repeat):
+        if cold:
+            compilation_cache.clear()
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+def _peak_memory(func: Callable[[], object]) -> int:
+    compilation_cache.clear()
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_scenario(name: str, scale: float = 1.0, repeat: int = 3) -> Dict[str, float]:
+    """
+    compiles a synthetic program, timing every compiler stage
+    Parameters
+    ----------
+    name : scenario name, one of generators.SCENARIOS
+    scale : multiplier applied to the scenario size
+    repeat : number of runs per stage, the median is reported
+
+    Returns
+    -------
+    metric name to value, stage timings are in seconds. to_model, to_dict and to_yaml include
+    the stages before them, the *_only metrics isolate each stage
+    """
+    program = generators.load(generators.SCENARIOS[name](scale))
+    workflow = WorkflowTemplate(
+        name=name.replace("_", "-"), entrypoint=program.main, arguments={"value": "input"}
+    )
+
+    results = {
+        "compile_dag": _median_seconds(lambda: compile_dag(program.main), repeat),
+        "compile_dag_cached": _median_seconds(
+            lambda: compile_dag(program.main), repeat, cold=False
+        ),
+        "to_model": _median_seconds(workflow.to_model, repeat),
+        "to_dict": _median_seconds(workflow.to_dict, repeat),
+        "to_yaml": _median_seconds(workflow.to_yaml, repeat),
+    }
+    results["to_dict_only"] = max(results["to_dict"] - results["to_model"], 0.0)
+    results["to_yaml_only"] = max(results["to_yaml"] - results["to_dict"], 0.0)
+    results["templates"] = len(workflow.to_model().spec.templates)
+    results[PEAK_MEMORY] = _peak_memory(workflow.to_yaml)
+    compilation_cache.clear()
+    return results
+
+
+def run(scenarios: Iterable[str] = None, scale: float = 1.0, repeat: int = 3) -> dict:
+    """
+    runs the given scenarios, all of them and the import benchmark if None
+    """
+    results = {}
+    for name in scenarios or [*generators.SCENARIOS, import_benchmark.IMPORTS]:
+        if name == import_benchmark.IMPORTS:
+            results[name] = import_benchmark.run(repeat)
+        else:
+            results[name] = run_scenario(name, scale, repeat)
+    return {
+        "python": platform.python_version(),
+        "scale": scale,
+        "repeat": repeat,
+        "scenarios": results,
+    }
+
+
+def save(results: dict, path: str) -> None:
+    with open(path, "w") as baseline_file:
+        json.dump(results, baseline_file, indent=2, sort_keys=True)
+
+
+def load(path: str) -> dict:
+    with open(path) as baseline_file:
+        return json.load(baseline_file)
+
+
+def compare(results: dict, baseline: dict) -> List[Comparison]:
+    """
+    pairs every metric with its baseline value, metrics missing from the baseline are skipped
+    """
+    comparisons = []
+    for scenario, metrics in results["scenarios"].items():
+        baseline_metrics = baseline.get("scenarios", {}).get(scenario, {})
+        for metric, value in metrics.items():
+            if metric in baseline_metrics:
+                comparisons.append(
+                    Comparison(scenario, metric, baseline_metrics[metric], value)
+                )
+    return comparisons
+
+
+def regressions(comparisons: Iterable[Comparison], threshold: float) -> List[Comparison]:
+    """
+    comparisons that grew by more than threshold, e.g. 0.2 for 20%
+    """
+    return [comparison for comparison in comparisons if comparison.change > threshold]
+
+
+def format_results(results: dict) -> str:
+    lines = []
+    for scenario, metrics in results["scenarios"].items():
+        lines.append(scenario)
+        for metric, value in metrics.items():
+            lines.append(f"  {metric:<20} {_format_value(metric, value)}")
+    return "\n".join(lines)
+
+
+def format_comparisons(comparisons: Iterable[Comparison]) -> str:
+    return "\n".join(
+        f"{comparison.scenario:<24} {comparison.metric:<20} "
+        f"{_format_value(comparison.metric, comparison.baseline):>12} -> "
+        f"{_format_value(comparison.metric, comparison.current):>12} "
+        f"({comparison.change:+.1%})"
+        for comparison in comparisons
+    )
+
+
+def _format_value(metric: str, value: float) -> str:
+    if metric == PEAK_MEMORY:
+        return f"{value / 2 ** 20:.1f}MiB"
+    if metric == "templates":
+        return str(int(value))
+    return f"{value * 1000:.1f}ms"
@@ -0,0 +1,150 @@
+"""
+synthetic DSL programs for the compiler benchmarks. programs are rendered as python source and
+imported from a temporary module, since task templates embed the source code of their functions.
+every program defines its entrypoint DAG as `main`.
+"""
+import importlib.util
+import itertools
+import os
+import sys
+import tempfile
+from types import ModuleType
+from typing import Callable, Dict, List
+
+HEADER = "from argo_workflow_tools import dsl, Condition\n"
+
+_module_counter = itertools.count()
+
+
+def _task(name: str) -> str:
+    return (
+        f"\n\n@dsl.Task(image=\"python:3.10\")\n"
+        f"def {name}(value: str):\n"
+        f"    message = value + \"-{name}\"\n"
+        f"    return message\n"
+    )
+
+
+def _dag(name: str, body: List[str], decorator: str = "@dsl.DAG()") -> str:
+    lines = "".join(f"    {line}\n" for line in body)
+    return f"\n\n{decorator}\ndef {name}(value):\n{lines}"
+
+
+def wide_fan_out(width: int) -> str:
+    """
+    a single DAG running `width` independent tasks in parallel
+    """
+    tasks = [f"task_{i}" for i in range(width)]
+    source = HEADER + "".join(_task(task) for task in tasks)
+    body = [f"{task}(value)" for task in tasks]
+    return source + _dag("main", body)
+
+
+def deep_nesting(depth: int) -> str:
+    """
+    a chain of `depth` DAGs, each one calling the next nested DAG and a task
+    """
+    source = HEADER + _task("leaf")
+    source += _dag("dag_0", ["return leaf(value)"])
+    for level in range(1, depth):
+        source += _dag(
+            f"dag_{level}", [f"nested = dag_{level - 1}(value)", "return leaf(nested)"]
+        )
+    return source + _dag("main", [f"return dag_{depth - 1}(value)"])
+
+
+def many_tasks(count: int, group_size: int = 100) -> str:
+    """
+    `count` distinct tasks, chained in sub-DAGs of `group_size` tasks
+    """
+    source = HEADER + "".join(_task(f"task_{i}") for i in range(count))
+    groups = []
+    for start in range(0, count, group_size):
+        group = f"group_{start // group_size}"
+        body = ["result = value"] + [
+            f"result = task_{i}(result)" for i in range(start, min(start + group_size, count))
+        ]
+        source += _dag(group, body + ["return result"])
+        groups.append(group)
+    body = ["result = value"] + [f"result = {group}(result)" for group in groups]
+    return source + _dag("main", body + ["return result"])
+
+
+def conditions(count: int) -> str:
+    """
+    a DAG running `count` tasks, each one behind a condition
+    """
+    source = HEADER + "".join(_task(f"task_{i}") for i in range(count))
+    body = []
+    for i in range(count):
+        body.append(f"with Condition().equals(value, \"option-{i}\"):")
+        body.append(f"    task_{i}(value)")
+    return source + _dag("main", body)
+
+
+def workflow_template_refs(count: int) -> str:
+    """
+    a DAG calling `count` workflow templates, compiled as templateRefs
+    """
+    source = HEADER + _task("shared_task")
+    for i in range(count):
+        source += _dag(
+            f"template_{i}",
+            ["return shared_task(value)"],
+            decorator=f"@dsl.WorkflowTemplate(name=\"template-{i}\")",
+        )
+    body = [f"template_{i}(value)" for i in range(count)]
+    return source + _dag("main", body)
+
+
+def shared_library(pipelines: int, library_size: int) -> str:
+    """
+    `pipelines` DAGs, each chaining the same library of `library_size` tasks
+    """
+    source = HEADER + "".join(_task(f"library_{i}") for i in range(library_size))
+    for pipeline in range(pipelines):
+        body = ["result = value"] + [
+            f"result = library_{(pipeline + i) % library_size}(result)"
+            for i in range(library_size)
+        ]
+        source += _dag(f"pipeline_{pipeline}", body + ["return result"])
+    body = [f"pipeline_{pipeline}(value)" for pipeline in range(pipelines)]
+    return source + _dag("main", body)
+
+
+def _scaled(size: int, scale: float) -> int:
+    return max(1, int(size * scale))
+
+
+SCENARIOS: Dict[str, Callable[[float], str]] = {
+    "wide_fan_out": lambda scale: wide_fan_out(_scaled(1000, scale)),
+    "deep_nesting": lambda scale: deep_nesting(_scaled(50, scale)),
+    "many_tasks": lambda scale: many_tasks(_scaled(3000, scale)),
+    "conditions": lambda scale: conditions(_scaled(500, scale)),
+    "workflow_template_refs": lambda scale: workflow_template_refs(_scaled(500, scale)),
+    "shared_library": lambda scale: shared_library(_scaled(40, scale), _scaled(50, scale)),
+}
+
+
+def load(source: str, directory: str = None) -> ModuleType:
+    """
+    imports a generated program from a module file, so its functions have inspectable source
+    Parameters
+    ----------
+    source : generated python source
+    directory : where the module file is written, a new temporary directory if None
+
+    Returns
+    -------
+    the imported module
+    """
+    directory = directory or tempfile.mkdtemp(prefix="argo-benchmark-")
+    module_name = f"argo_benchmark_program_{next(_module_counter)}"
+    path = os.path.join(directory, f"{module_name}.py")
+    with open(path, "w") as module_file:
+        module_file.write(source)
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
@@ -0,0 +1,54 @@
+"""
+times cold imports of the package in fresh interpreters
+"""
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict
+
+import argo_workflow_tools
+
+IMPORTS = "imports"
+
+STATEMENTS = {
+    "import_package": "import argo_workflow_tools",
+    "import_client": "from argo_workflow_tools import ArgoClient, ArgoOptions",
+    "import_dsl": "from argo_workflow_tools import dsl, Workflow, WorkflowTemplate",
+}
+
+_TIMER = (
+    "import time\n"
+    "started = time.perf_counter()\n"
+    "{statement}\n"
+    "print(time.perf_counter() - started)\n"
+)
+
+
+def _package_root() -> str:
+    return os.path.dirname(os.path.dirname(os.path.abspath(argo_workflow_tools.__file__)))
+
+
+def time_import(statement: str, repeat: int = 5) -> float:
+    """
+    median seconds a statement takes to run in a fresh interpreter
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        path for path in (_package_root(), env.get("PYTHONPATH")) if path
+    )
+    timings = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", _TIMER.format(statement=statement)],
+            env=env,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        timings.append(float(output.strip().splitlines()[-1]))
+    return statistics.median(timings)
+
+
+def run(repeat: int = 5) -> Dict[str, float]:
+    return {name: time_import(statement, repeat) for name, statement in STATEMENTS.items()}
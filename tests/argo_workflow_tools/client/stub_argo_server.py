@@ -0,0 +1,275 @@
+import json
+import re
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+
+def _select_fields(document: dict, fields: List[str]) -> dict:
+    selected = {}
+    for field in fields:
+        source, target = document, selected
+        keys = field.split(".")
+        for key in keys[:-1]:
+            if key not in source:
+                break
+            source = source[key]
+            target = target.setdefault(key, {})
+        else:
+            if keys[-1] in source:
+                target[keys[-1]] = source[keys[-1]]
+    return selected
+
+
+class StubArgoServer:
+    """
+    Minimal in-process stand-in for the argo server REST api, used to test the client
+    without a cluster. Workflows move through `phases` one step after every status read.
+    """
+
+    def __init__(self, templates: List[str] = None, phases: List[str] = None):
+        self.templates = set(templates or [])
+        self.phases = phases or ["Running", "Succeeded"]
+        self.workflows: Dict[str, dict] = {}
+        # (namespace, name) -> deployed workflow template
+        self.workflow_templates: Dict[tuple, dict] = {}
+        self.requests: List[str] = []
+        self.client_addresses = set()
+        self.failures: Dict[str, List[int]] = {}
+        self.watch_resource_versions: List[Optional[str]] = []
+        # number of events sent on each watch connection before it is dropped
+        self.watch_drop_after: List[int] = []
+        # seconds between the phase changes of a watched workflow
+        self.watch_interval = 0.01
+        self._pending_phases: Dict[str, List[str]] = {}
+        self._counter = 0
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def add_workflow(self, name: str, phase: str, namespace="argo", nodes=None, labels=None):
+        workflow = {
+            "metadata": {
+                "name": name,
+                "namespace": namespace,
+                "resourceVersion": "1",
+                "labels": labels or {"submit-from-api": "true"},
+            },
+            "spec": {},
+            "status": {"phase": phase, "nodes": nodes or {}},
+        }
+        self.workflows[name] = workflow
+        self._pending_phases[name] = []
+        return workflow
+
+    def add_workflow_template(self, manifest: dict, namespace="argo"):
+        template = json.loads(json.dumps(manifest))
+        metadata = template.setdefault("metadata", {})
+        metadata.setdefault("namespace", namespace)
+        metadata["resourceVersion"] = "1"
+        metadata["uid"] = f"uid-{metadata['name']}"
+        metadata.setdefault("labels", {})["workflows.argoproj.io/creator"] = "system"
+        self.workflow_templates[(metadata["namespace"], metadata["name"])] = template
+        return template
+
+    def set_phase(self, name: str, phase: str):
+        metadata = self.workflows[name]["metadata"]
+        self.workflows[name]["status"]["phase"] = phase
+        metadata["resourceVersion"] = str(int(metadata["resourceVersion"]) + 1)
+
+    def stream_events(self, handler: BaseHTTPRequestHandler, query: dict):
+        """
+        newline delimited json watch stream, the watched workflow advances one phase per event
+        """
+        name = query["listOptions.fieldSelector"][0].split("=", 1)[1]
+        resource_version = query.get("listOptions.resourceVersion", [None])[0]
+        self.watch_resource_versions.append(resource_version)
+        drop_after = self.watch_drop_after.pop(0) if self.watch_drop_after else None
+        handler.send_response(200)
+        handler.send_header("Content-Type", "application/json")
+        handler.send_header("Connection", "close")
+        handler.end_headers()
+        handler.close_connection = True
+
+        sent_version = int(resource_version or 0)
+        sent_events = 0
+        while drop_after is None or sent_events < drop_after:
+            workflow = self.workflows[name]
+            version = int(workflow["metadata"]["resourceVersion"])
+            if version > sent_version:
+                event = {"result": {"type": "MODIFIED", "object": workflow}}
+                handler.wfile.write(json.dumps(event).encode() + b"\n")
+                handler.wfile.flush()
+                sent_version = version
+                sent_events += 1
+                if not self._pending_phases.get(name):
+                    return
+            else:
+                time.sleep(self.watch_interval)
+                self._advance(name)
+
+    def _create(self, namespace: str, name_prefix: str, labels: dict):
+        with self._lock:
+            self._counter += 1
+            name = f"{name_prefix}{self._counter}"
+        workflow = self.add_workflow(name, self.phases[0], namespace, labels=labels)
+        self._pending_phases[name] = list(self.phases[1:])
+        return workflow
+
+    def _advance(self, name: str) -> None:
+        pending = self._pending_phases.get(name)
+        if pending:
+            self.set_phase(name, pending.pop(0))
+
+    def handle(self, method: str, path: str, query: dict, body: Optional[dict]):
+        """
+        returns (status, payload) for a request, unknown routes answer 404
+        """
+        if self.failures.get(method):
+            return self.failures[method].pop(0), {"message": "injected failure"}
+
+        match = re.fullmatch(r"/api/v1/workflows/([^/]+)/submit", path)
+        if method == "POST" and match:
+            if body["resourceName"] not in self.templates:
+                return 404, {"message": "not found"}
+            labels = dict(
+                label.split("=", 1)
+                for label in body["submitOptions"]["labels"].split(",")
+                if label
+            )
+            workflow = self._create(match.group(1), f"{body['resourceName']}-", labels)
+            workflow["spec"]["arguments"] = {"parameters": body["submitOptions"]["parameters"]}
+            return 200, workflow
+
+        match = re.fullmatch(r"/api/v1/workflows/([^/]+)", path)
+        if method == "POST" and match:
+            metadata = body["workflow"]["metadata"]
+            return 200, self._create(
+                match.group(1), metadata.get("generateName", "workflow-"), metadata.get("labels")
+            )
+
+        match = re.fullmatch(r"/api/v1/workflows/([^/]+)", path)
+        if method == "GET" and match:
+            selector = dict(
+                label.split("=", 1)
+                for label in query.get("listOptions.labelSelector", [""])[0].split(",")
+                if label
+            )
+            items = [
+                json.loads(json.dumps(workflow))
+                for workflow in self.workflows.values()
+                if workflow["metadata"]["namespace"] == match.group(1)
+                and selector.items() <= (workflow["metadata"].get("labels") or {}).items()
+            ]
+            for item in items:
+                self._advance(item["metadata"]["name"])
+            return 200, {"metadata": {}, "items": items or None}
+
+        match = re.fullmatch(r"/api/v1/workflows/([^/]+)/([^/]+)", path)
+        if method == "GET" and match:
+            name = match.group(2)
+            if name not in self.workflows:
+                return 404, {"message": "not found"}
+            workflow = json.loads(json.dumps(self.workflows[name]))
+            if "fields" in query:
+                workflow = _select_fields(workflow, query["fields"][0].split(","))
+            self._advance(name)
+            return 200, workflow
+
+        match = re.fullmatch(r"/api/v1/workflow-templates/([^/]+)", path)
+        if method == "GET" and match:
+            items = [
+                template
+                for (namespace, _), template in self.workflow_templates.items()
+                if namespace == match.group(1)
+            ]
+            return 200, {"metadata": {}, "items": items or None}
+        if method == "POST" and match:
+            name = body["template"]["metadata"]["name"]
+            if (match.group(1), name) in self.workflow_templates:
+                return 409, {"message": "already exists"}
+            return 200, self.add_workflow_template(body["template"], match.group(1))
+
+        match = re.fullmatch(r"/api/v1/workflow-templates/([^/]+)/([^/]+)", path)
+        if method == "PUT" and match:
+            deployed = self.workflow_templates.get((match.group(1), match.group(2)))
+            if deployed is None:
+                return 404, {"message": "not found"}
+            version = body["template"]["metadata"].get("resourceVersion")
+            if version != deployed["metadata"]["resourceVersion"]:
+                return 409, {"message": "the object has been modified"}
+            template = self.add_workflow_template(body["template"], match.group(1))
+            template["metadata"]["resourceVersion"] = str(int(version) + 1)
+            return 200, template
+
+        match = re.fullmatch(r"/api/v1/workflows/([^/]+)/([^/]+)/(stop|retry|resume|suspend)", path)
+        if method == "PUT" and match:
+            name, action = match.group(2), match.group(3)
+            workflow = self.workflows[name]
+            if action == "suspend":
+                workflow["spec"]["suspend"] = True
+            elif action == "resume":
+                workflow["spec"].pop("suspend", None)
+            elif action == "stop":
+                self._pending_phases[name] = []
+                self.set_phase(name, "Failed")
+            elif action == "retry":
+                self._pending_phases[name] = list(self.phases[1:])
+                self.set_phase(name, self.phases[0])
+            return 200, workflow
+
+        return 404, {"message": f"unknown route {method} {path}"}
+
+    def _handler_class(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            def log_message(self, format, *args):
+                pass
+
+            def _dispatch(self):
+                stub.client_addresses.add(self.client_address)
+                url = urlparse(self.path)
+                stub.requests.append(f"{self.command} {self.path}")
+                if url.path.startswith("/api/v1/workflow-events/"):
+                    return stub.stream_events(self, parse_qs(url.query))
+                length = int(self.headers.get("Content-Length") or 0)
+                body = json.loads(self.rfile.read(length)) if length else None
+                status, payload = stub.handle(self.command, url.path, parse_qs(url.query), body)
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            do_GET = _dispatch
+            do_POST = _dispatch
+            do_PUT = _dispatch
+
+        return Handler
@@ -0,0 +1,84 @@
+import asyncio
+
+import pytest
+
+from argo_workflow_tools import (
+    ArgoOptions,
+    AsyncArgoClient,
+    WorkflowNotFoundException,
+    WorkflowStatus,
+)
+from tests.argo_workflow_tools.client.stub_argo_server import StubArgoServer
+
+pytest.importorskip("httpx")
+
+OPTIONS = ArgoOptions(namespace="argo", polling_interval=0.01)
+
+
+def test_submit_and_wait_concurrently():
+    async def run(url):
+        async with AsyncArgoClient(url, OPTIONS) as client:
+            results = await asyncio.gather(
+                *[client.submit("basic-template", params={"i": i}) for i in range(20)]
+            )
+            assert all(result.status == WorkflowStatus.Running for result in results)
+            return await asyncio.gather(
+                *[result.wait_for_completion() for result in results]
+            )
+
+    with StubArgoServer(templates=["basic-template"]) as server:
+        statuses = asyncio.run(run(server.url))
+
+    assert statuses == [WorkflowStatus.Succeeded] * 20
+
+
+def test_submit_non_existing_workflow():
+    async def run(url):
+        async with AsyncArgoClient(url, OPTIONS) as client:
+            await client.submit("non-existing-workflow", params={})
+
+    with StubArgoServer() as server:
+        with pytest.raises(WorkflowNotFoundException):
+            asyncio.run(run(server.url))
+
+
+def test_create_suspend_resume_and_stop():
+    workflow = {"metadata": {"generateName": "hello-world-"}, "spec": {}}
+
+    async def run(url):
+        async with AsyncArgoClient(url, OPTIONS) as client:
+            result = await client.create(workflow, wait=False)
+            assert result.workflow_name == "hello-world-1"
+            assert await result.suspend() == WorkflowStatus.Suspended
+            assert await result.resume() == WorkflowStatus.Succeeded
+            assert await result.retry() == WorkflowStatus.Running
+            assert await result.stop() == WorkflowStatus.Failed
+
+    with StubArgoServer(phases=["Running", "Running", "Succeeded"]) as server:
+        asyncio.run(run(server.url))
+
+
+def test_pool_size_limits_connections():
+    async def run(url):
+        options = ArgoOptions(namespace="argo", polling_interval=0.01, pool_size=3)
+        async with AsyncArgoClient(url, options) as client:
+            await asyncio.gather(
+                *[client.submit("basic-template", params={"i": i}) for i in range(30)]
+            )
+
+    with StubArgoServer(templates=["basic-template"]) as server:
+        asyncio.run(run(server.url))
+
+    assert len(server.client_addresses) <= 3
+
+
+@pytest.mark.parametrize("phase", ["Pending", "Unknown"])
+def test_outputs_of_workflows_not_fetched_yet(phase):
+    async def run(url):
+        async with AsyncArgoClient(url, OPTIONS) as client:
+            result = await client.submit("basic-template", params={})
+            result.status = WorkflowStatus(phase)
+            return result.outputs
+
+    with StubArgoServer(templates=["basic-template"], phases=["Pending", "Succeeded"]) as server:
+        assert asyncio.run(run(server.url)) == {}
@@ -0,0 +1,51 @@
+import pytest
+
+from argo_workflow_tools import ArgoClient, ArgoOptions, WorkflowStatus
+from argo_workflow_tools.argo_http_client import ArgoApiException, ArgoHttpClient
+from tests.argo_workflow_tools.client.stub_argo_server import StubArgoServer
+
+
+def test_requests_share_keep_alive_connection():
+    with StubArgoServer(templates=["basic-template"]) as server:
+        client = ArgoClient(server.url, options=ArgoOptions(namespace="argo"))
+        results = [
+            client.submit("basic-template", params={}, wait=False) for _ in range(5)
+        ]
+        client.close()
+
+    assert all(result.status == WorkflowStatus.Running for result in results)
+    assert len(server.requests) == 10
+    assert len(server.client_addresses) == 1
+
+
+def test_get_is_retried_on_server_error():
+    with StubArgoServer() as server:
+        server.add_workflow("wf", "Running")
+        server.failures["GET"] = [503, 502]
+        with ArgoHttpClient(server.url, ArgoOptions(max_retries=3)) as http_client:
+            workflow = http_client.get_workflow("argo", "wf", with_retries=True)
+
+    assert workflow["status"]["phase"] == "Running"
+    assert len(server.requests) == 3
+
+
+def test_get_without_retries_fails_fast():
+    with StubArgoServer() as server:
+        server.add_workflow("wf", "Running")
+        server.failures["GET"] = [503]
+        with ArgoHttpClient(server.url, ArgoOptions()) as http_client:
+            with pytest.raises(ArgoApiException) as error:
+                http_client.get_workflow("argo", "wf")
+
+    assert error.value.status == 503
+    assert len(server.requests) == 1
+
+
+def test_submit_is_not_retried_on_server_error():
+    with StubArgoServer(templates=["basic-template"]) as server:
+        server.failures["POST"] = [503]
+        client = ArgoClient(server.url, options=ArgoOptions(namespace="argo"))
+        with pytest.raises(ArgoApiException):
+            client.submit("basic-template", params={}, wait=False)
+
+    assert len(server.requests) == 1
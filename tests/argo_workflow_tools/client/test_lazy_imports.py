@@ -0,0 +1,39 @@
+import os
+import subprocess
+import sys
+
+import argo_workflow_tools
+
+PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(argo_workflow_tools.__file__)))
+
+
+def _run(code: str) -> str:
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=PACKAGE_ROOT,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+
+def test_client_import_does_not_load_models():
+    output = _run(
+        "import sys\n"
+        "from argo_workflow_tools import ArgoClient, ArgoOptions, WorkflowStatus\n"
+        "print(sorted(m for m in sys.modules if m.startswith('argo_workflow_tools.models')))\n"
+    )
+
+    assert output.strip() == "[]"
+
+
+def test_dsl_is_the_decorators_module_after_lazy_imports():
+    output = _run(
+        "import argo_workflow_tools\n"
+        "from argo_workflow_tools import ArgoClient\n"
+        "from argo_workflow_tools.dsl import compile_workflow\n"
+        "from argo_workflow_tools import dsl, Workflow\n"
+        "print(dsl.Task.__module__, argo_workflow_tools.dsl is dsl, Workflow.__name__)\n"
+    )
+
+    assert output.split() == ["argo_workflow_tools.dsl.dsl_decorators", "True", "Workflow"]
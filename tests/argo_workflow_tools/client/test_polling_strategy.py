@@ -0,0 +1,68 @@
+import asyncio
+
+import pytest
+
+from argo_workflow_tools import (
+    ArgoClient,
+    ArgoOptions,
+    AsyncArgoClient,
+    ExponentialBackoffPollingStrategy,
+    FixedPollingStrategy,
+    PhaseAwarePollingStrategy,
+    WorkflowStatus,
+    WorkflowTimeoutException,
+)
+from tests.argo_workflow_tools.client.stub_argo_server import StubArgoServer
+
+
+def test_exponential_backoff_is_capped_and_jittered():
+    strategy = ExponentialBackoffPollingStrategy(
+        initial_interval=1, max_interval=10, multiplier=2, jitter=0.1
+    )
+    intervals = [strategy.next_interval(attempt, 0, "Running") for attempt in range(8)]
+    assert 0.9 <= intervals[0] <= 1.1
+    assert 3.6 <= intervals[2] <= 4.4
+    assert all(9 <= interval <= 11 for interval in intervals[4:])
+
+
+def test_phase_aware_polls_fast_while_pending_or_recently_submitted():
+    strategy = PhaseAwarePollingStrategy(fast_interval=1, running_interval=30, fast_period=60)
+    assert strategy.next_interval(0, 0, None) == 1
+    assert strategy.next_interval(5, 10, "Running") == 1
+    assert strategy.next_interval(50, 120, "Pending") == 1
+    assert strategy.next_interval(50, 120, "Running") == 30
+
+
+def test_wait_honours_configured_polling_interval():
+    with StubArgoServer(templates=["basic-template"]) as server:
+        client = ArgoClient(
+            server.url, options=ArgoOptions(namespace="argo", polling_interval=0.01)
+        )
+        result = client.submit("basic-template", params={})
+        assert result.wait_for_completion(timeout=5) == WorkflowStatus.Succeeded
+
+
+def test_wait_raises_on_timeout():
+    with StubArgoServer(templates=["basic-template"], phases=["Running"]) as server:
+        client = ArgoClient(
+            server.url,
+            options=ArgoOptions(
+                namespace="argo", polling_strategy=FixedPollingStrategy(0.05)
+            ),
+        )
+        result = client.submit("basic-template", params={})
+        with pytest.raises(WorkflowTimeoutException):
+            result.wait_for_completion(timeout=0.2)
+
+
+def test_async_wait_raises_on_timeout():
+    async def run(url):
+        options = ArgoOptions(namespace="argo", polling_interval=0.05)
+        async with AsyncArgoClient(url, options) as client:
+            result = await client.submit("basic-template", params={})
+            await result.wait_for_completion(timeout=0.2)
+
+    pytest.importorskip("httpx")
+    with StubArgoServer(templates=["basic-template"], phases=["Running"]) as server:
+        with pytest.raises(WorkflowTimeoutException):
+            asyncio.run(run(server.url))
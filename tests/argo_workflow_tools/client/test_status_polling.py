@@ -0,0 +1,27 @@
+from argo_workflow_tools import ArgoClient, ArgoOptions, WorkflowStatus
+from tests.argo_workflow_tools.client.stub_argo_server import StubArgoServer
+
+NODES = {
+    "output-test-1": {
+        "id": "output-test-1",
+        "outputs": {"parameters": [{"name": "hello-param", "value": "D"}]},
+    }
+}
+
+
+def test_polling_selects_status_fields_and_outputs_fetch_full_workflow_once():
+    with StubArgoServer(templates=["output-test"]) as server:
+        client = ArgoClient(server.url, options=ArgoOptions(namespace="argo"))
+        result = client.submit("output-test", params={})
+        server.workflows[result.workflow_name]["status"]["nodes"] = NODES
+        result.workflow_status_checker.sync()
+        assert result.workflow_status_checker.current_phase == "Succeeded"
+        result.status = WorkflowStatus.Succeeded
+        status_requests = list(server.requests)
+
+        assert result.outputs == {"hello-param": "D"}
+        assert result.outputs == {"hello-param": "D"}
+
+    assert all("fields=" in request for request in status_requests if request.startswith("GET"))
+    full_requests = server.requests[len(status_requests):]
+    assert full_requests == [f"GET /api/v1/workflows/argo/{result.workflow_name}"]
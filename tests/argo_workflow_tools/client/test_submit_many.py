@@ -0,0 +1,50 @@
+from argo_workflow_tools import (
+    ArgoClient,
+    ArgoOptions,
+    SubmitRequest,
+    WorkflowNotFoundException,
+    WorkflowResult,
+)
+from tests.argo_workflow_tools.client.stub_argo_server import StubArgoServer
+
+
+def test_submit_many_keeps_input_order_and_reports_failures():
+    requests = [
+        SubmitRequest("basic-template", params={"i": i}, labels={"batch": "b1"})
+        for i in range(30)
+    ]
+    requests[7] = ("non-existing-workflow", {}, {})
+
+    with StubArgoServer(templates=["basic-template"]) as server:
+        client = ArgoClient(server.url, options=ArgoOptions(namespace="argo", pool_size=4))
+        results = client.submit_many(requests, max_in_flight=4)
+        client.close()
+
+    assert len(results) == 30
+    assert isinstance(results[7], WorkflowNotFoundException)
+    succeeded = [result for i, result in enumerate(results) if i != 7]
+    assert all(isinstance(result, WorkflowResult) for result in succeeded)
+    assert len({result.workflow_name for result in succeeded}) == 29
+    assert all(
+        server.workflows[result.workflow_name]["spec"]["arguments"]["parameters"] == [f"i={i}"]
+        for i, result in enumerate(results)
+        if i != 7
+    )
+    assert all(
+        server.workflows[result.workflow_name]["metadata"]["labels"]["batch"] == "b1"
+        for result in succeeded
+    )
+    assert len(server.client_addresses) <= 4
+
+
+def test_submit_many_reports_malformed_requests_in_place():
+    requests = [("basic-template", {}), ("basic-template", {}, {}, "unexpected"), 42]
+
+    with StubArgoServer(templates=["basic-template"]) as server:
+        client = ArgoClient(server.url, options=ArgoOptions(namespace="argo"))
+        results = client.submit_many(requests)
+        client.close()
+
+    assert isinstance(results[0], WorkflowResult)
+    assert isinstance(results[1], TypeError)
+    assert isinstance(results[2], TypeError)
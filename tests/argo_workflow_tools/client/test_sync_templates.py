@@ -0,0 +1,100 @@
+import copy
+
+from argo_workflow_tools import ArgoClient, ArgoOptions, TemplateSyncResult, dsl
+from argo_workflow_tools.argo_http_client import ArgoApiException
+from argo_workflow_tools.dsl import compilation_cache, compile_workflow
+from argo_workflow_tools.template_sync import CREATED, UNCHANGED, UPDATED
+from tests.argo_workflow_tools.client.stub_argo_server import StubArgoServer
+
+
+@dsl.Task(image="python:3.10")
+def say_hello(name: str):
+    return f"hello {name}"
+
+
+@dsl.Task(image="python:3.10")
+def say_goodbye(name: str):
+    return f"goodbye {name}"
+
+
+@dsl.WorkflowTemplate(name="hello")
+def hello(name):
+    return say_goodbye(say_hello(name))
+
+
+@dsl.WorkflowTemplate(name="goodbye")
+def goodbye(name):
+    return say_goodbye(name)
+
+
+@dsl.WorkflowTemplate(name="greetings")
+def greetings(name):
+    say_hello(name)
+    return say_goodbye(name)
+
+
+def _fresh_manifest(node):
+    # a different process would name the dag tasks differently
+    with compilation_cache.disabled():
+        return compile_workflow(node).to_dict()
+
+
+def _writes(server):
+    return [request for request in server.requests if not request.startswith("GET")]
+
+
+def test_sync_templates_applies_only_changed_templates():
+    with StubArgoServer() as server:
+        server.add_workflow_template(_fresh_manifest(hello))
+        outdated = _fresh_manifest(goodbye)
+        outdated["spec"]["templates"][0]["script"]["image"] = "python:3.9"
+        server.add_workflow_template(outdated)
+
+        client = ArgoClient(server.url, options=ArgoOptions(namespace="argo", pool_size=4))
+        results = client.sync_templates([hello, goodbye, greetings])
+
+        assert [(result.name, result.action) for result in results] == [
+            ("hello", UNCHANGED),
+            ("goodbye", UPDATED),
+            ("greetings", CREATED),
+        ]
+        assert results[1].changes == ["spec.templates[0].script.image"]
+        assert sorted(_writes(server)) == [
+            "POST /api/v1/workflow-templates/argo",
+            "PUT /api/v1/workflow-templates/argo/goodbye",
+        ]
+        assert server.requests.count("GET /api/v1/workflow-templates/argo") == 1
+
+        server.requests.clear()
+        again = client.sync_templates([hello, goodbye, greetings])
+        client.close()
+
+    assert [result.action for result in again] == [UNCHANGED] * 3
+    assert _writes(server) == []
+
+
+def test_sync_templates_dry_run_does_not_apply():
+    with StubArgoServer() as server:
+        client = ArgoClient(server.url, options=ArgoOptions(namespace="argo"))
+        results = client.sync_templates([hello, _fresh_manifest(goodbye)], dry_run=True)
+        client.close()
+
+    assert [result.action for result in results] == [CREATED, CREATED]
+    assert server.workflow_templates == {}
+
+
+def test_sync_templates_reports_failures_in_place():
+    with StubArgoServer() as server:
+        deployed = server.add_workflow_template(_fresh_manifest(hello))
+        changed = copy.deepcopy(deployed)
+        changed["metadata"]["labels"]["team"] = "data"
+        server.failures["PUT"] = [409]
+
+        client = ArgoClient(server.url, options=ArgoOptions(namespace="argo"))
+        results = client.sync_templates([changed, greetings])
+        client.close()
+
+    assert isinstance(results[0], ArgoApiException)
+    assert results[0].status == 409
+    assert isinstance(results[1], TemplateSyncResult)
+    assert results[1].action == CREATED
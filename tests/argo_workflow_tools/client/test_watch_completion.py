@@ -0,0 +1,54 @@
+import time
+
+import pytest
+
+from argo_workflow_tools import ArgoClient, ArgoOptions, WorkflowStatus
+from argo_workflow_tools.exceptions.workflow_timeout_exception import (
+    WorkflowTimeoutException,
+)
+from tests.argo_workflow_tools.client.stub_argo_server import StubArgoServer
+
+PHASES = ["Pending", "Running", "Running", "Succeeded"]
+
+
+def test_watch_returns_when_workflow_completes():
+    with StubArgoServer(templates=["basic-template"], phases=PHASES) as server:
+        # slow polling would take minutes, the watch stream returns right away
+        client = ArgoClient(server.url, options=ArgoOptions(namespace="argo", polling_interval=60))
+        result = client.submit("basic-template", params={})
+        status = result.wait_for_completion(timeout=5, mode="watch")
+
+    assert status == WorkflowStatus.Succeeded
+    assert len(server.watch_resource_versions) == 1
+    assert not any(request.startswith("GET /api/v1/workflows/argo/") for request in server.requests[2:])
+
+
+def test_watch_reconnects_from_last_resource_version():
+    with StubArgoServer(templates=["basic-template"], phases=PHASES) as server:
+        server.watch_drop_after = [1]
+        client = ArgoClient(server.url, options=ArgoOptions(namespace="argo", polling_interval=0.01))
+        result = client.submit("basic-template", params={})
+        status = result.wait_for_completion(timeout=5, mode="watch")
+
+    assert status == WorkflowStatus.Succeeded
+    assert server.watch_resource_versions == ["1", "2"]
+
+
+def test_watch_times_out_while_events_keep_arriving():
+    with StubArgoServer(templates=["basic-template"], phases=["Running"] * 100 + ["Succeeded"]) as server:
+        server.watch_interval = 0.2
+        client = ArgoClient(server.url, options=ArgoOptions(namespace="argo", polling_interval=0.01))
+        result = client.submit("basic-template", params={})
+        started = time.monotonic()
+        with pytest.raises(WorkflowTimeoutException):
+            result.wait_for_completion(timeout=1, mode="watch")
+
+    assert time.monotonic() - started < 2
+
+
+def test_unknown_wait_mode():
+    with StubArgoServer(templates=["basic-template"]) as server:
+        client = ArgoClient(server.url, options=ArgoOptions(namespace="argo"))
+        result = client.submit("basic-template", params={})
+        with pytest.raises(ValueError):
+            result.wait_for_completion(mode="push")
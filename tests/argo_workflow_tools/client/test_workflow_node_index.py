@@ -0,0 +1,66 @@
+import pytest
+
+from argo_workflow_tools import ArgoClient, ArgoOptions, WorkflowStatus
+from argo_workflow_tools.workflow_node_index import WorkflowNodeIndex
+from tests.argo_workflow_tools.client.stub_argo_server import StubArgoServer
+
+
+def _nodes(workflow_name, count):
+    nodes = {
+        f"{workflow_name}-{i}": {
+            "id": f"{workflow_name}-{i}",
+            "displayName": f"task-{i}",
+            "templateName": "shared" if i % 2 else f"template-{i}",
+            "phase": "Failed" if i % 10 == 0 else "Succeeded",
+            "outputs": {"parameters": [{"name": "result", "value": str(i)}]},
+        }
+        for i in range(count)
+    }
+    # argo does not guarantee the root node comes first
+    nodes[workflow_name] = {
+        "id": workflow_name,
+        "displayName": workflow_name,
+        "templateName": "main",
+        "phase": "Succeeded",
+        "outputs": {"parameters": [{"name": "result", "value": "root"}]},
+    }
+    return nodes
+
+
+def test_find_resolves_id_display_name_and_template_name():
+    index = WorkflowNodeIndex("wf", _nodes("wf", 10).items())
+
+    assert len(index) == 11
+    assert index.root["id"] == "wf"
+    assert index.find("wf-3")["id"] == "wf-3"
+    assert index.find("task-4")["id"] == "wf-4"
+    assert index.find("template-6")["id"] == "wf-6"
+    assert index.find("missing") is None
+    with pytest.raises(ValueError):
+        index.find("shared")
+
+
+def test_iter_nodes_by_phase():
+    index = WorkflowNodeIndex("wf", _nodes("wf", 100).items())
+
+    assert len(list(index.iter_nodes())) == 101
+    assert {node["id"] for node in index.iter_nodes("Failed")} == {
+        f"wf-{i}" for i in range(0, 100, 10)
+    }
+    assert list(index.iter_nodes("Running")) == []
+
+
+def test_workflow_result_node_accessors():
+    with StubArgoServer(templates=["big"], phases=["Succeeded"]) as server:
+        client = ArgoClient(server.url, options=ArgoOptions(namespace="argo"))
+        result = client.submit("big", params={})
+        name = result.workflow_name
+        server.workflows[name]["status"]["nodes"] = _nodes(name, 20000)
+
+        assert result.node_outputs("task-1234") == {"result": "1234"}
+        assert result.node_outputs(f"{name}-42") == {"result": "42"}
+        assert result.outputs == {"result": "root"}
+        assert len(list(result.iter_nodes(WorkflowStatus.Failed))) == 2000
+        with pytest.raises(KeyError):
+            result.node_outputs("missing")
+        client.close()
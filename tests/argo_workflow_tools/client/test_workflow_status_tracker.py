@@ -0,0 +1,120 @@
+import time
+
+import pytest
+
+from argo_workflow_tools import ArgoClient, ArgoOptions, WorkflowStatus, WorkflowTimeoutException
+from argo_workflow_tools.argo_http_client import ArgoApiException
+from tests.argo_workflow_tools.client.stub_argo_server import StubArgoServer
+
+
+def test_tracker_uses_one_list_request_per_tick():
+    completed = []
+    with StubArgoServer(
+        templates=["basic-template"], phases=["Running", "Running", "Running", "Succeeded"]
+    ) as server:
+        client = ArgoClient(
+            server.url, options=ArgoOptions(namespace="argo", polling_interval=0.01)
+        )
+        results = [client.submit("basic-template", params={}) for _ in range(50)]
+        server.requests.clear()
+
+        tracker = client.status_tracker()
+        futures = tracker.track_all(results, callback=completed.append)
+        tracker.wait_for_completion(timeout=10)
+
+    list_requests = [r for r in server.requests if r.startswith("GET /api/v1/workflows/argo?")]
+    get_requests = [r for r in server.requests if r.startswith("GET /api/v1/workflows/argo/")]
+    assert len(list_requests) == 3
+    assert "submit-from-api%3Dtrue" in list_requests[0]
+    # a single full fetch per workflow once it completes
+    assert len(get_requests) == 50
+    assert [future.result() for future in futures] == [WorkflowStatus.Succeeded] * 50
+    assert all(result.status == WorkflowStatus.Succeeded for result in results)
+    assert len(completed) == 50
+
+
+def test_tracker_falls_back_to_status_request_for_unlabelled_workflows():
+    with StubArgoServer() as server:
+        client = ArgoClient(
+            server.url, options=ArgoOptions(namespace="argo", polling_interval=0.01)
+        )
+        result = client.create({"metadata": {"generateName": "hello-"}, "spec": {}})
+
+        tracker = client.status_tracker()
+        future = tracker.track(result)
+        tracker.wait_for_completion(timeout=10)
+
+    assert future.result() == WorkflowStatus.Succeeded
+
+
+def test_background_tracker_survives_transient_errors():
+    logged = []
+    with StubArgoServer(templates=["basic-template"]) as server:
+        client = ArgoClient(
+            server.url,
+            options=ArgoOptions(
+                namespace="argo", polling_interval=0.01, max_retries=0, logger=logged.append
+            ),
+        )
+        result = client.submit("basic-template", params={})
+        server.failures["GET"] = [503]
+
+        tracker = client.status_tracker().start()
+        future = tracker.track(result)
+        try:
+            assert future.result(timeout=10) == WorkflowStatus.Succeeded
+        finally:
+            tracker.stop()
+
+    assert any("retrying" in message for message in logged)
+
+
+def test_background_tracker_fails_futures_on_unrecoverable_errors():
+    with StubArgoServer(templates=["basic-template"]) as server:
+        client = ArgoClient(
+            server.url,
+            options=ArgoOptions(namespace="argo", polling_interval=0.01, logger=lambda _: None),
+        )
+        result = client.submit("basic-template", params={})
+        server.failures["GET"] = [403]
+
+        tracker = client.status_tracker().start()
+        future = tracker.track(result)
+        try:
+            with pytest.raises(ArgoApiException):
+                future.result(timeout=10)
+        finally:
+            tracker.stop()
+
+    assert tracker.pending == 0
+
+
+def test_wait_for_completion_waits_for_the_timeout_when_polling_is_slower():
+    with StubArgoServer(templates=["basic-template"], phases=["Running"] * 10) as server:
+        client = ArgoClient(server.url, options=ArgoOptions(namespace="argo", polling_interval=10))
+        tracker = client.status_tracker()
+        tracker.track(client.submit("basic-template", params={}))
+
+        started = time.monotonic()
+        with pytest.raises(WorkflowTimeoutException):
+            tracker.wait_for_completion(timeout=0.5)
+        waited = time.monotonic() - started
+
+    assert 0.5 <= waited < 5
+
+
+def test_workflow_completed_by_two_syncs_is_completed_once():
+    completed = []
+    with StubArgoServer(templates=["basic-template"]) as server:
+        client = ArgoClient(server.url, options=ArgoOptions(namespace="argo"))
+        tracker = client.status_tracker()
+        future = tracker.track(client.submit("basic-template", params={}), callback=completed.append)
+        # what a background sync and wait_for_completion racing on the same workflow both do
+        (tracked,) = tracker._tracked.values()
+        tracked.result.workflow_status_checker.sync()
+        tracker._complete(tracked)
+        tracker._complete(tracked)
+
+    assert future.result() == WorkflowStatus.Succeeded
+    assert len(completed) == 1
+    assert tracker.pending == 0
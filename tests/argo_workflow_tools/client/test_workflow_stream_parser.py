@@ -0,0 +1,74 @@
+import io
+import json
+
+import pytest
+
+from argo_workflow_tools import ArgoClient, ArgoOptions, WorkflowStatus
+from tests.argo_workflow_tools.client.stub_argo_server import StubArgoServer
+
+workflow_stream_parser = pytest.importorskip(
+    "argo_workflow_tools.workflow_stream_parser"
+)
+pytest.importorskip("ijson")
+
+
+def _nodes(workflow_name, count):
+    nodes = {
+        f"{workflow_name}-{i}": {
+            "id": f"{workflow_name}-{i}",
+            "displayName": f"task-{i}",
+            "phase": "Failed" if i % 10 == 0 else "Succeeded",
+            "outputs": {"parameters": [{"name": "result", "value": str(i)}]},
+        }
+        for i in range(count)
+    }
+    # the root node is not necessarily the first one
+    nodes[workflow_name] = {
+        "id": workflow_name,
+        "displayName": workflow_name,
+        "phase": "Succeeded",
+        "outputs": {"parameters": [{"name": "result", "value": "root"}]},
+    }
+    return nodes
+
+
+def _document(phase="Succeeded", suspend=False, count=100):
+    workflow = {
+        "metadata": {"name": "wf"},
+        "spec": {"suspend": suspend},
+        "status": {"phase": phase, "nodes": _nodes("wf", count)},
+    }
+    return io.BytesIO(json.dumps(workflow).encode())
+
+
+def test_iter_nodes_with_ids_and_predicate():
+    failed = list(
+        workflow_stream_parser.iter_nodes(
+            _document(), predicate=lambda node: node["phase"] == "Failed"
+        )
+    )
+    assert [node_id for node_id, _ in failed] == [f"wf-{i}" for i in range(0, 100, 10)]
+
+    selected = dict(workflow_stream_parser.iter_nodes(_document(), node_ids=["wf-3", "wf-7"]))
+    assert selected["wf-7"]["displayName"] == "task-7"
+    assert set(selected) == {"wf-3", "wf-7"}
+
+
+def test_iter_nodes_stops_after_nodes_are_found():
+    stream = _document(count=5000)
+    (node_id, node), = workflow_stream_parser.iter_nodes(stream, node_ids=["wf-1"])
+    assert node["outputs"]["parameters"][0]["value"] == "1"
+    assert stream.tell() < len(stream.getvalue())
+
+
+def test_outputs_are_read_from_root_node_stream():
+    with StubArgoServer(templates=["output-test"], phases=["Succeeded"]) as server:
+        client = ArgoClient(server.url, options=ArgoOptions(namespace="argo"))
+        result = client.submit("output-test", params={})
+        server.workflows[result.workflow_name]["status"]["nodes"] = _nodes(
+            result.workflow_name, 1000
+        )
+
+        assert result.status == WorkflowStatus.Succeeded
+        assert result.outputs == {"result": "root"}
+        assert result.workflow_status_checker._workflow_data is None
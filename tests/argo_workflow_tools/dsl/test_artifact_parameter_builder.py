@@ -0,0 +1,86 @@
+import json
+import os
+
+import pytest
+
+from argo_workflow_tools import dsl, Workflow
+from argo_workflow_tools.dsl.parameter_builders import ArtifactParameterBuilder
+from argo_workflow_tools.dsl.parameter_builders.artifact_store import (
+    POINTER_KEY,
+    read_parameter,
+    store_from_url,
+    write_parameter,
+)
+
+THRESHOLD = 64
+
+
+@pytest.fixture
+def store_url(tmp_path):
+    return f"file://{tmp_path / 'store'}"
+
+
+def _workflow(store_url, file_prefix):
+    builder = ArtifactParameterBuilder(store_url, threshold=THRESHOLD, file_prefix=file_prefix)
+
+    @dsl.Task(image="python:3.10", outputs={"result": builder})
+    def produce(count: int):
+        return [{"row": i} for i in range(count)]
+
+    @dsl.Task(image="python:3.10", inputs={"rows": builder})
+    def consume(rows):
+        return len(rows)
+
+    @dsl.DAG()
+    def pipeline(count):
+        return consume(produce(count))
+
+    return Workflow(name="large-values", entrypoint=pipeline, arguments={"count": 1}).to_model()
+
+
+def _scripts(model):
+    return {
+        template.name.rsplit("-", 1)[0]: template.script.source
+        for template in model.spec.templates
+        if template.script
+    }
+
+
+def _run(script, parameters):
+    for name, value in {**parameters, "workflow.name": "wf", "pod.name": "pod"}.items():
+        script = script.replace(f"{{{{{name}}}}}", value)
+    namespace = {}
+    exec(script, namespace)
+    return namespace["result"]
+
+
+@pytest.mark.parametrize("count,uploaded", [(1, False), (100, True)])
+def test_large_outputs_go_through_the_store(tmp_path, store_url, count, uploaded):
+    scripts = _scripts(_workflow(store_url, str(tmp_path)))
+
+    _run(scripts["produce"], {"inputs.parameters.count": str(count)})
+    parameter = (tmp_path / "result.json").read_text()
+
+    assert (POINTER_KEY in json.loads(parameter)) is uploaded
+    assert "{{inputs.parameters.rows}}" in scripts["consume"]
+    assert _run(scripts["consume"], {"inputs.parameters.rows": parameter}) == count
+
+
+def test_write_and_read_parameter(tmp_path, store_url):
+    output_path = str(tmp_path / "value.json")
+    value = {"values": list(range(100))}
+
+    write_parameter(value, output_path, store_url, "parameters/wf/pod/value.json", THRESHOLD)
+
+    with open(output_path) as output_file:
+        pointer = json.load(output_file)
+    assert pointer == {POINTER_KEY: "parameters/wf/pod/value.json", "store": store_url}
+    assert os.path.exists(tmp_path / "store" / "parameters" / "wf" / "pod" / "value.json")
+    assert not os.path.exists(f"{output_path}.payload")
+    assert read_parameter(json.dumps(pointer)) == value
+    assert read_parameter("plain string") == "plain string"
+
+
+def test_unknown_store_is_rejected():
+    with pytest.raises(ValueError, match="unsupported artifact store"):
+        store_from_url("gs://bucket/prefix")
@@ -0,0 +1,143 @@
+import json
+
+import pytest
+from pydantic import BaseModel
+
+from argo_workflow_tools import dsl, Workflow
+from argo_workflow_tools.dsl.parameter_builders import (
+    ArrowParameterBuilder,
+    CodecParameterBuilder,
+    PickleParameterBuilder,
+)
+from argo_workflow_tools.dsl.parameter_builders.artifact_store import POINTER_KEY
+from argo_workflow_tools.dsl.parameter_builders.binary_codecs import (
+    decode_parameter,
+    encode_parameter,
+)
+
+
+class Features(BaseModel):
+    name: str
+    values: list
+
+
+def _workflow(builder):
+    @dsl.Task(image="python:3.10", outputs={"result": builder})
+    def produce(count: int):
+        return {"rows": list(range(count)), "blob": bytes(count)}
+
+    @dsl.Task(image="python:3.10", inputs={"value": builder})
+    def consume(value):
+        return len(value["rows"]) + len(value["blob"])
+
+    @dsl.DAG()
+    def pipeline(count):
+        return consume(produce(count))
+
+    return Workflow(name="binary-values", entrypoint=pipeline, arguments={"count": 1}).to_model()
+
+
+def _scripts(model):
+    return {
+        template.name.rsplit("-", 1)[0]: template
+        for template in model.spec.templates
+        if template.script
+    }
+
+
+def _run(script, parameters):
+    for name, value in {**parameters, "workflow.name": "wf", "pod.name": "pod"}.items():
+        script = script.replace(f"{{{{{name}}}}}", value)
+    namespace = {}
+    exec(script, namespace)
+    return namespace["result"]
+
+
+@pytest.mark.parametrize("compression", [None, "gzip", "lzma"])
+def test_values_pass_between_tasks(tmp_path, compression):
+    builder = PickleParameterBuilder(compression=compression, file_prefix=str(tmp_path))
+    templates = _scripts(_workflow(builder))
+
+    assert templates["produce"].outputs.parameters[0].value_from.path == f"{tmp_path}/result.pkl"
+    assert "json.loads" not in templates["consume"].script.source
+
+    _run(templates["produce"].script.source, {"inputs.parameters.count": "50"})
+    parameter = (tmp_path / "result.pkl").read_text()
+    assert _run(templates["consume"].script.source, {"inputs.parameters.value": parameter}) == 100
+
+
+def test_large_payloads_go_through_the_store(tmp_path):
+    store_url = f"file://{tmp_path / 'store'}"
+    output_path = str(tmp_path / "result.pkl")
+    value = list(range(1000))
+
+    encode_parameter(value, output_path, "pickle", "gzip", store_url, "wf/pod/result.pkl", 64)
+
+    with open(output_path) as output_file:
+        parameter = output_file.read()
+    assert json.loads(parameter)[POINTER_KEY] == "wf/pod/result.pkl"
+    assert decode_parameter(parameter, "pickle", "gzip") == value
+
+
+def test_models_are_parsed(tmp_path):
+    output_path = str(tmp_path / "result.pkl")
+    encode_parameter({"name": "x", "values": [1, 2]}, output_path, "pickle")
+
+    with open(output_path) as output_file:
+        value = decode_parameter(output_file.read(), "pickle", model=Features)
+    assert value == Features(name="x", values=[1, 2])
+
+
+def test_pickle_keeps_buffers_out_of_band(tmp_path):
+    numpy = pytest.importorskip("numpy")
+    output_path = str(tmp_path / "result.pkl")
+    array = numpy.arange(10000, dtype=numpy.float64)
+
+    encode_parameter(array, output_path, "pickle")
+
+    with open(output_path) as output_file:
+        decoded = decode_parameter(output_file.read(), "pickle")
+    assert decoded.flags.writeable
+    numpy.testing.assert_array_equal(decoded, array)
+
+
+@pytest.mark.parametrize(
+    "codec,module,value",
+    [
+        ("msgpack", "msgpack", {"values": [1.5, 2.5], "blob": b"\x00\x01"}),
+        ("npy", "numpy", None),
+    ],
+)
+def test_optional_codecs_round_trip(tmp_path, codec, module, value):
+    pytest.importorskip(module)
+    if codec == "npy":
+        import numpy
+
+        value = numpy.eye(3)
+    output_path = str(tmp_path / "result")
+    encode_parameter(value, output_path, codec, "gzip")
+
+    with open(output_path) as output_file:
+        decoded = decode_parameter(output_file.read(), codec, "gzip")
+    assert (decoded == value).all() if codec == "npy" else decoded == value
+
+
+@pytest.mark.parametrize("file_format", ["arrow", "parquet"])
+def test_tables_round_trip(tmp_path, file_format):
+    pyarrow = pytest.importorskip("pyarrow")
+    table = pyarrow.table({"id": [1, 2, 3], "score": [0.5, 0.25, 0.125]})
+    output_path = str(tmp_path / "result")
+
+    encode_parameter(table, output_path, file_format)
+
+    with open(output_path) as output_file:
+        assert decode_parameter(output_file.read(), file_format).equals(table)
+
+
+def test_unknown_codecs_fail_at_compile_time():
+    with pytest.raises(ValueError, match="unsupported codec"):
+        CodecParameterBuilder("protobuf")
+    with pytest.raises(ValueError, match="unsupported compression"):
+        CodecParameterBuilder("pickle", compression="snappy")
+    with pytest.raises(ValueError, match="unsupported table format"):
+        ArrowParameterBuilder(file_format="csv")
@@ -0,0 +1,185 @@
+import gc
+import inspect
+
+from argo_workflow_tools import dsl, Workflow, WorkflowTemplate
+from argo_workflow_tools.dsl import compilation_cache
+
+
+@dsl.Task(image="python:3.10")
+def say_hello(name: str):
+    message = f"hello {name}"
+    return message
+
+
+@dsl.Task(image="python:3.10")
+def say_goodbye(name: str):
+    return f"goodbye {name}"
+
+
+@dsl.DAG()
+def inner_dag(name):
+    return say_goodbye(say_hello(name))
+
+
+@dsl.DAG()
+def outer_dag(name):
+    say_hello(name)
+    return inner_dag(name, exit=lambda: say_goodbye(name))
+
+
+@dsl.DAG()
+def other_dag(name):
+    return inner_dag(name)
+
+
+def _template_names(model):
+    return [template.name for template in model.spec.templates]
+
+
+def test_repeated_compilation_reuses_templates(monkeypatch):
+    compilation_cache.clear()
+    workflow = WorkflowTemplate(name="hello", entrypoint=outer_dag, arguments={"name": "x"})
+    first = workflow.to_model()
+
+    getsource_calls = []
+    original_getsource = inspect.getsource
+    monkeypatch.setattr(
+        inspect, "getsource", lambda obj: getsource_calls.append(obj) or original_getsource(obj)
+    )
+    second = workflow.to_model()
+
+    assert getsource_calls == []
+    assert second.dict() == first.dict()
+
+
+def test_cached_nested_dag_registers_its_children():
+    compilation_cache.clear()
+    WorkflowTemplate(name="hello", entrypoint=outer_dag, arguments={"name": "x"}).to_model()
+
+    cached = Workflow(name="other", entrypoint=other_dag, arguments={"name": "x"}).to_model()
+    with compilation_cache.disabled():
+        uncached = Workflow(name="other", entrypoint=other_dag, arguments={"name": "x"}).to_model()
+
+    assert _template_names(cached) == _template_names(uncached)
+    assert len(cached.spec.templates) == 4
+
+
+def test_disabled_cache_rebuilds_templates():
+    compilation_cache.clear()
+    workflow = WorkflowTemplate(name="hello", entrypoint=outer_dag, arguments={"name": "x"})
+    first = workflow.to_model()
+    with compilation_cache.disabled():
+        second = workflow.to_model()
+
+    assert _template_names(second) == _template_names(first)
+    assert second.spec.templates[-1].dag.tasks[0].name != first.spec.templates[-1].dag.tasks[0].name
+
+
+expansions = []
+
+
+@dsl.DAG()
+def level_1(name):
+    expansions.append("level_1")
+    say_hello(name)
+    return say_hello(name)
+
+
+@dsl.DAG()
+def level_2(name):
+    expansions.append("level_2")
+    level_1(name)
+    return level_1(name)
+
+
+@dsl.DAG()
+def level_3(name):
+    expansions.append("level_3")
+    for _ in range(3):
+        level_2(name)
+    return level_2(name)
+
+
+@dsl.DAG()
+def shares_inner_dag(name):
+    inner_dag(name)
+    return other_dag(name)
+
+
+def test_reused_dags_are_expanded_once_per_compilation():
+    expansions.clear()
+    with compilation_cache.disabled():
+        Workflow(name="nested", entrypoint=level_3, arguments={"name": "x"}).to_model()
+
+    assert sorted(expansions) == ["level_1", "level_2", "level_3"]
+
+
+def test_dag_reused_within_a_compilation_is_cached_with_its_children():
+    compilation_cache.clear()
+    Workflow(name="shared", entrypoint=shares_inner_dag, arguments={"name": "x"}).to_model()
+
+    cached = Workflow(name="other", entrypoint=other_dag, arguments={"name": "x"}).to_model()
+    with compilation_cache.disabled():
+        uncached = Workflow(name="other", entrypoint=other_dag, arguments={"name": "x"}).to_model()
+
+    assert _template_names(cached) == _template_names(uncached)
+
+
+def test_entries_are_dropped_with_their_nodes():
+    compilation_cache.clear()
+
+    @dsl.Task(image="python:3.10")
+    def transient_task(name: str):
+        return name
+
+    @dsl.DAG()
+    def transient_dag(name):
+        return transient_task(name)
+
+    Workflow(name="transient", entrypoint=transient_dag, arguments={"name": "x"}).to_model()
+    assert len(compilation_cache._entries) == 2
+
+    del transient_task, transient_dag
+    gc.collect()
+
+    assert len(compilation_cache._entries) == 0
+
+
+REPEATS = 1
+
+
+@dsl.Task(image="python:3.10")
+def increment(x: int) -> int:
+    return x + 1
+
+
+@dsl.DAG()
+def repeated_increment(x):
+    for _ in range(REPEATS):
+        x = increment(x)
+    return x
+
+
+def _dag_tasks(model):
+    return next(template.dag.tasks for template in model.spec.templates if template.dag)
+
+
+def test_dags_reading_module_constants_are_rebuilt_when_they_change(monkeypatch):
+    compilation_cache.clear()
+    workflow = Workflow(name="increment", entrypoint=repeated_increment, arguments={"x": 1})
+    assert len(_dag_tasks(workflow.to_model())) == 1
+
+    monkeypatch.setitem(globals(), "REPEATS", 3)
+
+    assert len(_dag_tasks(workflow.to_model())) == 3
+
+
+def test_tasks_are_rebuilt_when_their_properties_change(monkeypatch):
+    compilation_cache.clear()
+    workflow = Workflow(name="increment", entrypoint=repeated_increment, arguments={"x": 1})
+    workflow.to_model()
+
+    monkeypatch.setattr(increment.properties, "image", "python:3.11")
+
+    images = [template.script.image for template in workflow.to_model().spec.templates if template.script]
+    assert images == ["python:3.11"]
@@ -0,0 +1,69 @@
+import json
+
+from argo_workflow_tools import dsl, WorkflowTemplate
+from argo_workflow_tools.dsl import CompilationProfiler, compilation_cache, compilation_profiler
+
+
+@dsl.Task(image="python:3.10")
+def say_hello(name: str):
+    message = f"hello {name}"
+    return message
+
+
+@dsl.DAG()
+def hello_twice(name):
+    say_hello(name)
+    return say_hello(name)
+
+
+@dsl.DAG()
+def profiled_dag(name):
+    hello_twice(name)
+    return hello_twice(name)
+
+
+def _workflow():
+    return WorkflowTemplate(name="profiled", entrypoint=profiled_dag, arguments={"name": "x"})
+
+
+def test_profiler_records_builds_cache_and_scripts():
+    compilation_cache.clear()
+    with CompilationProfiler() as profiler:
+        _workflow().to_model()
+        _workflow().to_model()
+
+    summary = profiler.summary()
+    assert summary["counts"][compilation_profiler.COMPILE] == 2
+    assert summary["counts"][compilation_profiler.CACHE_MISS] == 3
+    assert summary["counts"][compilation_profiler.CACHE_HIT] == 1
+    assert summary["counts"][compilation_profiler.MEMO_HIT] == 2
+    # sources are read once per function, the hook sources may have been read by earlier tests
+    source_reads = [
+        event.name for event in profiler.events if event.category == compilation_profiler.GETSOURCE
+    ]
+    assert len([name for name in source_reads if name.startswith("say-hello-")]) == 1
+    task_templates = [name for name in summary["templates"] if name.startswith("say-hello-")]
+    assert len(task_templates) == 1
+    assert summary["templates"][task_templates[0]]["script_size"] > 0
+    assert summary["templates"][task_templates[0]]["wall_time"] > 0
+
+
+def test_profiler_writes_chrome_trace(tmp_path):
+    events = []
+    with CompilationProfiler(callback=events.append) as profiler:
+        _workflow().to_model()
+
+    trace_path = tmp_path / "compile.trace.json"
+    profiler.write_trace(str(trace_path))
+    trace = json.loads(trace_path.read_text())
+
+    assert len(trace["traceEvents"]) == len(events) == len(profiler.events)
+    assert {event["ph"] for event in trace["traceEvents"]} == {"X", "i"}
+
+
+def test_no_events_outside_profiler():
+    with CompilationProfiler() as profiler:
+        pass
+    _workflow().to_model()
+
+    assert profiler.events == []
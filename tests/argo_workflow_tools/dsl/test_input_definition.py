@@ -0,0 +1,74 @@
+import contextvars
+import dataclasses
+
+import pytest
+
+from argo_workflow_tools import dsl
+from argo_workflow_tools.dsl import building_mode_context, workflow_template_collector
+from argo_workflow_tools.dsl.dag_task import TaskReference
+from argo_workflow_tools.dsl.input_definition import InputDefinition, SourceType
+
+
+@dsl.Task(image="python:3.10")
+def produce(value: str):
+    return {"a": {"b": value}}
+
+
+def _output():
+    return InputDefinition(SourceType.NODE_OUTPUT, name="result", source_node_id="produce-1")
+
+
+def test_repeated_lookups_share_inputs():
+    output = _output()
+
+    assert output["a"]["b"] is output["a"]["b"]
+    assert output.a.b is output.a.b
+    assert output["a"] is not output.a
+    assert list(output)[0] is list(output)[0]
+    assert output.a.b.key_path == "a.b"
+
+
+def test_unhashable_keys_build_new_inputs():
+    output = _output()
+
+    child = output[["a", "b"]]
+
+    assert child.key_name == ["a", "b"]
+    assert output[["a", "b"]] is not child
+
+
+def test_inputs_are_immutable():
+    output = _output()
+
+    with pytest.raises(AttributeError):
+        output.name = "other"
+
+
+def test_references_are_frozen_and_read_the_node():
+    def call_in_building_mode():
+        building_mode_context.dag_building_mode.set(True)
+        produce("x")
+        return workflow_template_collector.dag_tasks.get()[-1]
+
+    reference = contextvars.copy_context().run(call_in_building_mode)
+
+    assert isinstance(reference, TaskReference)
+    assert reference.func is produce.func
+    assert reference.properties is produce.properties
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        reference.name = "other"
+
+
+def test_paths_are_resolved_once(monkeypatch):
+    leaf = _output().a["b"].c
+    assert leaf.key_path == "a.b.c"
+    path = leaf.path()
+    const_path = leaf.path(as_const=True)
+
+    monkeypatch.setattr(InputDefinition, "_resolve_key_path", None)
+    monkeypatch.setattr(InputDefinition, "_resolve_path", None)
+
+    assert leaf.path() is path
+    assert leaf.path(as_const=True) is const_path
+    assert path == "{{= toJson(jsonpath(tasks['produce-1'].outputs.parameters['result'], '$.a.b.c')) }}"
+    assert const_path == "{{= jsonpath(tasks['produce-1'].outputs.parameters['result'], '$.a.b.c') }}"
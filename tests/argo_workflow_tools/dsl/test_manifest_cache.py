@@ -0,0 +1,155 @@
+import importlib
+import os
+import sys
+import textwrap
+
+import pytest
+import yaml
+
+from argo_workflow_tools import WorkflowTemplate
+from argo_workflow_tools.dsl import ManifestCache, compilation_cache
+from argo_workflow_tools.dsl.utils.utils import generate_template_name_from_func
+
+MODULE = "manifest_cache_workflows"
+
+SOURCE = textwrap.dedent(
+    """
+    from argo_workflow_tools import dsl
+
+    PREFIX = "hello"
+
+
+    @dsl.Task(image="python:3.10")
+    def say_hello(name: str):
+        return f"{PREFIX} {name}"
+
+
+    @dsl.Task(image="python:3.10")
+    def say_goodbye(name: str):
+        return f"goodbye {name}"
+
+
+    @dsl.DAG()
+    def inner_dag(name):
+        return say_goodbye(name)
+
+
+    @dsl.WorkflowTemplate(name="referenced")
+    def referenced(name):
+        return say_goodbye(name)
+
+
+    @dsl.WorkflowTemplate(name="greeting")
+    def greeting(name):
+        say_hello(name)
+        referenced(name)
+        return inner_dag(name)
+    """
+)
+
+
+@pytest.fixture
+def workflows(tmp_path):
+    path = tmp_path / f"{MODULE}.py"
+    path.write_text(SOURCE)
+    sys.path.insert(0, str(tmp_path))
+    module = importlib.import_module(MODULE)
+
+    def edit(old, new):
+        stat = path.stat()
+        path.write_text(path.read_text().replace(old, new))
+        # the source is read back by mtime
+        os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+        importlib.invalidate_caches()
+        return importlib.reload(module)
+
+    yield module, edit
+    sys.path.remove(str(tmp_path))
+    sys.modules.pop(MODULE, None)
+    compilation_cache.clear()
+
+
+def _compile(module):
+    return WorkflowTemplate(
+        name="greeting", entrypoint=module.greeting, arguments={"name": "x"}
+    ).to_yaml()
+
+
+def _rebuild(module, cache_path):
+    with ManifestCache(str(cache_path)) as cache:
+        manifest = _compile(module)
+    return manifest, cache
+
+
+def _scripts(manifest):
+    # dag task ids are random, compare the templates and their scripts
+    templates = yaml.safe_load(manifest)["spec"]["templates"]
+    return {template["name"]: template.get("script") for template in templates}
+
+
+def _template_name(module, name):
+    return generate_template_name_from_func(getattr(module, name).func)
+
+
+def test_unchanged_templates_are_reused(workflows, tmp_path):
+    module, _ = workflows
+    cache_path = tmp_path / "cache.json"
+    first, cache = _rebuild(module, cache_path)
+    assert len(cache.rebuilt) == 4
+
+    second, cache = _rebuild(module, cache_path)
+    assert cache.rebuilt == []
+    assert cache.hits == 1
+    assert second == first
+
+
+def test_changed_task_rebuilds_its_parents_only(workflows, tmp_path):
+    module, edit = workflows
+    cache_path = tmp_path / "cache.json"
+    _rebuild(module, cache_path)
+
+    module = edit('return f"goodbye {name}"', 'return f"bye {name}"')
+    manifest, cache = _rebuild(module, cache_path)
+
+    assert sorted(cache.rebuilt) == sorted(
+        [_template_name(module, name) for name in ("say_goodbye", "inner_dag", "greeting")]
+    )
+    with compilation_cache.disabled():
+        assert _scripts(manifest) == _scripts(_compile(module))
+
+
+def test_changed_module_constant_rebuilds_its_readers(workflows, tmp_path):
+    module, edit = workflows
+    cache_path = tmp_path / "cache.json"
+    _rebuild(module, cache_path)
+
+    module = edit('PREFIX = "hello"', 'PREFIX = "hi"')
+    _, cache = _rebuild(module, cache_path)
+
+    assert sorted(cache.rebuilt) == sorted(
+        [_template_name(module, name) for name in ("say_hello", "greeting")]
+    )
+
+
+def test_changed_template_reference_rebuilds_the_referencing_dag(workflows, tmp_path):
+    module, edit = workflows
+    cache_path = tmp_path / "cache.json"
+    _rebuild(module, cache_path)
+
+    module = edit('name="referenced"', 'name="renamed"')
+    manifest, cache = _rebuild(module, cache_path)
+
+    assert cache.rebuilt == [_template_name(module, "greeting")]
+    assert "name: renamed" in manifest
+
+
+def test_unreadable_cache_file_is_ignored(workflows, tmp_path):
+    module, _ = workflows
+    cache_path = tmp_path / "cache.json"
+    cache_path.write_text("not json")
+
+    manifest, cache = _rebuild(module, cache_path)
+
+    assert len(cache.rebuilt) == 4
+    with compilation_cache.disabled():
+        assert _scripts(manifest) == _scripts(_compile(module))
@@ -0,0 +1,46 @@
+import inspect
+
+from argo_workflow_tools import dsl, Workflow
+from argo_workflow_tools.dsl import compilation_cache
+
+
+@dsl.Task(image="python:3.10")
+def add(x: int, y: int = 2) -> int:
+    return x + y
+
+
+@dsl.DAG()
+def add_many(x, **kwargs):
+    return add(add(x, y=1), y=3)
+
+
+def test_node_inspects_its_function_once():
+    assert list(add.signature.parameters) == ["x", "y"]
+    assert add.parameter_defaults == {"x": None, "y": 2}
+    assert add.return_annotation is int
+    assert add.source.startswith("def add(x: int, y: int = 2) -> int:")
+
+
+def test_compilation_does_not_inspect_functions(monkeypatch):
+    compilation_cache.clear()
+    add.source  # read once, before compiling
+
+    signature_calls, getsource_calls = [], []
+    original_signature, original_getsource = inspect.signature, inspect.getsource
+    monkeypatch.setattr(
+        inspect, "signature", lambda obj: signature_calls.append(obj) or original_signature(obj)
+    )
+    monkeypatch.setattr(
+        inspect, "getsource", lambda obj: getsource_calls.append(obj) or original_getsource(obj)
+    )
+    with compilation_cache.disabled():
+        model = Workflow(name="add", entrypoint=add_many, arguments={"x": 1}).to_model()
+
+    assert signature_calls == []
+    # the default hooks are read once per process, maybe by this compilation
+    assert {func.__name__ for func in getsource_calls} <= {
+        "_dummy_pre_func_hook",
+        "_dummy_post_func_hook",
+    }
+    script = next(template.script for template in model.spec.templates if template.script)
+    assert "result=add(x,y)" in script.source
@@ -0,0 +1,51 @@
+import json
+
+import yaml
+
+import argo_workflow_tools.models.io.k8s.api.core.v1 as k8s
+from argo_workflow_tools import dsl, CronWorkflow, Workflow, WorkflowTemplate
+from argo_workflow_tools.dsl.utils.utils import delete_none
+
+
+@dsl.Task(
+    image="python:3.10",
+    resources=k8s.ResourceRequirements(limits={"memory": "1Gi", "cpu": "1"}),
+    labels={"team": "ml"},
+)
+def say_hello(name: str):
+    message = f"hello {name}"
+    return message
+
+
+@dsl.DAG()
+def hello_dag(name):
+    return say_hello(name)
+
+
+WORKFLOWS = [
+    WorkflowTemplate(name="hello", entrypoint=hello_dag, arguments={"name": "x"}),
+    Workflow(name="hello", entrypoint=hello_dag, arguments={"name": "x"}),
+    CronWorkflow(name="hello", entrypoint=hello_dag, schedule="0 * * * *", arguments={"name": "x"}),
+]
+
+
+def test_to_dict_matches_model_dict_without_none():
+    for workflow in WORKFLOWS:
+        expected = delete_none(workflow.to_model().dict(by_alias=True))
+
+        assert workflow.to_dict() == expected
+
+
+def test_resource_quantities_are_serialized_as_values():
+    templates = WORKFLOWS[0].to_dict()["spec"]["templates"]
+    task_template = next(template for template in templates if "script" in template)
+
+    assert task_template["script"]["resources"] == {"limits": {"memory": "1Gi", "cpu": "1"}}
+
+
+def test_yaml_and_json_load_back_to_dict():
+    for workflow in WORKFLOWS:
+        expected = workflow.to_dict()
+
+        assert yaml.safe_load(workflow.to_yaml()) == expected
+        assert json.loads(workflow.to_json()) == expected
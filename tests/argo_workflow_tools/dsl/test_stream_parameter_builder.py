@@ -0,0 +1,141 @@
+import json
+from typing import Iterator
+
+import pytest
+from pydantic import BaseModel
+
+from argo_workflow_tools import dsl, Workflow
+from argo_workflow_tools.dsl.parameter_builders import StreamParameterBuilder
+from argo_workflow_tools.dsl.parameter_builders.artifact_store import POINTER_KEY
+from argo_workflow_tools.dsl.parameter_builders.record_stream import (
+    read_stream,
+    write_stream,
+)
+
+SHARD_SIZE = 10
+
+
+class Record(BaseModel):
+    id: int
+
+
+@pytest.fixture
+def store(tmp_path):
+    return tmp_path / "store"
+
+
+def _templates(model):
+    return {
+        template.name.rsplit("-", 1)[0]: template
+        for template in model.spec.templates
+    }
+
+
+def _run(script, parameters):
+    for name, value in {**parameters, "workflow.name": "wf", "pod.name": "pod"}.items():
+        script = script.replace(f"{{{{{name}}}}}", value)
+    namespace = {}
+    exec(script, namespace)
+    return namespace["result"]
+
+
+def test_iterator_results_are_written_item_by_item(tmp_path):
+    @dsl.Task(image="python:3.10")
+    def extract(count: int) -> Iterator[int]:
+        for index in range(count):
+            yield index
+
+    @dsl.Task(image="python:3.10")
+    def total(values: Iterator[int]):
+        return sum(values)
+
+    @dsl.DAG()
+    def pipeline(count):
+        return total(extract(count))
+
+    templates = _templates(
+        Workflow(name="iterators", entrypoint=pipeline, arguments={"count": 1}).to_model()
+    )
+    script = templates["extract"].script.source.replace("/tmp/result.json", str(tmp_path / "result.json"))
+
+    _run(script, {"inputs.parameters.count": "5"})
+    parameter = (tmp_path / "result.json").read_text()
+
+    assert json.loads(parameter) == [0, 1, 2, 3, 4]
+    assert "json.dumps(result)" not in script
+    assert _run(templates["total"].script.source, {"inputs.parameters.values": parameter}) == 10
+
+
+def test_streamed_outputs_are_sharded(tmp_path, store):
+    builder = StreamParameterBuilder(
+        f"file://{store}", shard_size=SHARD_SIZE, file_prefix=str(tmp_path)
+    )
+
+    @dsl.Task(image="python:3.10", outputs={"result": builder})
+    def extract(count: int) -> Iterator[dict]:
+        for index in range(count):
+            yield {"id": index}
+
+    @dsl.Task(image="python:3.10", inputs={"records": builder})
+    def tally(records):
+        return sum(1 for _ in records)
+
+    @dsl.DAG()
+    def pipeline(count):
+        [tally(shard) for shard in extract(count)]
+
+    templates = _templates(
+        Workflow(name="streams", entrypoint=pipeline, arguments={"count": 1}).to_model()
+    )
+    loop_task = templates["pipeline"].dag.tasks[1]
+    assert loop_task.with_param.startswith("{{tasks.extract")
+
+    _run(templates["extract"].script.source, {"inputs.parameters.count": "25"})
+    shards = json.loads((tmp_path / "result.json").read_text())
+
+    assert [shard["count"] for shard in shards] == [10, 10, 5]
+    assert (store / "streams" / "wf" / "pod" / "result" / "00002.jsonl").exists()
+    counts = [
+        _run(templates["tally"].script.source, {"inputs.parameters.records": json.dumps(shard)})
+        for shard in shards
+    ]
+    assert counts == [10, 10, 5]
+
+
+def test_shards_are_uploaded_while_items_are_produced(tmp_path, store):
+    uploaded = []
+
+    def items():
+        for index in range(3 * SHARD_SIZE):
+            uploaded.append(len(list(store.rglob("*.jsonl"))) if store.exists() else 0)
+            yield index
+
+    write_stream(items(), str(tmp_path / "result.json"), f"file://{store}", "key", SHARD_SIZE)
+
+    assert uploaded[SHARD_SIZE] == 1
+    assert uploaded[2 * SHARD_SIZE] == 2
+    assert not (tmp_path / "result.json.shard").exists()
+
+
+def test_read_stream_parses_compressed_records(tmp_path, store):
+    output_path = tmp_path / "result.json"
+    write_stream(
+        (Record(id=index) for index in range(15)),
+        str(output_path),
+        f"file://{store}",
+        "key",
+        SHARD_SIZE,
+        "gzip",
+    )
+    parameter = output_path.read_text()
+
+    assert all(POINTER_KEY in shard for shard in json.loads(parameter))
+    records = read_stream(parameter, Record)
+    assert next(records) == Record(id=0)
+    assert [record.id for record in records] == list(range(1, 15))
+    assert list(read_stream("[1, 2]")) == [1, 2]
+
+
+def test_unknown_compression_is_rejected(store):
+    with pytest.raises(ValueError, match="unsupported compression"):
+        StreamParameterBuilder(f"file://{store}", compression="snappy")
@@ -2,7 +2,7 @@ import pytest
 import yaml
 
 from argo_workflow_tools import dsl, Workflow
-from argo_workflow_tools.dsl import compile_workflow
+from argo_workflow_tools.dsl import compile_all, compile_workflow
 from argo_workflow_tools.models.io.argoproj.workflow.v1alpha1 import Artifact
 
 
@@ -59,3 +59,40 @@ def test_compiled_workflow_should_contain_task_hooks():
     assert 'running from pre hook' in say_hello_task_template.script.source
     assert 'message = f"hello {name}"' in say_hello_task_template.script.source
     assert 'running from post hook' in say_hello_task_template.script.source
+
+
+@dsl.WorkflowTemplate(name="goodbye-workflow", arguments={"name": "name"})
+def goodbye_workflow(name):
+    return say_hello(say_hello(name))
+
+
+def _structure(workflow_template: dict):
+    return workflow_template["metadata"]["name"], sorted(
+        template["name"] for template in workflow_template["spec"]["templates"]
+    )
+
+
+def test_compile_all_in_worker_processes_matches_serial_compilation():
+    templates = [simple_workflow, goodbye_workflow, simple_workflow_with_task_hooks]
+
+    parallel = compile_all(templates, workers=2, output="yaml")
+    serial = [compile_workflow(template).to_dict() for template in templates]
+
+    assert [_structure(yaml.safe_load(compiled)) for compiled in parallel] == [
+        _structure(compiled) for compiled in serial
+    ]
+
+
+def test_compile_all_compiles_unimportable_templates_locally():
+    @dsl.WorkflowTemplate(name="local-workflow", arguments={"name": "name"})
+    def local_workflow(name):
+        return say_hello(name)
+
+    models = compile_all([local_workflow, simple_workflow], workers=2)
+
+    assert [model.metadata.name for model in models] == ["local-workflow", "test-workflow"]
+
+
+def test_compile_all_rejects_unknown_output():
+    with pytest.raises(ValueError):
+        compile_all([simple_workflow], output="xml")
@@ -0,0 +1,55 @@
+import pytest
+
+from argo_workflow_tools import dsl, WorkflowTemplate
+from argo_workflow_tools.dsl import workflow_template_collector
+from argo_workflow_tools.models.io.argoproj.workflow.v1alpha1 import Template
+
+
+def _make_task(image):
+    @dsl.Task(image=image)
+    def make_greeting(name: str):
+        return f"hello {name}"
+
+    return make_greeting
+
+
+greeting_a = _make_task("python:3.9")
+greeting_b = _make_task("python:3.10")
+
+
+@dsl.DAG()
+def conflicting_dag(name):
+    greeting_a(name)
+    return greeting_b(name)
+
+
+def test_templates_are_collected_in_insertion_order_without_duplicates():
+    workflow_template_collector.clear()
+    origin = object()
+    for i in range(2000):
+        workflow_template_collector.add_template(Template(name=f"template-{i}"), origin)
+    workflow_template_collector.add_template(Template(name="template-0"), origin)
+
+    names = [template.name for template in workflow_template_collector.collect_templates()]
+    workflow_template_collector.clear()
+
+    assert names == [f"template-{i}" for i in range(2000)]
+
+
+def test_same_template_name_from_different_functions_raises():
+    workflow = WorkflowTemplate(name="conflict", entrypoint=conflicting_dag, arguments={"name": "x"})
+
+    with pytest.raises(ValueError, match="make-greeting-"):
+        workflow.to_model()
+
+
+def test_same_template_name_with_different_bodies_raises():
+    workflow_template_collector.clear()
+    origin = object()
+    workflow_template_collector.add_template(Template(name="greeting", parallelism=1), origin)
+
+    with pytest.raises(ValueError, match="greeting"):
+        workflow_template_collector.add_template(
+            Template(name="greeting", parallelism=2), origin
+        )
+    workflow_template_collector.clear()
@@ -0,0 +1,45 @@
+import pytest
+
+from argo_workflow_tools.dsl import compilation_cache
+from argo_workflow_tools.dsl.dag_compiler import compile_dag
+from benchmarks import compiler_benchmark, generators
+
+
+@pytest.mark.parametrize(
+    ("source", "templates"),
+    [
+        (generators.wide_fan_out(20), 21),
+        (generators.deep_nesting(5), 7),
+        (generators.many_tasks(250), 254),
+        (generators.conditions(10), 11),
+        (generators.workflow_template_refs(10), 1),
+        (generators.shared_library(3, 5), 9),
+    ],
+)
+def test_generated_programs_compile(source, templates):
+    program = generators.load(source)
+    with compilation_cache.disabled():
+        assert len(compile_dag(program.main).templates) == templates
+
+
+def test_run_reports_every_stage(tmp_path):
+    results = compiler_benchmark.run(["deep_nesting"], scale=0.1, repeat=1)
+    metrics = results["scenarios"]["deep_nesting"]
+
+    assert {"compile_dag", "to_model", "to_dict", "to_yaml", "peak_memory_bytes"} <= set(metrics)
+    assert metrics["peak_memory_bytes"] > 0
+
+    baseline_path = str(tmp_path / "baseline.json")
+    compiler_benchmark.save(results, baseline_path)
+    assert compiler_benchmark.load(baseline_path) == results
+
+
+def test_regressions_are_reported_above_threshold():
+    baseline = {"scenarios": {"wide": {"compile_dag": 1.0, "to_yaml": 1.0}}}
+    results = {"scenarios": {"wide": {"compile_dag": 1.5, "to_yaml": 1.1, "new": 1.0}}}
+
+    comparisons = compiler_benchmark.compare(results, baseline)
+    regressions = compiler_benchmark.regressions(comparisons, threshold=0.2)
+
+    assert [comparison.metric for comparison in comparisons] == ["compile_dag", "to_yaml"]
+    assert [regression.metric for regression in regressions] == ["compile_dag"]